@@ -4,6 +4,7 @@ from typing import Any, Optional
 from fastapi import APIRouter, HTTPException, Query
 
 from app.services.comparison_service import comparison_service
+from app.utils.admission import ServiceOverloaded
 
 router = APIRouter()
 
@@ -22,6 +23,8 @@ async def compare_drivers_season(
         return comparison
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -42,6 +45,8 @@ async def compare_drivers_race(
             driver1, driver2, year, race
         )
         return comparison
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
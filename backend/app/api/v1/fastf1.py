@@ -1,22 +1,45 @@
 """FastF1 API endpoints for detailed race analysis"""
 
-from typing import Any, Optional
+import functools
+from typing import Any, Awaitable, Callable, Dict, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 
+from app.core.config import settings
 from app.services.fastf1_service import fastf1_service
+from app.services.ttl_policy import resolve_race_tags, round_ttl
+from app.utils.admission import ServiceOverloaded
+from app.utils.response_cache import cached_response
 
 router = APIRouter()
 
 
+def _session_response(
+    request: Request,
+    year: int,
+    race: int | str,
+    session_type: str,
+    build: Callable[[], Awaitable[Dict[str, Any]]],
+) -> Awaitable[Response]:
+    """Serve a session endpoint's body from the response cache, with the session's TTL and tags"""
+    return cached_response(
+        request,
+        build,
+        ttl=functools.partial(round_ttl, year, race, settings.FASTF1_CACHE_TTL, session_type),
+        tags=functools.partial(resolve_race_tags, year, race),
+    )
+
+
 @router.get("/race/{year}/{race}/laps")
 async def get_lap_times(
+    request: Request,
     year: int,
     race: int | str,
     session_type: str = Query("R", description="Session type: FP1, FP2, FP3, Q, S, R"),
 ) -> Any:
     """Get all lap times for a session"""
-    try:
+
+    async def build() -> Dict[str, Any]:
         laps = await fastf1_service.get_lap_times(year, race, session_type)
         return {
             "year": year,
@@ -25,19 +48,26 @@ async def get_lap_times(
             "laps": laps,
             "total_laps": len(laps),
         }
+
+    try:
+        return await _session_response(request, year, race, session_type, build)
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch lap times: {str(e)}")
 
 
 @router.get("/race/{year}/{race}/driver/{driver}/laps")
 async def get_driver_laps(
+    request: Request,
     year: int,
     race: int | str,
     driver: str,
     session_type: str = Query("R", description="Session type: FP1, FP2, FP3, Q, S, R"),
 ) -> Any:
     """Get lap times for a specific driver"""
-    try:
+
+    async def build() -> Dict[str, Any]:
         laps = await fastf1_service.get_driver_laps(year, race, driver, session_type)
         return {
             "year": year,
@@ -47,48 +77,92 @@ async def get_driver_laps(
             "laps": laps,
             "total_laps": len(laps),
         }
+
+    try:
+        return await _session_response(request, year, race, session_type, build)
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch driver laps: {str(e)}")
 
 
 @router.get("/race/{year}/{race}/telemetry")
 async def get_telemetry(
+    request: Request,
     year: int,
     race: int | str,
     driver: str = Query(..., description="Driver code (e.g., VER, HAM)"),
     lap: int = Query(..., description="Lap number"),
     session_type: str = Query("R", description="Session type: FP1, FP2, FP3, Q, S, R"),
+    response_format: str = Query(
+        "rows",
+        alias="format",
+        pattern="^(rows|columnar)$",
+        description="rows: list of per-sample objects; columnar: one array per channel",
+    ),
+    sampling: str = Query(
+        "stride",
+        pattern="^(stride|distance|lttb)$",
+        description="stride: every n-th sample; distance: uniform distance grid; "
+        "lttb: shape-preserving (Largest-Triangle-Three-Buckets)",
+    ),
+    resolution: Optional[int] = Query(
+        None, ge=10, le=10000, description="Approximate number of samples to return"
+    ),
 ) -> Any:
     """Get telemetry data for a specific lap"""
+
+    async def build() -> Dict[str, Any]:
+        return await fastf1_service.get_telemetry(
+            year,
+            race,
+            driver,
+            lap,
+            session_type,
+            columnar=response_format == "columnar",
+            sampling=sampling,
+            resolution=resolution,
+        )
+
     try:
-        telemetry = await fastf1_service.get_telemetry(year, race, driver, lap, session_type)
-        return telemetry
+        return await _session_response(request, year, race, session_type, build)
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch telemetry: {str(e)}")
 
 
 @router.get("/race/{year}/{race}/stints")
 async def get_stint_data(
+    request: Request,
     year: int,
     race: int | str,
     session_type: str = Query("R", description="Session type: FP1, FP2, FP3, Q, S, R"),
 ) -> Any:
     """Get tire stint data for all drivers"""
-    try:
+
+    async def build() -> Dict[str, Any]:
         stints = await fastf1_service.get_stint_data(year, race, session_type)
         return {"year": year, "race": race, "session_type": session_type, "stints": stints}
+
+    try:
+        return await _session_response(request, year, race, session_type, build)
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch stint data: {str(e)}")
 
 
 @router.get("/race/{year}/{race}/fastest-lap")
 async def get_fastest_lap(
+    request: Request,
     year: int,
     race: int | str,
     session_type: str = Query("R", description="Session type: FP1, FP2, FP3, Q, S, R"),
 ) -> Any:
     """Get fastest lap of the session"""
-    try:
+
+    async def build() -> Dict[str, Any]:
         fastest_lap = await fastf1_service.get_fastest_lap(year, race, session_type)
         if fastest_lap is None:
             return {"message": "No valid lap times found", "fastest_lap": None}
@@ -98,18 +172,25 @@ async def get_fastest_lap(
             "session_type": session_type,
             "fastest_lap": fastest_lap,
         }
+
+    try:
+        return await _session_response(request, year, race, session_type, build)
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch fastest lap: {str(e)}")
 
 
 @router.get("/race/{year}/{race}/track-map")
 async def get_track_map(
+    request: Request,
     year: int,
     race: int | str,
     session_type: str = Query("R", description="Session type: FP1, FP2, FP3, Q, S, R"),
 ) -> Any:
     """Get normalized track outline coordinates (0-1000 space) for SVG visualization"""
-    try:
+
+    async def build() -> Dict[str, Any]:
         track_data = await fastf1_service.get_track_map(year, race, session_type)
         return {
             "year": year,
@@ -117,18 +198,29 @@ async def get_track_map(
             "session_type": session_type,
             **track_data,
         }
+
+    try:
+        return await _session_response(request, year, race, session_type, build)
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch track map: {str(e)}")
 
 
 @router.get("/race/{year}/{race}/lap-positions")
 async def get_lap_positions(
+    request: Request,
     year: int,
     race: int | str,
 ) -> Any:
     """Get all driver (x,y) positions per lap for race replay animation"""
+
+    async def build() -> Dict[str, Any]:
+        return await fastf1_service.get_lap_positions(year, race)
+
     try:
-        data = await fastf1_service.get_lap_positions(year, race)
-        return data
+        return await _session_response(request, year, race, "R", build)
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch lap positions: {str(e)}")
@@ -3,6 +3,7 @@
 from typing import Any, List, Optional
 
 from app.services.jolpica_service import jolpica_service
+from app.utils.admission import ServiceOverloaded
 from fastapi import APIRouter, HTTPException, Query
 
 router = APIRouter()
@@ -17,6 +18,8 @@ async def get_schedule(
         schedule = await jolpica_service.get_schedule(season)
         display_season = season or await jolpica_service.get_current_season()
         return {"season": display_season, "races": schedule}
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch schedule: {str(e)}")
 
@@ -27,6 +30,8 @@ async def get_current_schedule() -> Any:
     try:
         schedule = await jolpica_service.get_schedule()
         return {"season": await jolpica_service.get_current_season(), "races": schedule}
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch schedule: {str(e)}")
 
@@ -39,6 +44,8 @@ async def get_next_race() -> Any:
         if next_race is None:
             return {"message": "No upcoming races found", "race": None}
         return {"race": next_race}
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch next race: {str(e)}")
 
@@ -49,6 +56,8 @@ async def get_season_schedule(season: int) -> Any:
     try:
         schedule = await jolpica_service.get_schedule(season)
         return {"season": season, "races": schedule}
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to fetch schedule for {season}: {str(e)}"
@@ -64,6 +73,8 @@ async def get_driver_standings(
         standings = await jolpica_service.get_driver_standings(season)
         display_season = season or await jolpica_service.get_current_season()
         return {"season": display_season, "standings": standings}
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch driver standings: {str(e)}")
 
@@ -77,6 +88,8 @@ async def get_constructor_standings(
         standings = await jolpica_service.get_constructor_standings(season)
         display_season = season or await jolpica_service.get_current_season()
         return {"season": display_season, "standings": standings}
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to fetch constructor standings: {str(e)}"
@@ -89,6 +102,8 @@ async def get_race_results(season: int, round: int) -> Any:
     try:
         results = await jolpica_service.get_race_results(season, round)
         return {"season": season, "round": round, "race": results}
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to fetch results for {season} round {round}: {str(e)}"
@@ -101,6 +116,8 @@ async def get_qualifying_results(season: int, round: int) -> Any:
     try:
         results = await jolpica_service.get_qualifying_results(season, round)
         return {"season": season, "round": round, "race": results}
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -4,6 +4,7 @@ from typing import Any, List
 from fastapi import APIRouter, Body, HTTPException
 
 from app.services.predictor_service import predictor_service
+from app.utils.admission import ServiceOverloaded
 
 router = APIRouter()
 
@@ -16,6 +17,8 @@ async def get_prediction_template(year: int, round: int) -> Any:
         return template
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -35,6 +38,8 @@ async def calculate_prediction_score(
         return score
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -48,6 +53,8 @@ async def get_ai_prediction(year: int, round: int) -> Any:
     try:
         prediction = await predictor_service.get_ai_prediction(year, round)
         return prediction
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
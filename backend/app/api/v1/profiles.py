@@ -4,6 +4,7 @@ from typing import Any, Optional
 from fastapi import APIRouter, HTTPException, Query
 
 from app.services.profile_service import profile_service
+from app.utils.admission import ServiceOverloaded
 
 router = APIRouter()
 
@@ -16,6 +17,8 @@ async def get_all_drivers(
     try:
         drivers = await profile_service.get_all_drivers(season)
         return {"season": season, "drivers": drivers}
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -34,6 +37,8 @@ async def get_driver_profile(
         return profile
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -49,6 +54,8 @@ async def get_all_teams(
     try:
         teams = await profile_service.get_all_teams(season)
         return {"season": season, "teams": teams}
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -67,6 +74,8 @@ async def get_team_profile(
         return profile
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -4,6 +4,7 @@ from typing import Any
 from fastapi import APIRouter, HTTPException
 
 from app.services.race_weekend_service import race_weekend_service
+from app.utils.admission import ServiceOverloaded
 
 router = APIRouter()
 
@@ -16,6 +17,8 @@ async def get_current_weekend() -> Any:
         if not weekend_data:
             return {"message": "No upcoming race weekend found"}
         return weekend_data
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to fetch current weekend: {str(e)}"
@@ -30,6 +33,8 @@ async def get_race_weekend(year: int, round: int) -> Any:
         return weekend_data
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -4,6 +4,7 @@ from typing import Any
 from fastapi import APIRouter, HTTPException
 
 from app.services.strategy_service import strategy_service
+from app.utils.admission import ServiceOverloaded
 
 router = APIRouter()
 
@@ -14,6 +15,8 @@ async def analyze_race_strategy(year: int, race: int | str) -> Any:
     try:
         analysis = await strategy_service.analyze_race_strategy(year, race)
         return analysis
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -27,6 +30,8 @@ async def analyze_driver_strategy(year: int, race: int | str, driver: str) -> An
     try:
         analysis = await strategy_service.analyze_driver_strategy(year, race, driver)
         return analysis
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from app.api.deps import get_current_user
 from app.db.models import User
 from app.services.widget_service import widget_service
+from app.utils.admission import ServiceOverloaded
 
 router = APIRouter()
 
@@ -37,6 +38,8 @@ async def get_widget_data(
 
         widget_data = await widget_service.get_widget_data(widget_id, user_preferences)
         return widget_data
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -50,6 +53,8 @@ async def get_widget_data_public(widget_id: str) -> Any:
     try:
         widget_data = await widget_service.get_widget_data(widget_id)
         return widget_data
+    except ServiceOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -1,5 +1,5 @@
 """Application configuration"""
-from typing import List
+from typing import List, Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -22,6 +22,16 @@ class Settings(BaseSettings):
     
     # Redis
     REDIS_URL: str
+    REDIS_MAX_CONNECTIONS: int = 50  # per worker; callers wait for a free connection
+    REDIS_SOCKET_TIMEOUT: float = 0.5
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 0.5
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
+    # Upper bound on one cache call, including waiting for a pooled connection
+    CACHE_OPERATION_TIMEOUT: float = 1.0
+    # After this many consecutive Redis failures the cache bypasses Redis, serving from
+    # process memory, and probes it again after CACHE_BREAKER_RESET_SECONDS
+    CACHE_BREAKER_FAILURES: int = 5
+    CACHE_BREAKER_RESET_SECONDS: float = 10.0
     
     # Security
     SECRET_KEY: str
@@ -37,6 +47,84 @@ class Settings(BaseSettings):
     # Cache TTL
     JOLPICA_CACHE_TTL: int = 900  # 15 minutes
     FASTF1_CACHE_TTL: int = 86400  # 24 hours
+    DERIVED_CACHE_TTL: int = 3600  # profiles, comparisons, strategy, predictions
+    RACE_WEEKEND_CACHE_TTL: int = 300  # 5 minutes
+
+    # Schedule-aware TTLs (app/services/ttl_policy.py); the TTLs above are the defaults for
+    # data whose round has not started yet
+    CACHE_LIVE_TTL: int = 120  # from the session start until the round settles
+    CACHE_SETTLE_SECONDS: int = 172800  # 2 days after the race, for late penalties/corrections
+    CACHE_HISTORICAL_TTL: int = 2_592_000  # 30 days, for settled rounds and past seasons
+
+    # Negative entries ("no data yet") for sessions: kept until the session starts, within
+    # these bounds; once it has started, results are re-checked every NEGATIVE_CACHE_TTL
+    NEGATIVE_CACHE_TTL: int = 300
+    NEGATIVE_CACHE_MAX_TTL: int = 21600  # 6 hours, so schedule changes are picked up
+
+    # Encoding of cached values: serializer (orjson is used for "json" when installed) and
+    # compression of values above the threshold; unavailable choices fall back to json/zlib
+    CACHE_SERIALIZER: Literal["json", "msgpack"] = "json"
+    CACHE_COMPRESSION: Literal["zstd", "lz4", "zlib", "none"] = "zstd"
+    CACHE_COMPRESSION_MIN_BYTES: int = 16384
+
+    # Recompute lock used by get_or_compute
+    CACHE_LOCK_TIMEOUT: int = 60  # lock expiry if the holder dies
+    CACHE_LOCK_WAIT: int = 15  # how long callers without a stale value wait for the holder
+
+    # In-process L1 cache in front of Redis (per worker)
+    CACHE_L1_ENABLED: bool = True
+    CACHE_L1_MAX_ENTRIES: int = 1024
+    CACHE_L1_MAX_BYTES: int = 67_108_864  # 64 MiB
+    CACHE_L1_MAX_ITEM_BYTES: int = 4_194_304  # 4 MiB; larger values are served from Redis
+    CACHE_L1_TTL: int = 60  # bounds staleness if an invalidation message is missed
+
+    # In-process FastF1 session cache (per worker)
+    FASTF1_SESSION_CACHE_MAX_BYTES: int = 1_073_741_824  # 1 GiB
+    FASTF1_SESSION_CACHE_MAX_ENTRIES: int = 8
+
+    # Cross-worker lock around cold FastF1 builds
+    FASTF1_BUILD_LOCK_TIMEOUT: int = 300  # lock expiry if the holder dies
+    FASTF1_BUILD_LOCK_WAIT: int = 120  # how long other workers wait for the holder
+
+    # Executor for FastF1 loading and parsing: "thread" or "process".
+    # Each process worker keeps its own session cache with the limits above, and concurrent
+    # loads of a session are only coalesced within a process (see FastF1Service._run_job).
+    FASTF1_EXECUTOR: Literal["thread", "process"] = "thread"
+    FASTF1_EXECUTOR_WORKERS: int = 4
+
+    # Admission control for cold FastF1 builds (per worker); beyond the queue limit
+    # requests are rejected with 503 and Retry-After
+    FASTF1_MAX_CONCURRENT_LOADS: int = 2
+    FASTF1_MAX_QUEUED_LOADS: int = 16
+
+    # Jolpica requests one fan-out (season pages, per-round fetches, multi-season loops) keeps
+    # in flight at a time, to stay under the API's rate limits
+    JOLPICA_MAX_CONCURRENCY: int = 4
+
+    # HTTP client for the Jolpica API (per worker). Keep-alive connections are reused across
+    # requests; HTTP/2 needs the h2 package (pip install "httpx[http2]")
+    JOLPICA_HTTP_TIMEOUT: float = 10.0
+    JOLPICA_HTTP_MAX_CONNECTIONS: int = 20
+    JOLPICA_HTTP_MAX_KEEPALIVE: int = 10
+    JOLPICA_HTTP_KEEPALIVE_EXPIRY: float = 30.0  # seconds an idle connection is kept open
+    JOLPICA_HTTP2: bool = False
+    # Retries of timeouts, network errors and 502/503/504, with exponential backoff
+    JOLPICA_HTTP_RETRIES: int = 2
+    JOLPICA_HTTP_RETRY_BACKOFF: float = 0.25
+    # How long past their TTL documents with an ETag/Last-Modified are kept, so they can be
+    # refreshed with a conditional request. Opt-in: each kept document is a second copy in
+    # Redis for TTL + window, roughly doubling the Jolpica footprint; 0 disables it
+    JOLPICA_REVALIDATE_WINDOW: int = 0
+
+    # Jolpica rate limit, shared by all workers through Redis; the API allows bursts of 4
+    # requests a second and 500 an hour per IP
+    JOLPICA_RATE_PER_SECOND: float = 4.0
+    JOLPICA_RATE_BURST: int = 4
+    JOLPICA_RATE_PER_HOUR: int = 500
+    JOLPICA_RATE_BACKGROUND_RESERVE: float = 0.25  # share of each bucket kept for user requests
+    JOLPICA_RATE_MAX_WAIT: float = 10.0  # longest a user request waits for a token, then 503
+    JOLPICA_RATE_LIMIT_RETRIES: int = 2  # 429 responses retried after their Retry-After
+    JOLPICA_RATE_LIMIT_BACKOFF: float = 1.0  # first pause after a 429 without Retry-After
     
     @property
     def allowed_origins_list(self) -> List[str]:
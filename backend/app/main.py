@@ -1,15 +1,19 @@
 """Main FastAPI application"""
 import structlog
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
 from app.api.v1 import auth, comparison, fastf1, jolpica, predictor, profiles, race_weekend, strategy, widgets
 from app.core.config import settings
-from app.utils.cache import close_redis
+from app.services.fastf1_service import fastf1_service
+from app.services.jolpica_service import jolpica_service
+from app.utils.admission import ServiceOverloaded
+from app.utils.cache import cache_stats, close_redis, codec, start_cache_invalidation
 
 # Configure structlog
 structlog.configure(
@@ -29,12 +33,33 @@ limiter = Limiter(key_func=get_remote_address, default_limits=[f"{settings.RATE_
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     logger.info("application_startup", project=settings.PROJECT_NAME)
+    if codec.unavailable:
+        # Not installed in this environment: cached values use the fallbacks instead
+        logger.warning(
+            "cache_codec_unavailable",
+            unavailable=codec.unavailable,
+            serializer=codec.serializer,
+            compression=codec.compression,
+        )
+    start_cache_invalidation()
+    await jolpica_service.get_client()
     yield
     # Cleanup
     logger.info("application_shutdown")
+    fastf1_service.shutdown()
+    await jolpica_service.close()
     await close_redis()
 
 
+async def _service_overloaded_handler(request: Request, exc: ServiceOverloaded) -> JSONResponse:
+    """Shed load with 503 and a Retry-After hint when a heavy-operation queue is full"""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -46,6 +71,9 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+# Load shedding for heavy operations
+app.add_exception_handler(ServiceOverloaded, _service_overloaded_handler)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -74,6 +102,17 @@ async def health_check():
     return {"status": "healthy"}
 
 
+# Runtime metrics
+@app.get("/metrics")
+async def metrics():
+    """In-process cache, FastF1 and Jolpica client metrics for this worker"""
+    return {
+        "cache": cache_stats(),
+        "fastf1": fastf1_service.stats(),
+        "jolpica": jolpica_service.stats(),
+    }
+
+
 # Include routers
 app.include_router(
     auth.router,
@@ -4,9 +4,11 @@ from typing import Any, Dict, List, Optional
 
 import structlog
 
+from app.core.config import settings
 from app.services.fastf1_service import fastf1_service
-from app.services.jolpica_service import jolpica_service
-from app.utils.cache import get_cache, set_cache
+from app.services.jolpica_service import jolpica_service, missing_rounds
+from app.services.ttl_policy import by_round, by_season, tags_by_race
+from app.utils.cache import cached
 
 logger = structlog.get_logger()
 
@@ -23,17 +25,17 @@ class ComparisonService:
         """Compare two drivers across a full season"""
         if season is None:
             season = await jolpica_service.get_current_season()
-
-        cache_key = f"comparison:drivers:{driver1_id}:{driver2_id}:{season}"
-
-        # Try cache first
-        cached = await get_cache(cache_key)
-        if cached:
-            logger.info("cache_hit", key=cache_key)
-            return cached
-
-        logger.info("cache_miss", key=cache_key)
-
+        return await self._compare_drivers_season(driver1_id, driver2_id, season)
+
+    @cached(
+        "comparison:drivers:{driver1_id}:{driver2_id}:{season}",
+        ttl=by_season(settings.DERIVED_CACHE_TTL),
+        tags=("season:{season}",),
+    )
+    async def _compare_drivers_season(
+        self, driver1_id: str, driver2_id: str, season: int
+    ) -> Dict[str, Any]:
+        """Compare two drivers across a full season (season already resolved)"""
         try:
             # Get standings to find driver info
             standings = await jolpica_service.get_driver_standings(season)
@@ -50,12 +52,13 @@ class ComparisonService:
 
             # Get race results for detailed comparison
             schedule = await jolpica_service.get_schedule(season)
+            season_results = await jolpica_service.get_season_results(season)
             race_comparisons = []
 
             for race in schedule:
                 round_num = int(race["round"])
                 try:
-                    results = await jolpica_service.get_race_results(season, round_num)
+                    results = season_results.get(round_num)
                     if results and "Results" in results:
                         race_results = results["Results"]
 
@@ -116,7 +119,9 @@ class ComparisonService:
                 "driver1": {
                     "id": driver1_id,
                     "info": driver1_data["Driver"],
-                    "team": driver1_data["Constructors"][0] if driver1_data["Constructors"] else None,
+                    "team": (
+                        driver1_data["Constructors"][0] if driver1_data["Constructors"] else None
+                    ),
                     "position": int(driver1_data["position"]),
                     "points": float(driver1_data["points"]),
                     "wins": int(driver1_data["wins"]),
@@ -124,18 +129,20 @@ class ComparisonService:
                 "driver2": {
                     "id": driver2_id,
                     "info": driver2_data["Driver"],
-                    "team": driver2_data["Constructors"][0] if driver2_data["Constructors"] else None,
+                    "team": (
+                        driver2_data["Constructors"][0] if driver2_data["Constructors"] else None
+                    ),
                     "position": int(driver2_data["position"]),
                     "points": float(driver2_data["points"]),
                     "wins": int(driver2_data["wins"]),
                 },
                 "head_to_head": h2h_stats,
                 "race_by_race": race_comparisons,
+                "missing_rounds": missing_rounds(
+                    [int(race["round"]) for race in schedule], season_results
+                ),
             }
 
-            # Cache result
-            await set_cache(cache_key, comparison_data, 3600)
-
             return comparison_data
 
         except Exception as e:
@@ -148,20 +155,15 @@ class ComparisonService:
             )
             raise
 
+    @cached(
+        "comparison:race:{driver1_code}:{driver2_code}:{year}:{race}",
+        ttl=by_round(settings.DERIVED_CACHE_TTL),
+        tags=tags_by_race(),
+    )
     async def compare_drivers_race(
         self, driver1_code: str, driver2_code: str, year: int, race: int | str
     ) -> Dict[str, Any]:
         """Compare two drivers in a specific race with detailed telemetry"""
-        cache_key = f"comparison:race:{driver1_code}:{driver2_code}:{year}:{race}"
-
-        # Try cache first
-        cached = await get_cache(cache_key)
-        if cached:
-            logger.info("cache_hit", key=cache_key)
-            return cached
-
-        logger.info("cache_miss", key=cache_key)
-
         try:
             # Get lap data for both drivers
             driver1_laps = await fastf1_service.get_driver_laps(
@@ -235,9 +237,6 @@ class ComparisonService:
                 },
             }
 
-            # Cache result
-            await set_cache(cache_key, comparison_data, 3600)
-
             return comparison_data
 
         except Exception as e:
@@ -0,0 +1,242 @@
+"""Session loading and derived-result jobs for FastF1 work.
+
+Every job takes a loaded Session and returns a compact, picklable result (lists, dicts,
+floats) so it can run either on a thread next to the service's session cache or inside a
+worker process that loads the session itself.
+"""
+
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+import fastf1
+import numpy as np
+import pandas as pd
+import structlog
+
+from app.services.fastf1_transforms import (
+    build_replay_frames,
+    build_stint_table,
+    downsample_telemetry,
+    laps_to_records,
+    telemetry_to_columns,
+)
+from app.utils.session_cache import SessionCache
+
+logger = structlog.get_logger()
+
+# Named session load profiles: the parts of a session FastF1 parses for each kind of endpoint.
+# Race control messages are small and mark deleted laps, so every profile includes them.
+# FastF1 loads car and position data together, so position-based endpoints use "telemetry".
+LOAD_PROFILES: Dict[str, FrozenSet[str]] = {
+    "timing": frozenset({"laps", "messages"}),
+    "telemetry": frozenset({"laps", "messages", "telemetry"}),
+    "full": frozenset({"laps", "messages", "telemetry", "weather"}),
+}
+
+
+class LoadedSession(NamedTuple):
+    """A FastF1 session together with the parts that have been loaded into it.
+
+    ``size`` is its estimated size in bytes, measured by load_parts on the loading thread so
+    session caches never measure DataFrames on the event loop.
+    """
+
+    session: Any
+    parts: FrozenSet[str]
+    size: int = 0
+
+
+def estimate_session_bytes(session: Any) -> int:
+    """Estimate the in-memory size of the DataFrames held by a loaded session"""
+    total = 0
+    for attr in ("laps", "results", "weather_data", "race_control_messages"):
+        try:
+            frame = getattr(session, attr)
+        except Exception:
+            # FastF1 raises DataNotLoadedError for data that was not loaded
+            continue
+        if isinstance(frame, pd.DataFrame):
+            total += int(frame.memory_usage(deep=True).sum())
+    for attr in ("car_data", "pos_data"):
+        try:
+            frames = getattr(session, attr)
+        except Exception:
+            continue
+        for frame in (frames or {}).values():
+            total += int(frame.memory_usage(deep=True).sum())
+    return total
+
+
+def load_parts(entry: LoadedSession, parts: FrozenSet[str]) -> LoadedSession:
+    """Return entry's session loaded with entry.parts plus the given parts.
+
+    A session that already holds parts may be shared through a session cache, with other
+    jobs reading its laps or telemetry on other threads, so it is never loaded into again:
+    the parts are loaded into a new Session for the same event, which the caller swaps into
+    its cache. Loading the parts again costs little, from FastF1's disk cache.
+    """
+    session = entry.session
+    if entry.parts:
+        session = type(session)(session.event, session.name, f1_api_support=session.f1_api_support)
+    parts = entry.parts | parts
+    session.load(
+        laps="laps" in parts,
+        telemetry="telemetry" in parts,
+        weather="weather" in parts,
+        messages="messages" in parts,
+    )
+    return LoadedSession(session, parts, estimate_session_bytes(session))
+
+
+def driver_mapping(session: Any) -> Tuple[Dict[str, str], Dict[str, Any]]:
+    """Build driver number→code mapping and driver info dict from a session."""
+    driver_num_to_code: Dict[str, str] = {}
+    driver_info: Dict[str, Any] = {}
+    try:
+        for num in session.drivers:
+            info = session.get_driver(num)
+            code = str(info.get("Abbreviation", num))
+            color = str(info.get("TeamColor", "888888") or "888888")
+            if not color.startswith("#"):
+                color = f"#{color}"
+            driver_num_to_code[str(num)] = code
+            driver_info[code] = {
+                "code": code,
+                "name": str(info.get("FullName", code)),
+                "team": str(info.get("TeamName", "")),
+                "color": color,
+            }
+    except Exception as e:
+        logger.warning("failed_to_build_driver_info", error=str(e))
+    return driver_num_to_code, driver_info
+
+
+def lap_table(session: Any) -> List[Dict[str, Any]]:
+    """All laps of a session as API records"""
+    return laps_to_records(session.laps)
+
+
+def stint_table(session: Any) -> List[Dict[str, Any]]:
+    """Stints of all drivers in a session"""
+    return build_stint_table(session.laps)
+
+
+def lap_telemetry(
+    session: Any, driver: str, lap_number: int, sampling: str, resolution: Optional[int]
+) -> Dict[str, Any]:
+    """Downsampled telemetry of one lap, one array per channel"""
+    driver_laps = session.laps.pick_driver(driver.upper())
+    lap = driver_laps[driver_laps["LapNumber"] == lap_number].iloc[0]
+    telemetry = lap.get_telemetry()
+
+    return {
+        "driver": driver.upper(),
+        "lap_number": lap_number,
+        "lap_time": str(lap["LapTime"]) if pd.notna(lap["LapTime"]) else None,
+        "compound": lap.get("Compound"),
+        "format": "columnar",
+        "sampling": sampling,
+        "telemetry": telemetry_to_columns(downsample_telemetry(telemetry, sampling, resolution)),
+    }
+
+
+def track_outline(session: Any) -> Dict[str, Any]:
+    """Normalized track outline coordinates from the fastest lap"""
+    pos_data = session.laps.pick_fastest().get_pos_data()
+
+    x_arr = pos_data["X"].values.astype(float)
+    y_arr = pos_data["Y"].values.astype(float)
+
+    valid_mask = np.isfinite(x_arr) & np.isfinite(y_arr)
+    x_arr = x_arr[valid_mask]
+    y_arr = y_arr[valid_mask]
+
+    if len(x_arr) == 0:
+        return {"points": [], "x_min": 0, "x_max": 0, "y_min": 0, "y_max": 0, "scale": 1}
+
+    x_min, x_max = float(x_arr.min()), float(x_arr.max())
+    y_min, y_max = float(y_arr.min()), float(y_arr.max())
+    scale = max(x_max - x_min, y_max - y_min, 1.0)
+
+    # Downsample to ~500 points for the track outline SVG
+    step = max(1, len(x_arr) // 500)
+    points = [
+        [
+            round((float(x) - x_min) / scale * 1000, 1),
+            round((float(y) - y_min) / scale * 1000, 1),
+        ]
+        for x, y in zip(x_arr[::step], y_arr[::step])
+    ]
+
+    return {
+        "points": points,
+        "x_min": x_min,
+        "x_max": x_max,
+        "y_min": y_min,
+        "y_max": y_max,
+        "scale": scale,
+    }
+
+
+def replay_frames(session: Any) -> Dict[str, Any]:
+    """Per-lap driver positions for the race replay, normalized like the track outline"""
+    # Coordinate normalisation bounds from the fastest lap
+    ref_pos = session.laps.pick_fastest().get_pos_data()
+    x_ref = ref_pos["X"].values.astype(float)
+    y_ref = ref_pos["Y"].values.astype(float)
+    valid = np.isfinite(x_ref) & np.isfinite(y_ref)
+    x_ref, y_ref = x_ref[valid], y_ref[valid]
+
+    x_min = float(x_ref.min())
+    y_min = float(y_ref.min())
+    scale = float(max(x_ref.max() - x_min, y_ref.max() - y_min, 1.0))
+
+    driver_num_to_code, driver_info = driver_mapping(session)
+
+    laps_df = session.laps
+    total_laps = int(laps_df["LapNumber"].max()) if len(laps_df) > 0 else 0
+    pos_data_by_num: Dict[str, Any] = getattr(session, "pos_data", {}) or {}
+
+    frames = build_replay_frames(
+        laps_df,
+        pos_data_by_num,
+        driver_num_to_code,
+        x_min=x_min,
+        y_min=y_min,
+        scale=scale,
+        total_laps=total_laps,
+    )
+    return {"total_laps": total_laps, "frames": frames, "drivers": driver_info}
+
+
+# Per-process session cache of a pool worker, set up by init_worker
+_worker_sessions: Optional[SessionCache] = None
+
+
+def init_worker(cache_dir: str, max_bytes: int, max_entries: int) -> None:
+    """Process pool initializer: enable the FastF1 disk cache and a local session cache"""
+    global _worker_sessions
+    fastf1.Cache.enable_cache(cache_dir)
+    _worker_sessions = SessionCache(
+        max_bytes=max_bytes,
+        max_entries=max_entries,
+        sizeof=lambda entry: entry.size,
+    )
+
+
+def run_job(job, year: int, race: str | int, session_type: str, profile: str, *args) -> Any:
+    """Load a session in this worker process (reusing earlier loads) and run a job on it.
+
+    Loads are only reused within this process; see FastF1Service._run_job.
+    """
+    key = (year, str(race).lower(), session_type.upper())
+    needed = LOAD_PROFILES[profile]
+
+    entry = _worker_sessions.get(key) if _worker_sessions is not None else None
+    if entry is None:
+        entry = LoadedSession(fastf1.get_session(year, race, session_type), frozenset())
+    if not needed <= entry.parts:
+        entry = load_parts(entry, needed - entry.parts)
+        if _worker_sessions is not None:
+            _worker_sessions.put(key, entry)
+
+    return job(entry.session, *args)
@@ -2,17 +2,30 @@
 
 import asyncio
 import functools
+import multiprocessing
 import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 import fastf1
-import numpy as np
-import pandas as pd
 import structlog
 
 from app.core.config import settings
-from app.utils.cache import get_cache, set_cache
+from app.services import fastf1_jobs
+from app.services.fastf1_jobs import (
+    LOAD_PROFILES,
+    LoadedSession,
+    init_worker,
+    load_parts,
+    run_job,
+)
+from app.services.fastf1_transforms import columns_to_rows
+from app.services.ttl_policy import by_round, tags_by_race
+from app.utils.admission import AdmissionController
+from app.utils.cache import cached
+from app.utils.session_cache import SessionCache
+from app.utils.singleflight import SingleFlight
 
 logger = structlog.get_logger()
 
@@ -22,6 +35,23 @@ CACHE_DIR = Path(__file__).parent.parent.parent / "fastf1_cache"
 CACHE_DIR.mkdir(exist_ok=True)
 fastf1.Cache.enable_cache(str(CACHE_DIR))
 
+# Admission priorities for cold builds; lower runs first when loads are queued
+PRIORITY_TIMING = 0
+PRIORITY_TELEMETRY = 1
+PRIORITY_REPLAY = 2
+
+# Derived results are cached by the schedule-aware TTL policy (FASTF1_CACHE_TTL before the
+# session), tagged with their race and season. A miss
+# is computed once across workers: others wait on the build lock and pick up the holder's
+# result instead of loading the same session again.
+cached_build = functools.partial(
+    cached,
+    ttl=by_round(settings.FASTF1_CACHE_TTL, session="session_type"),
+    lock_timeout=settings.FASTF1_BUILD_LOCK_TIMEOUT,
+    lock_wait=settings.FASTF1_BUILD_LOCK_WAIT,
+    tags=tags_by_race(),
+)
+
 
 class FastF1Service:
     """Service for FastF1 detailed race data"""
@@ -29,80 +59,203 @@ class FastF1Service:
     TIMEOUT = 30.0
 
     def __init__(self):
-        # No instance state needed — all methods are stateless and use the module-level fastf1 cache
-        pass
+        # Loaded Session objects are kept per worker so follow-up requests reuse parsed data
+        self.session_cache = SessionCache(
+            max_bytes=settings.FASTF1_SESSION_CACHE_MAX_BYTES,
+            max_entries=settings.FASTF1_SESSION_CACHE_MAX_ENTRIES,
+            # Measured by load_parts in the executor; sizing on the loop would block it
+            sizeof=lambda entry: entry.size,
+        )
+        # Concurrent callers share one in-flight session load per key
+        self._session_loads = SingleFlight()
+        # Bounds concurrent cold builds; cache hits never go through it
+        self.admission = AdmissionController(
+            "fastf1",
+            max_concurrent=settings.FASTF1_MAX_CONCURRENT_LOADS,
+            max_queue=settings.FASTF1_MAX_QUEUED_LOADS,
+        )
+        self.session_upgrades = 0
+        # Worker pools are created on first use and closed by shutdown()
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def uses_processes(self) -> bool:
+        return settings.FASTF1_EXECUTOR == "process"
+
+    def _thread_pool(self) -> Executor:
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(
+                max_workers=settings.FASTF1_EXECUTOR_WORKERS, thread_name_prefix="fastf1"
+            )
+        return self._threads
+
+    def _process_pool(self) -> Executor:
+        if self._processes is None:
+            # spawn: forking a process that runs an event loop and Redis connections is unsafe
+            self._processes = ProcessPoolExecutor(
+                max_workers=settings.FASTF1_EXECUTOR_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker,
+                initargs=(
+                    str(CACHE_DIR),
+                    settings.FASTF1_SESSION_CACHE_MAX_BYTES,
+                    settings.FASTF1_SESSION_CACHE_MAX_ENTRIES,
+                ),
+            )
+        return self._processes
+
+    def shutdown(self) -> None:
+        """Stop the worker pools, dropping queued work"""
+        for pool in (self._threads, self._processes):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._threads = None
+        self._processes = None
 
     async def _run_sync(self, func, *args, **kwargs):
-        """Run synchronous FastF1 operations in thread pool"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, func, *args, **kwargs)
+        """Run synchronous FastF1 operations in the FastF1 thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._thread_pool(), functools.partial(func, *args, **kwargs)
+        )
+
+    async def _run_job(
+        self,
+        job: Callable[..., Any],
+        year: int,
+        race: str | int,
+        session_type: str,
+        profile: str,
+        *args: Any,
+    ) -> Any:
+        """Run a fastf1_jobs job on a session loaded with the given profile.
+
+        With the process executor the whole job, including the session load, runs in a pool
+        process and only its compact result is sent back. With threads the session comes
+        from this worker's session cache.
+
+        Pool processes share neither sessions nor in-flight loads: jobs are not routed by
+        session, so two jobs needing the same uncached session may each load it in a
+        different process. Identical builds are still computed once, behind the cached_build
+        lock; only different jobs on the same session duplicate the load.
+        """
+        if self.uses_processes:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._process_pool(),
+                functools.partial(run_job, job, year, race, session_type, profile, *args),
+            )
+        session = await self.get_session(year, race, session_type, profile=profile)
+        return await self._run_sync(job, session, *args)
+
+    async def _build(
+        self,
+        priority: int,
+        job: Callable[..., Any],
+        year: int,
+        race: str | int,
+        session_type: str,
+        profile: str,
+        *args: Any,
+    ) -> Any:
+        """Run a job once an admission slot is free.
+
+        Only cache misses get here. Builds wait for a slot by priority and raise
+        ServiceOverloaded when the queue is full.
+        """
+        async with self.admission.slot(priority):
+            return await self._run_job(job, year, race, session_type, profile, *args)
+
+    @staticmethod
+    def _session_key(session: Any, year: int) -> Tuple[int, int, str]:
+        """Canonical session cache key: (year, round, session name)"""
+        return (year, int(session.event["RoundNumber"]), str(session.name))
+
+    async def get_session(
+        self, year: int, race: str | int, session_type: str = "R", profile: str = "full"
+    ) -> Any:
+        """Get a FastF1 session with at least the parts of the given load profile loaded.
+
+        Sessions are reused from the in-process session cache. A cached session that lacks
+        parts of the profile (e.g. timing-only, asked for telemetry) is upgraded by loading a
+        new Session with all the parts and swapping it into the cache; callers still using
+        the old one keep reading it unchanged.
+        """
+        needed = LOAD_PROFILES[profile]
+        alias = (year, str(race).lower(), session_type.upper())
+
+        key = self.session_cache.resolve(alias)
+        entry: Optional[LoadedSession] = self.session_cache.get(key) if key is not None else None
+        if entry is not None and needed <= entry.parts:
+            logger.info("session_cache_hit", key=str(key), profile=profile)
+            return entry.session
 
-    async def get_session(self, year: int, race: str | int, session_type: str = "R") -> Any:
-        """Get FastF1 session"""
         try:
-            session = await self._run_sync(fastf1.get_session, year, race, session_type)
-            await self._run_sync(session.load)
-            return session
+            if entry is None:
+                session = await self._run_sync(fastf1.get_session, year, race, session_type)
+                key = self._session_key(session, year)
+                entry = self.session_cache.get(key) or LoadedSession(session, frozenset())
+
+            # A joined in-flight load may cover fewer parts than needed; load again if so
+            while not needed <= entry.parts:
+                entry = await self._session_loads.do(
+                    key, functools.partial(self._load_session, key, entry, needed)
+                )
+            self.session_cache.add_alias(alias, key)
+            return entry.session
         except Exception as e:
             logger.error(
                 "failed_to_load_session",
                 year=year,
                 race=race,
                 session_type=session_type,
+                profile=profile,
                 error=str(e),
             )
             raise
 
+    async def _load_session(
+        self, key: Tuple[int, int, str], entry: LoadedSession, needed: FrozenSet[str]
+    ) -> LoadedSession:
+        """Load the missing parts of a session and store it in the session cache"""
+        # Prefer the cached copy: an earlier load may have finished since entry was read
+        entry = self.session_cache.peek(key) or entry
+        missing = needed - entry.parts
+        if not missing:
+            return entry
+
+        if entry.parts:
+            self.session_upgrades += 1
+        logger.info(
+            "session_load", key=str(key), loaded=sorted(entry.parts), missing=sorted(missing)
+        )
+        entry = await self._run_sync(load_parts, entry, missing)
+        self.session_cache.put(key, entry)
+        return entry
+
+    def stats(self) -> Dict[str, Any]:
+        """Return session cache, executor and in-flight coalescing counters"""
+        return {
+            "executor": {
+                "kind": settings.FASTF1_EXECUTOR,
+                "workers": settings.FASTF1_EXECUTOR_WORKERS,
+            },
+            "sessions": self.session_cache.stats(),
+            "session_loads": self._session_loads.stats(),
+            "session_upgrades": self.session_upgrades,
+            "admission": self.admission.stats(),
+        }
+
+    @cached_build("fastf1:laps:{year}:{race}:{session_type}")
     async def get_lap_times(
         self, year: int, race: str | int, session_type: str = "R"
     ) -> List[Dict[str, Any]]:
         """Get all lap times for a session"""
-        cache_key = f"fastf1:laps:{year}:{race}:{session_type}"
-
-        # Try cache first
-        cached = await get_cache(cache_key)
-        if cached:
-            logger.info("cache_hit", key=cache_key)
-            return cached
-
-        logger.info("cache_miss", key=cache_key)
-
         try:
-            session = await self.get_session(year, race, session_type)
-            laps = session.laps
-
-            # Convert to dict format
-            laps_data = []
-            for _, lap in laps.iterrows():
-                lap_dict = {
-                    "driver": lap.get("Driver"),
-                    "lap_number": int(lap.get("LapNumber", 0)),
-                    "lap_time": str(lap.get("LapTime")) if pd.notna(lap.get("LapTime")) else None,
-                    "lap_time_seconds": float(lap.get("LapTime").total_seconds())
-                    if pd.notna(lap.get("LapTime"))
-                    else None,
-                    "sector1_time": float(lap.get("Sector1Time").total_seconds())
-                    if pd.notna(lap.get("Sector1Time"))
-                    else None,
-                    "sector2_time": float(lap.get("Sector2Time").total_seconds())
-                    if pd.notna(lap.get("Sector2Time"))
-                    else None,
-                    "sector3_time": float(lap.get("Sector3Time").total_seconds())
-                    if pd.notna(lap.get("Sector3Time"))
-                    else None,
-                    "compound": lap.get("Compound"),
-                    "tyre_life": int(lap.get("TyreLife", 0))
-                    if pd.notna(lap.get("TyreLife"))
-                    else None,
-                    "stint": int(lap.get("Stint", 0)),
-                    "is_personal_best": bool(lap.get("IsPersonalBest", False)),
-                }
-                laps_data.append(lap_dict)
-
-            # Cache result
-            await set_cache(cache_key, laps_data, settings.FASTF1_CACHE_TTL)
-
-            return laps_data
+            return await self._build(
+                PRIORITY_TIMING, fastf1_jobs.lap_table, year, race, session_type, "timing"
+            )
         except Exception as e:
             logger.error(
                 "failed_to_fetch_lap_times",
@@ -122,55 +275,26 @@ class FastF1Service:
         return driver_laps
 
     async def get_telemetry(
-        self, year: int, race: str | int, driver: str, lap_number: int, session_type: str = "R"
+        self,
+        year: int,
+        race: str | int,
+        driver: str,
+        lap_number: int,
+        session_type: str = "R",
+        columnar: bool = False,
+        sampling: str = "stride",
+        resolution: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """Get telemetry data for a specific lap"""
-        cache_key = f"fastf1:telemetry:{year}:{race}:{session_type}:{driver}:{lap_number}"
-
-        # Try cache first
-        cached = await get_cache(cache_key)
-        if cached:
-            logger.info("cache_hit", key=cache_key)
-            return cached
-
-        logger.info("cache_miss", key=cache_key)
+        """Get telemetry data for a specific lap.
 
+        Samples are cached as one array per channel, separately for each sampling method and
+        resolution; with ``columnar=False`` they are expanded to the per-sample list of dicts
+        on the way out.
+        """
         try:
-            session = await self.get_session(year, race, session_type)
-            driver_laps = session.laps.pick_driver(driver.upper())
-            lap = driver_laps[driver_laps["LapNumber"] == lap_number].iloc[0]
-
-            # Get telemetry
-            telemetry = lap.get_telemetry()
-
-            # Sample telemetry data (every 10th point to reduce size)
-            telemetry_sample = telemetry.iloc[::10]
-
-            telemetry_data = {
-                "driver": driver.upper(),
-                "lap_number": lap_number,
-                "lap_time": str(lap["LapTime"]) if pd.notna(lap["LapTime"]) else None,
-                "compound": lap.get("Compound"),
-                "telemetry": [],
-            }
-
-            for _, point in telemetry_sample.iterrows():
-                telemetry_data["telemetry"].append(
-                    {
-                        "distance": float(point.get("Distance", 0)),
-                        "speed": float(point.get("Speed", 0)),
-                        "throttle": float(point.get("Throttle", 0)),
-                        "brake": bool(point.get("Brake", False)),
-                        "gear": int(point.get("nGear", 0)),
-                        "rpm": float(point.get("RPM", 0)) if pd.notna(point.get("RPM")) else None,
-                        "drs": int(point.get("DRS", 0)) if pd.notna(point.get("DRS")) else None,
-                    }
-                )
-
-            # Cache result
-            await set_cache(cache_key, telemetry_data, settings.FASTF1_CACHE_TTL)
-
-            return telemetry_data
+            telemetry_data = await self._lap_telemetry(
+                year, race, driver, lap_number, session_type, sampling, resolution
+            )
         except Exception as e:
             logger.error(
                 "failed_to_fetch_telemetry",
@@ -182,52 +306,55 @@ class FastF1Service:
             )
             raise
 
+        if columnar:
+            return telemetry_data
+        return {
+            **telemetry_data,
+            "format": "rows",
+            "telemetry": columns_to_rows(telemetry_data["telemetry"]),
+        }
+
+    @cached_build(
+        "fastf1:telemetry:columnar:{year}:{race}:{session_type}:{driver}:{lap_number}"
+        ":{sampling}:{resolution}"
+    )
+    async def _lap_telemetry(
+        self,
+        year: int,
+        race: str | int,
+        driver: str,
+        lap_number: int,
+        session_type: str,
+        sampling: str,
+        resolution: Optional[int],
+    ) -> Dict[str, Any]:
+        """Columnar telemetry of one lap"""
+        return await self._build(
+            PRIORITY_TELEMETRY,
+            fastf1_jobs.lap_telemetry,
+            year,
+            race,
+            session_type,
+            "telemetry",
+            driver,
+            lap_number,
+            sampling,
+            resolution,
+        )
+
+    @cached_build("fastf1:stints:{year}:{race}:{session_type}")
     async def get_stint_data(
         self, year: int, race: str | int, session_type: str = "R"
     ) -> List[Dict[str, Any]]:
-        """Get stint data (tire strategy) for all drivers"""
-        cache_key = f"fastf1:stints:{year}:{race}:{session_type}"
-
-        # Try cache first
-        cached = await get_cache(cache_key)
-        if cached:
-            logger.info("cache_hit", key=cache_key)
-            return cached
-
-        logger.info("cache_miss", key=cache_key)
+        """Get stint data (tire strategy) for all drivers.
 
+        Each stint has its compound, lap range and count, mean/median/best lap time and
+        tyre-life range.
+        """
         try:
-            session = await self.get_session(year, race, session_type)
-            laps = session.laps
-
-            # Group by driver and stint
-            stint_data = []
-            for driver in laps["Driver"].unique():
-                driver_laps = laps[laps["Driver"] == driver]
-
-                for stint in driver_laps["Stint"].unique():
-                    stint_laps = driver_laps[driver_laps["Stint"] == stint]
-
-                    if len(stint_laps) > 0:
-                        first_lap = stint_laps.iloc[0]
-
-                        stint_info = {
-                            "driver": driver,
-                            "stint": int(stint),
-                            "compound": first_lap.get("Compound"),
-                            "start_lap": int(stint_laps["LapNumber"].min()),
-                            "end_lap": int(stint_laps["LapNumber"].max()),
-                            "num_laps": len(stint_laps),
-                            "avg_lap_time": float(stint_laps["LapTime"].mean().total_seconds())
-                            if not stint_laps["LapTime"].isna().all()
-                            else None,
-                        }
-                        stint_data.append(stint_info)
-
-            # Cache result
-            await set_cache(cache_key, stint_data, settings.FASTF1_CACHE_TTL)
-
-            return stint_data
+            return await self._build(
+                PRIORITY_TIMING, fastf1_jobs.stint_table, year, race, session_type, "timing"
+            )
         except Exception as e:
             logger.error(
                 "failed_to_fetch_stint_data",
@@ -263,249 +390,28 @@ class FastF1Service:
             )
             raise
 
+    @cached_build("fastf1:track_map:{year}:{race}:{session_type}")
     async def get_track_map(
         self, year: int, race: int | str, session_type: str = "R"
     ) -> Dict[str, Any]:
         """Get normalized track outline coordinates from the fastest lap for SVG visualization"""
-        cache_key = f"fastf1:track_map:{year}:{race}:{session_type}"
-
-        cached = await get_cache(cache_key)
-        if cached:
-            logger.info("cache_hit", key=cache_key)
-            return cached
-
-        logger.info("cache_miss", key=cache_key)
-
         try:
-            session = await self.get_session(year, race, session_type)
-            fastest = session.laps.pick_fastest()
-
-            def _get_pos():
-                return fastest.get_pos_data()
-
-            pos_data = await self._run_sync(_get_pos)
-
-            x_arr = pos_data["X"].values.astype(float)
-            y_arr = pos_data["Y"].values.astype(float)
-
-            valid_mask = np.isfinite(x_arr) & np.isfinite(y_arr)
-            x_arr = x_arr[valid_mask]
-            y_arr = y_arr[valid_mask]
-
-            if len(x_arr) == 0:
-                return {"points": [], "x_min": 0, "x_max": 0, "y_min": 0, "y_max": 0, "scale": 1}
-
-            x_min, x_max = float(x_arr.min()), float(x_arr.max())
-            y_min, y_max = float(y_arr.min()), float(y_arr.max())
-            scale = max(x_max - x_min, y_max - y_min, 1.0)
-
-            # Downsample to ~500 points for the track outline SVG
-            step = max(1, len(x_arr) // 500)
-            points = [
-                [
-                    round((float(x) - x_min) / scale * 1000, 1),
-                    round((float(y) - y_min) / scale * 1000, 1),
-                ]
-                for x, y in zip(x_arr[::step], y_arr[::step])
-            ]
-
-            result: Dict[str, Any] = {
-                "points": points,
-                "x_min": x_min,
-                "x_max": x_max,
-                "y_min": y_min,
-                "y_max": y_max,
-                "scale": scale,
-            }
-
-            await set_cache(cache_key, result, settings.FASTF1_CACHE_TTL)
-            return result
-
+            return await self._build(
+                PRIORITY_TELEMETRY, fastf1_jobs.track_outline, year, race, session_type, "telemetry"
+            )
         except Exception as e:
             logger.error("failed_to_fetch_track_map", year=year, race=race, error=str(e))
             raise
 
-    def _build_driver_mapping(self, session: Any) -> Tuple[Dict[str, str], Dict[str, Any]]:
-        """Build driver number→code mapping and driver info dict from a session."""
-        driver_num_to_code: Dict[str, str] = {}
-        driver_info: Dict[str, Any] = {}
-        try:
-            for num in session.drivers:
-                info = session.get_driver(num)
-                code = str(info.get("Abbreviation", num))
-                color = str(info.get("TeamColor", "888888") or "888888")
-                if not color.startswith("#"):
-                    color = f"#{color}"
-                driver_num_to_code[str(num)] = code
-                driver_info[code] = {
-                    "code": code,
-                    "name": str(info.get("FullName", code)),
-                    "team": str(info.get("TeamName", "")),
-                    "color": color,
-                }
-        except Exception as e:
-            logger.warning("failed_to_build_driver_info", error=str(e))
-        return driver_num_to_code, driver_info
-
-    def _lookup_driver_position(
-        self,
-        *,
-        lap_row: Any,
-        driver_pos_df: Any,
-        normalize_fn: Any,
-    ) -> Optional[Dict[str, Any]]:
-        """Return normalised (x, y) + race data for a driver at the midpoint of a lap row."""
-        lap_start = lap_row.get("LapStartTime")
-        lap_time_val = lap_row.get("LapTime")
-
-        if pd.isna(lap_start):
-            return None
-
-        try:
-            mid_time = lap_start + lap_time_val / 2 if pd.notna(lap_time_val) else lap_start
-            # pos_data has an integer index; search on the SessionTime column
-            # Filter NaT values before searching to avoid type comparison errors
-            valid_pos = driver_pos_df[driver_pos_df["SessionTime"].notna()]
-            if len(valid_pos) == 0:
-                return None
-            idx = int(valid_pos["SessionTime"].searchsorted(mid_time))
-            idx = min(idx, len(valid_pos) - 1)
-
-            row = valid_pos.iloc[idx]
-            x = float(row.get("X", float("nan")))
-            y = float(row.get("Y", float("nan")))
-
-            if not np.isfinite(x) or not np.isfinite(y):
-                return None
-
-            nx, ny = normalize_fn(x, y)
-            position_val = lap_row.get("Position")
-            compound_val = lap_row.get("Compound")
-            laptime_val = lap_row.get("LapTime")
-
-            return {
-                "x": nx,
-                "y": ny,
-                "position": int(position_val) if pd.notna(position_val) else None,
-                "compound": str(compound_val) if pd.notna(compound_val) else None,
-                "lap_time_s": float(laptime_val.total_seconds()) if pd.notna(laptime_val) else None,
-            }
-        except Exception:
-            return None
-
-    def _process_single_lap(
-        self,
-        *,
-        lap_slice: Any,
-        pos_data_by_num: Dict[str, Any],
-        driver_num_to_code: Dict[str, str],
-        normalize_fn: Any,
-    ) -> Dict[str, Any]:
-        """Process a single lap slice, returning a dict of driver code → position entry."""
-        drivers: Dict[str, Any] = {}
-        for _, lap_row in lap_slice.iterrows():
-            raw_num = lap_row.get("DriverNumber")
-            if pd.isna(raw_num):
-                continue
-            driver_num = str(int(raw_num))
-            code = driver_num_to_code.get(driver_num, str(lap_row.get("Driver", driver_num)))
-            driver_pos_df = pos_data_by_num.get(driver_num)
-            if driver_pos_df is None or len(driver_pos_df) == 0:
-                continue
-            entry = self._lookup_driver_position(
-                lap_row=lap_row,
-                driver_pos_df=driver_pos_df,
-                normalize_fn=normalize_fn,
-            )
-            if entry is not None:
-                drivers[code] = entry
-        return drivers
-
-    def _build_frames(
-        self,
-        *,
-        laps_df: Any,
-        pos_data_by_num: Dict[str, Any],
-        driver_num_to_code: Dict[str, str],
-        normalize_fn: Any,
-        total_laps: int,
-    ) -> List[Dict[str, Any]]:
-        """Iterate over laps and build per-lap position frames."""
-        frames: List[Dict[str, Any]] = []
-        for lap_num in range(1, total_laps + 1):
-            lap_slice = laps_df[laps_df["LapNumber"] == lap_num]
-            if len(lap_slice) == 0:
-                continue
-            drivers = self._process_single_lap(
-                lap_slice=lap_slice,
-                pos_data_by_num=pos_data_by_num,
-                driver_num_to_code=driver_num_to_code,
-                normalize_fn=normalize_fn,
-            )
-            if drivers:
-                frames.append({"lap": lap_num, "drivers": drivers})
-        return frames
-
+    @cached_build("fastf1:lap_positions:{year}:{race}")
     async def get_lap_positions(self, year: int, race: int | str) -> Dict[str, Any]:
         """Get driver positions per lap for race replay — uses session.pos_data for efficiency"""
-        cache_key = f"fastf1:lap_positions:{year}:{race}"
-
-        cached = await get_cache(cache_key)
-        if cached:
-            logger.info("cache_hit", key=cache_key)
-            return cached
-
-        logger.info("cache_miss", key=cache_key)
-
         try:
-            session = await self.get_session(year, race, "R")
-
-            # Reload with telemetry so session.pos_data is populated for all drivers
-            await self._run_sync(functools.partial(session.load, laps=True, telemetry=True))
-
-            # Get coordinate normalisation bounds from fastest lap
-            fastest = session.laps.pick_fastest()
-            ref_pos = await self._run_sync(fastest.get_pos_data)
-            x_ref = ref_pos["X"].values.astype(float)
-            y_ref = ref_pos["Y"].values.astype(float)
-            valid = np.isfinite(x_ref) & np.isfinite(y_ref)
-            x_ref, y_ref = x_ref[valid], y_ref[valid]
-
-            x_min = float(x_ref.min())
-            y_min = float(y_ref.min())
-            scale = float(max(x_ref.max() - x_min, y_ref.max() - y_min, 1.0))
-
-            def _normalize(x: float, y: float) -> Tuple[float, float]:
-                return (
-                    round((x - x_min) / scale * 1000, 1),
-                    round((y - y_min) / scale * 1000, 1),
-                )
-
-            driver_num_to_code, driver_info = self._build_driver_mapping(session)
-
-            laps_df = session.laps
-            total_laps = int(laps_df["LapNumber"].max()) if len(laps_df) > 0 else 0
-            pos_data_by_num: Dict[str, Any] = getattr(session, "pos_data", {}) or {}
-
-            frames = self._build_frames(
-                laps_df=laps_df,
-                pos_data_by_num=pos_data_by_num,
-                driver_num_to_code=driver_num_to_code,
-                normalize_fn=_normalize,
-                total_laps=total_laps,
+            # Telemetry profile so session.pos_data is populated for all drivers
+            replay = await self._build(
+                PRIORITY_REPLAY, fastf1_jobs.replay_frames, year, race, "R", "telemetry"
             )
-
-            result = {
-                "year": year,
-                "race": race,
-                "total_laps": total_laps,
-                "frames": frames,
-                "drivers": driver_info,
-            }
-
-            await set_cache(cache_key, result, settings.FASTF1_CACHE_TTL)
-            return result
-
+            return {"year": year, "race": race, **replay}
         except Exception as e:
             logger.error("failed_to_fetch_lap_positions", year=year, race=race, error=str(e))
             raise
@@ -0,0 +1,311 @@
+"""Vectorized conversions from FastF1 DataFrames to API payloads"""
+
+import math
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.utils.downsample import lttb_indices, resample_uniform
+
+# Telemetry sampling defaults used by downsample_telemetry
+DEFAULT_TELEMETRY_STRIDE = 10
+DEFAULT_TELEMETRY_POINTS = 500
+
+# Telemetry channels that hold discrete states and must not be interpolated
+_STEP_CHANNELS = ("Brake", "nGear", "DRS")
+_TELEMETRY_COLUMNS = ("Speed", "Throttle", "Brake", "nGear", "RPM", "DRS")
+
+
+def _mask_nan(values: np.ndarray) -> List[Any]:
+    """Convert a float array to a list of Python floats with NaN replaced by None"""
+    out = values.astype(object)
+    out[np.isnan(values)] = None
+    return out.tolist()
+
+
+def _seconds_or_none(series: pd.Series) -> List[Optional[float]]:
+    """Convert a timedelta column to seconds, once per column.
+
+    Mirrors ``Timedelta.total_seconds()`` (whole seconds plus microseconds / 1e6) so the
+    floats are bit-for-bit identical to the per-row conversion.
+    """
+    timedeltas = pd.to_timedelta(series)
+    micros = timedeltas.to_numpy(dtype="timedelta64[ns]").astype(np.int64) // 1000
+    whole_seconds, micro_part = np.divmod(micros, 1_000_000)
+    seconds = whole_seconds + micro_part / 1e6
+    seconds[timedeltas.isna().to_numpy()] = np.nan
+    return _mask_nan(seconds)
+
+
+def _int_or_none(series: pd.Series) -> List[Optional[int]]:
+    """Convert a numeric column to Python ints with NaN replaced by None"""
+    values = series.to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+    out = np.full(len(values), None, dtype=object)
+    out[valid] = values[valid].astype(np.int64).tolist()
+    return out.tolist()
+
+
+def _object_or_none(series: pd.Series) -> List[Any]:
+    """Column values as Python objects with NaN/None replaced by None"""
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+def _timedelta_strings(timedeltas: pd.Series) -> List[Optional[str]]:
+    """Format a timedelta column like ``str(Timedelta)`` with NaT replaced by None.
+
+    Components are split with array maths; only the final string assembly is per element,
+    which avoids pandas building a Timedelta object for every value.
+    """
+    nanos = timedeltas.to_numpy(dtype="timedelta64[ns]").astype(np.int64)
+    missing = timedeltas.isna().to_numpy()
+    days, rest = np.divmod(nanos, 86_400 * 10**9)
+    hours, rest = np.divmod(rest, 3_600 * 10**9)
+    minutes, rest = np.divmod(rest, 60 * 10**9)
+    seconds, fraction = np.divmod(rest, 10**9)
+
+    strings: List[Optional[str]] = []
+    for is_missing, raw, d, h, m, sec, frac in zip(
+        missing.tolist(),
+        nanos.tolist(),
+        days.tolist(),
+        hours.tolist(),
+        minutes.tolist(),
+        seconds.tolist(),
+        fraction.tolist(),
+    ):
+        if is_missing:
+            strings.append(None)
+        elif raw < 0:
+            # Negative durations use pandas' signed layout; never seen for lap timing
+            strings.append(str(pd.Timedelta(raw)))
+        elif frac == 0:
+            strings.append(f"{d} days {h:02}:{m:02}:{sec:02}")
+        elif frac % 1000:
+            strings.append(f"{d} days {h:02}:{m:02}:{sec:02}.{frac:09}")
+        else:
+            strings.append(f"{d} days {h:02}:{m:02}:{sec:02}.{frac // 1000:06}")
+    return strings
+
+
+def laps_to_records(laps: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert a FastF1 laps table to the lap-times payload, column by column"""
+    lap_time = pd.to_timedelta(laps["LapTime"])
+
+    columns = {
+        "driver": laps["Driver"].tolist(),
+        "lap_number": _int_or_none(laps["LapNumber"]),
+        "lap_time": _timedelta_strings(lap_time),
+        "lap_time_seconds": _seconds_or_none(lap_time),
+        "sector1_time": _seconds_or_none(laps["Sector1Time"]),
+        "sector2_time": _seconds_or_none(laps["Sector2Time"]),
+        "sector3_time": _seconds_or_none(laps["Sector3Time"]),
+        "compound": _object_or_none(laps["Compound"]),
+        "tyre_life": _int_or_none(laps["TyreLife"]),
+        "stint": _int_or_none(laps["Stint"]),
+        # Truthiness of each value, as bool() per row: None is False but NaN is True
+        "is_personal_best": laps["IsPersonalBest"].to_numpy().astype(bool).tolist(),
+    }
+
+    return columns_to_rows(columns)
+
+
+def downsample_telemetry(
+    telemetry: pd.DataFrame, sampling: str = "stride", resolution: Optional[int] = None
+) -> pd.DataFrame:
+    """Reduce lap telemetry to about ``resolution`` samples.
+
+    - ``stride``: every n-th sample (every 10th when no resolution is given)
+    - ``distance``: resampled onto a uniform distance grid
+    - ``lttb``: shape-preserving selection on the speed trace
+    """
+    if sampling == "stride":
+        if resolution is None:
+            step = DEFAULT_TELEMETRY_STRIDE
+        else:
+            step = max(1, math.ceil(len(telemetry) / resolution))
+        return telemetry.iloc[::step]
+
+    resolution = resolution or DEFAULT_TELEMETRY_POINTS
+    distance = telemetry["Distance"].to_numpy(dtype=float)
+
+    if sampling == "lttb":
+        speed = telemetry["Speed"].to_numpy(dtype=float)
+        valid = np.isfinite(distance) & np.isfinite(speed)
+        frame = telemetry[valid]
+        return frame.iloc[lttb_indices(distance[valid], speed[valid], resolution)]
+
+    if sampling == "distance":
+        valid = np.isfinite(distance)
+        frame = telemetry[valid]
+        # Distance is integrated from speed and can jitter backwards by a few mm
+        grid_source = np.maximum.accumulate(distance[valid])
+        resampled = resample_uniform(
+            grid_source,
+            {column: frame[column].to_numpy() for column in _TELEMETRY_COLUMNS},
+            resolution,
+            step_channels=_STEP_CHANNELS,
+        )
+        resampled["Distance"] = resampled.pop("x")
+        return pd.DataFrame(resampled)
+
+    raise ValueError(f"Unknown telemetry sampling method: {sampling}")
+
+
+def telemetry_to_columns(telemetry: pd.DataFrame) -> Dict[str, List[Any]]:
+    """Convert FastF1 telemetry samples to one list per channel (struct-of-arrays)"""
+    return {
+        "distance": _mask_nan(telemetry["Distance"].to_numpy(dtype=float)),
+        "speed": _mask_nan(telemetry["Speed"].to_numpy(dtype=float)),
+        "throttle": _mask_nan(telemetry["Throttle"].to_numpy(dtype=float)),
+        "brake": telemetry["Brake"].fillna(False).astype(bool).tolist(),
+        "gear": _int_or_none(telemetry["nGear"]),
+        "rpm": _mask_nan(telemetry["RPM"].to_numpy(dtype=float)),
+        "drs": _int_or_none(telemetry["DRS"]),
+    }
+
+
+def columns_to_rows(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Convert a struct-of-arrays payload to a list of per-sample dicts"""
+    keys = list(columns)
+    return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
+
+def build_replay_frames(
+    laps: pd.DataFrame,
+    pos_data_by_num: Dict[str, pd.DataFrame],
+    driver_num_to_code: Dict[str, str],
+    *,
+    x_min: float,
+    y_min: float,
+    scale: float,
+    total_laps: int,
+) -> List[Dict[str, Any]]:
+    """Build per-lap replay frames with each driver's normalised position at mid-lap.
+
+    Each driver's position data is cleaned once, all lap midpoints are computed as one
+    column and resolved against it with a single ``searchsorted`` per driver (first
+    position sample at or after the midpoint, clamped to the last sample).
+    """
+    lap_numbers = laps["LapNumber"].to_numpy(dtype=float)
+    usable = (
+        laps["DriverNumber"].notna().to_numpy()
+        & laps["LapStartTime"].notna().to_numpy()
+        & (lap_numbers >= 1)
+        & (lap_numbers <= total_laps)
+        & (lap_numbers == np.floor(lap_numbers))
+    )
+    laps = laps[usable]
+    if len(laps) == 0:
+        return []
+
+    driver_nums = laps["DriverNumber"].map(lambda num: str(int(num)))
+    lap_start = pd.to_timedelta(laps["LapStartTime"])
+    lap_time = pd.to_timedelta(laps["LapTime"])
+    mid_time = (lap_start + lap_time / 2).where(lap_time.notna(), lap_start)
+    mid_ns = mid_time.to_numpy(dtype="timedelta64[ns]").astype(np.int64)
+
+    x = np.full(len(laps), np.nan)
+    y = np.full(len(laps), np.nan)
+    for num, rows in laps.groupby(driver_nums.to_numpy(), sort=False).indices.items():
+        pos = pos_data_by_num.get(num)
+        if pos is None or len(pos) == 0:
+            continue
+        valid = pos["SessionTime"].notna().to_numpy()
+        if not valid.any():
+            continue
+        times = pos["SessionTime"].to_numpy(dtype="timedelta64[ns]")[valid].astype(np.int64)
+        idx = np.minimum(np.searchsorted(times, mid_ns[rows], side="left"), len(times) - 1)
+        x[rows] = pos["X"].to_numpy(dtype=float)[valid][idx]
+        y[rows] = pos["Y"].to_numpy(dtype=float)[valid][idx]
+
+    found = np.isfinite(x) & np.isfinite(y)
+    order = np.argsort(lap_numbers[usable][found], kind="stable")
+    laps = laps[found].iloc[order]
+
+    codes = driver_nums[found].iloc[order].map(driver_num_to_code)
+    codes = codes.fillna(laps["Driver"].astype(str))
+    compounds = laps["Compound"].to_numpy(dtype=object)
+    compounds = [str(c) if pd.notna(c) else None for c in compounds]
+
+    columns = zip(
+        laps["LapNumber"].to_numpy(dtype=float).astype(np.int64).tolist(),
+        codes.tolist(),
+        np.round((x[found][order] - x_min) / scale * 1000, 1).tolist(),
+        np.round((y[found][order] - y_min) / scale * 1000, 1).tolist(),
+        _int_or_none(laps["Position"]),
+        compounds,
+        _seconds_or_none(laps["LapTime"]),
+    )
+
+    frames: List[Dict[str, Any]] = []
+    for lap_number, code, nx, ny, position, compound, lap_time_s in columns:
+        if not frames or frames[-1]["lap"] != lap_number:
+            frames.append({"lap": lap_number, "drivers": {}})
+        frames[-1]["drivers"][code] = {
+            "x": nx,
+            "y": ny,
+            "position": position,
+            "compound": compound,
+            "lap_time_s": lap_time_s,
+        }
+    return frames
+
+
+def build_stint_table(laps: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Summarise each driver's stints with a single groupby pass.
+
+    Rows are ordered by each driver's first appearance, then by stint appearance, matching
+    the lap table order.
+    """
+    laps = laps[laps["Driver"].notna() & laps["Stint"].notna()]
+    if len(laps) == 0:
+        return []
+
+    frame = pd.DataFrame(
+        {
+            "Driver": laps["Driver"],
+            "Stint": laps["Stint"],
+            "LapNumber": laps["LapNumber"],
+            "LapTime": pd.to_timedelta(laps["LapTime"]),
+            "TyreLife": laps["TyreLife"],
+        }
+    )
+    stints = frame.groupby(["Driver", "Stint"], sort=False).agg(
+        start_lap=("LapNumber", "min"),
+        end_lap=("LapNumber", "max"),
+        num_laps=("LapNumber", "size"),
+        avg_lap_time=("LapTime", "mean"),
+        median_lap_time=("LapTime", "median"),
+        best_lap_time=("LapTime", "min"),
+        tyre_life_start=("TyreLife", "min"),
+        tyre_life_end=("TyreLife", "max"),
+    )
+
+    # Compound as reported on the first lap of each stint
+    first_laps = laps.drop_duplicates(["Driver", "Stint"]).set_index(["Driver", "Stint"])
+    compounds = first_laps["Compound"].reindex(stints.index)
+
+    driver_order = {driver: i for i, driver in enumerate(laps["Driver"].unique())}
+    order = np.argsort(
+        [driver_order[driver] for driver in stints.index.get_level_values("Driver")],
+        kind="stable",
+    )
+    stints = stints.iloc[order]
+    compounds = compounds.iloc[order]
+
+    columns = {
+        "driver": stints.index.get_level_values("Driver").tolist(),
+        "stint": stints.index.get_level_values("Stint").astype(np.int64).tolist(),
+        "compound": [c if pd.notna(c) else None for c in compounds.tolist()],
+        "start_lap": _int_or_none(stints["start_lap"]),
+        "end_lap": _int_or_none(stints["end_lap"]),
+        "num_laps": stints["num_laps"].astype(np.int64).tolist(),
+        "avg_lap_time": _seconds_or_none(stints["avg_lap_time"]),
+        "median_lap_time": _seconds_or_none(stints["median_lap_time"]),
+        "best_lap_time": _seconds_or_none(stints["best_lap_time"]),
+        "tyre_life_start": _int_or_none(stints["tyre_life_start"]),
+        "tyre_life_end": _int_or_none(stints["tyre_life_end"]),
+    }
+    return columns_to_rows(columns)
@@ -1,32 +1,111 @@
 """Jolpica F1 service for schedule, standings, and results"""
 
 import asyncio
+import math
 from datetime import date
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 
 import httpx
 import structlog
 from fastf1 import get_session
 
 from app.core.config import settings
-from app.utils.cache import get_cache, set_cache
+from app.services.ttl_policy import (
+    find_race,
+    race_tags,
+    round_ttl,
+    season_ttl,
+    session_start,
+)
+from app.utils.cache import (
+    get_cache,
+    get_many,
+    get_negative,
+    get_negative_many,
+    get_validators,
+    keep_for_revalidation,
+    negative_ttl,
+    restore_revalidated,
+    set_cache,
+    set_many,
+    set_negative,
+)
+from app.utils.admission import ServiceOverloaded
+from app.utils.http_client import RetryTransport
+from app.utils.rate_limiter import RateLimiter, retry_after_seconds
 
 logger = structlog.get_logger()
 
+K = TypeVar("K")
+V = TypeVar("V")
+
+# Marks a failed item in gather_bounded
+_FAILED = object()
+
+
+def missing_rounds(round_numbers: Iterable[int], results: Dict[int, Any]) -> List[int]:
+    """Rounds get_race_results_many failed to fetch; rounds without results are not missing"""
+    return [round_number for round_number in round_numbers if round_number not in results]
+
+
+def _has_races(data: Dict[str, Any]) -> bool:
+    return bool(data.get("MRData", {}).get("RaceTable", {}).get("Races"))
+
+
+def _validators(response: httpx.Response) -> Dict[str, str]:
+    """ETag and Last-Modified of a response, for conditional requests"""
+    validators: Dict[str, str] = {}
+    if "etag" in response.headers:
+        validators["etag"] = response.headers["etag"]
+    if "last-modified" in response.headers:
+        validators["last_modified"] = response.headers["last-modified"]
+    return validators
+
+
+# A round missing from the season-wide results has none yet
+_NO_RACES: Dict[str, Any] = {"MRData": {"total": "0", "RaceTable": {"Races": []}}}
+
 
 class JolpicaService:
     """Service for Jolpica F1 API"""
 
     BASE_URL = "https://api.jolpi.ca/ergast/f1"
-    TIMEOUT = 10.0
+    # Largest page the API serves
+    RESULTS_PAGE_SIZE = 100
+    # From this many uncached rounds on, fetch the whole season instead of each round
+    SEASON_FETCH_MIN_ROUNDS = 3
 
     def __init__(self):
         self.client: Optional[httpx.AsyncClient] = None
+        self.transport: Optional[RetryTransport] = None
+        self.revalidation = {"conditional": 0, "not_modified": 0}
+        self.limiter = RateLimiter(
+            "jolpica",
+            buckets=[
+                (settings.JOLPICA_RATE_PER_SECOND, settings.JOLPICA_RATE_BURST),
+                (settings.JOLPICA_RATE_PER_HOUR / 3600, settings.JOLPICA_RATE_PER_HOUR),
+            ],
+            background_reserve=settings.JOLPICA_RATE_BACKGROUND_RESERVE,
+            max_wait=settings.JOLPICA_RATE_MAX_WAIT,
+        )
 
     async def get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client"""
+        """Get or create HTTP client (created in the app lifespan, or on first use)"""
         if self.client is None:
-            self.client = httpx.AsyncClient(timeout=self.TIMEOUT)
+            self.transport = RetryTransport(
+                limits=httpx.Limits(
+                    max_connections=settings.JOLPICA_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.JOLPICA_HTTP_MAX_KEEPALIVE,
+                    keepalive_expiry=settings.JOLPICA_HTTP_KEEPALIVE_EXPIRY,
+                ),
+                http2=settings.JOLPICA_HTTP2,
+                retries=settings.JOLPICA_HTTP_RETRIES,
+                backoff=settings.JOLPICA_HTTP_RETRY_BACKOFF,
+                acquire=self.limiter.acquire,
+            )
+            self.client = httpx.AsyncClient(
+                transport=self.transport, timeout=settings.JOLPICA_HTTP_TIMEOUT
+            )
         return self.client
 
     async def close(self) -> None:
@@ -34,30 +113,156 @@ class JolpicaService:
         if self.client:
             await self.client.aclose()
             self.client = None
+            self.transport = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return HTTP connection pool and request counters"""
+        return {
+            "http": self.transport.stats() if self.transport else None,
+            "revalidation": dict(self.revalidation),
+            "rate_limit": self.limiter.stats(),
+        }
 
     async def _fetch_with_cache(
-        self, cache_key: str, url: str, ttl: Optional[int] = None
+        self,
+        cache_key: str,
+        url: str,
+        tags: Optional[List[str]] = None,
+        season: Optional[int] = None,
+        session: Optional[Tuple[int, int, str]] = None,
     ) -> Dict[str, Any]:
-        """Fetch data with caching"""
+        """Fetch data with caching, registering the entry under the given invalidation tags.
+
+        The TTL follows the schedule (app.services.ttl_policy) of the ``season`` a document
+        covers, or of the (season, round, session name) ``session`` it is about. A session
+        document without races yet gets a negative entry until the session starts instead,
+        and ``{}`` is returned while it lasts.
+
+        With JOLPICA_REVALIDATE_WINDOW set, documents served with an ETag or Last-Modified are
+        kept for that long past their TTL and then refreshed with a conditional request: a 304
+        puts the kept copy back for another TTL without downloading, parsing or encoding it
+        again. The kept copy costs as much Redis memory as the document itself.
+        """
         # Try cache first
         cached = await get_cache(cache_key)
-        if cached:
+        if cached is not None:
             logger.info("cache_hit", key=cache_key)
             return cached
+        if session is not None and await get_negative(cache_key) is not None:
+            return {}
 
-        # Fetch from API
+        # Fetch from API, conditionally when an earlier copy was kept
         logger.info("cache_miss", key=cache_key, url=url)
-        client = await self.get_client()
-        response = await client.get(url)
-        response.raise_for_status()
+        window = settings.JOLPICA_REVALIDATE_WINDOW
+        validators = await get_validators(cache_key) if window else None
+        response = await self._request(url, validators)
+        if response.status_code == 304:
+            self.revalidation["not_modified"] += 1
+            ttl = await self._ttl(season, session)
+            data = await restore_revalidated(cache_key, ttl, ttl + window, tags)
+            if data is not None:
+                logger.info("cache_revalidated", key=cache_key, ttl=ttl)
+                return data
+            # The kept copy is gone
+            response = await self._request(url)
         data = response.json()
+        if session is not None and not _has_races(data):
+            await set_negative(cache_key, "no_races", await self._negative_ttl(*session), tags)
+            return data
 
         # Cache result
-        cache_ttl = ttl or settings.JOLPICA_CACHE_TTL
-        await set_cache(cache_key, data, cache_ttl)
+        ttl = await self._ttl(season, session)
+        await set_cache(cache_key, data, ttl, tags)
+        validators = _validators(response) if window else {}
+        if validators:
+            await keep_for_revalidation(cache_key, validators, ttl + window, tags)
 
         return data
 
+    async def _ttl(self, season: Optional[int], session: Optional[Tuple[int, int, str]]) -> int:
+        """Schedule-aware TTL of a document about a season or a session"""
+        if session is not None:
+            season, round_number, session_name = session
+            return await round_ttl(season, round_number, settings.JOLPICA_CACHE_TTL, session_name)
+        if season is not None:
+            return season_ttl(season, settings.JOLPICA_CACHE_TTL)
+        return settings.JOLPICA_CACHE_TTL
+
+    async def _negative_ttl(self, season: int, round_number: int, session: str) -> int:
+        """Negative-entry TTL for a session: until it starts, going by the schedule"""
+        race = find_race(await self.get_schedule(season), round_number)
+        return negative_ttl(session_start(race, session) if race else None)
+
+    async def gather_bounded(
+        self,
+        items: Iterable[K],
+        fetch: Callable[[K], Awaitable[V]],
+        limit: Optional[int] = None,
+        **log_context: Any,
+    ) -> Dict[K, V]:
+        """Run fetch(item) for every item concurrently, at most ``limit`` at a time.
+
+        ``limit`` defaults to JOLPICA_MAX_CONCURRENCY. Items are isolated from each other: a
+        failing item is logged (with ``log_context``) and left out of the result, which is
+        keyed by item in the order given. ServiceOverloaded (the rate limit is exhausted)
+        propagates instead. Callers must treat a missing key as a failure: aggregates built
+        from partial results list what is missing (e.g. ``missing_rounds``) and are only
+        cached briefly (see ttl_policy.is_partial).
+        """
+        semaphore = asyncio.Semaphore(limit or settings.JOLPICA_MAX_CONCURRENCY)
+
+        async def run(item: K) -> Any:
+            async with semaphore:
+                try:
+                    return await fetch(item)
+                except ServiceOverloaded:
+                    raise
+                except Exception as e:
+                    logger.warning("jolpica_fetch_failed", item=item, error=str(e), **log_context)
+                    return _FAILED
+
+        items = list(items)
+        outcomes = await asyncio.gather(*(run(item) for item in items))
+        return {item: outcome for item, outcome in zip(items, outcomes) if outcome is not _FAILED}
+
+    async def _fetch(self, url: str) -> Dict[str, Any]:
+        """Fetch and parse a JSON document from the API"""
+        return (await self._request(url)).json()
+
+    async def _request(
+        self, url: str, validators: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """GET a document from the API, conditionally when validators are given.
+
+        Every request takes a token from the shared rate limit first. A 429 pauses the limit
+        for all workers for its Retry-After (or an exponential backoff) and is retried up to
+        JOLPICA_RATE_LIMIT_RETRIES times, then raises ServiceOverloaded. A 304 is returned
+        as is; other error statuses raise.
+        """
+        headers: Dict[str, str] = {}
+        if validators:
+            self.revalidation["conditional"] += 1
+            if "etag" in validators:
+                headers["If-None-Match"] = validators["etag"]
+            if "last_modified" in validators:
+                headers["If-Modified-Since"] = validators["last_modified"]
+        client = await self.get_client()
+        for attempt in range(settings.JOLPICA_RATE_LIMIT_RETRIES + 1):
+            await self.limiter.acquire()
+            response = await client.get(url, headers=headers)
+            if response.status_code != 429:
+                break
+            delay = retry_after_seconds(response.headers.get("retry-after"))
+            if delay is None:
+                delay = settings.JOLPICA_RATE_LIMIT_BACKOFF * 2**attempt
+            logger.warning("jolpica_rate_limited", url=url, attempt=attempt, retry_after=delay)
+            await self.limiter.pause(delay)
+        else:
+            raise ServiceOverloaded("jolpica", retry_after=max(1, math.ceil(delay)))
+        if response.status_code != 304 or not validators:
+            response.raise_for_status()
+        return response
+
     async def get_current_season(self) -> int:
         """Get current F1 season year"""
         from datetime import datetime
@@ -73,7 +278,9 @@ class JolpicaService:
         url = f"{self.BASE_URL}/{season}.json"
 
         try:
-            data = await self._fetch_with_cache(cache_key, url)
+            data = await self._fetch_with_cache(
+                cache_key, url, tags=[f"season:{season}"], season=season
+            )
             races = data.get("MRData", {}).get("RaceTable", {}).get("Races", [])
             return races
         except Exception as e:
@@ -127,7 +334,9 @@ class JolpicaService:
         url = f"{self.BASE_URL}/{season}/driverStandings.json"
 
         try:
-            data = await self._fetch_with_cache(cache_key, url)
+            data = await self._fetch_with_cache(
+                cache_key, url, tags=[f"season:{season}"], season=season
+            )
             standings_lists = (
                 data.get("MRData", {}).get("StandingsTable", {}).get("StandingsLists", [])
             )
@@ -149,7 +358,9 @@ class JolpicaService:
         url = f"{self.BASE_URL}/{season}/constructorStandings.json"
 
         try:
-            data = await self._fetch_with_cache(cache_key, url)
+            data = await self._fetch_with_cache(
+                cache_key, url, tags=[f"season:{season}"], season=season
+            )
             standings_lists = (
                 data.get("MRData", {}).get("StandingsTable", {}).get("StandingsLists", [])
             )
@@ -168,7 +379,12 @@ class JolpicaService:
         url = f"{self.BASE_URL}/{season}/{round_number}/results.json"
 
         try:
-            data = await self._fetch_with_cache(cache_key, url)
+            data = await self._fetch_with_cache(
+                cache_key,
+                url,
+                tags=race_tags(season, round_number),
+                session=(season, round_number, "Race"),
+            )
             races = data.get("MRData", {}).get("RaceTable", {}).get("Races", [])
             # Handle empty races list (e.g., race hasn't happened yet)
             if not races:
@@ -181,13 +397,157 @@ class JolpicaService:
             )
             raise
 
+    async def get_season_results(self, season: int) -> Dict[int, Dict[str, Any]]:
+        """Get race results of every round of a season, keyed by round number.
+
+        get_race_results_many over the season schedule: with a cold cache the results come
+        from the paginated season-wide endpoint, a few requests instead of one per round.
+        Rounds that failed to fetch are left out (see missing_rounds).
+        """
+        schedule = await self.get_schedule(season)
+        return await self.get_race_results_many(season, [int(race["round"]) for race in schedule])
+
+    async def get_race_results_many(
+        self, season: int, round_numbers: List[int]
+    ) -> Dict[int, Dict[str, Any]]:
+        """Get race results for several rounds of a season, keyed by round number.
+
+        All rounds are looked up in the cache with one round trip and only the missing ones
+        are fetched from the API: from the season-wide endpoint when at least
+        SEASON_FETCH_MIN_ROUNDS are missing, otherwise per round through gather_bounded.
+        Fetched rounds are cached under their per-round keys. Like get_race_results, a round
+        without results maps to {} and gets a negative entry; a round that fails to fetch is
+        logged and left out, which missing_rounds reports.
+        """
+        cache_keys = {r: f"jolpica:results:{season}:{r}" for r in round_numbers}
+        cached = await get_many(list(cache_keys.values()))
+        missing = [key for key in cache_keys.values() if key not in cached]
+        # Rounds known to have no results yet (e.g. future races) are not fetched again
+        negative = await get_negative_many(missing) if missing else {}
+
+        season_documents: Optional[Dict[int, Dict[str, Any]]] = None
+        if len(missing) - len(negative) >= self.SEASON_FETCH_MIN_ROUNDS:
+            try:
+                season_documents = await self._fetch_season_results(season)
+            except Exception as e:
+                # Fall back to fetching round by round
+                logger.warning("failed_to_fetch_season_results", season=season, error=str(e))
+
+        per_round: Dict[int, Dict[str, Any]] = {}
+        if season_documents is None:
+
+            async def fetch_round(round_number: int) -> Dict[str, Any]:
+                logger.info("cache_miss", key=cache_keys[round_number])
+                return await self._fetch(f"{self.BASE_URL}/{season}/{round_number}/results.json")
+
+            to_fetch = [
+                r for r, key in cache_keys.items() if key not in cached and key not in negative
+            ]
+            per_round = await self.gather_bounded(to_fetch, fetch_round, season=season)
+
+        documents: Dict[int, Dict[str, Any]] = {}
+        fetched: Dict[str, Any] = {}
+        fetched_tags: Dict[str, List[str]] = {}
+        for round_number, cache_key in cache_keys.items():
+            data = cached.get(cache_key)
+            if data is None and cache_key in negative:
+                data = {}
+            if data is None and season_documents is not None:
+                data = season_documents.get(round_number, _NO_RACES)
+            elif data is None:
+                data = per_round.get(round_number)
+                if data is None:
+                    # Failed to fetch, already logged
+                    continue
+            if cache_key not in cached and cache_key not in negative:
+                tags = race_tags(season, round_number)
+                if _has_races(data):
+                    fetched[cache_key] = data
+                    fetched_tags[cache_key] = tags
+                else:
+                    ttl = await self._negative_ttl(season, round_number, "Race")
+                    await set_negative(cache_key, "no_races", ttl, tags)
+            documents[round_number] = data
+
+        # Rounds settle at different times, so their TTLs differ
+        by_ttl: Dict[int, Dict[str, Any]] = {}
+        for round_number, cache_key in cache_keys.items():
+            if cache_key in fetched:
+                ttl = await round_ttl(season, round_number, settings.JOLPICA_CACHE_TTL)
+                by_ttl.setdefault(ttl, {})[cache_key] = fetched[cache_key]
+        for ttl, values in by_ttl.items():
+            await set_many(values, ttl, tags=fetched_tags)
+        logger.info(
+            "race_results_batch",
+            season=season,
+            rounds=len(cache_keys),
+            fetched=len(fetched),
+            negative=len(negative),
+        )
+
+        results: Dict[int, Dict[str, Any]] = {}
+        for round_number, data in documents.items():
+            races = data.get("MRData", {}).get("RaceTable", {}).get("Races", [])
+            results[round_number] = races[0] if races else {}
+        return results
+
+    async def _fetch_season_results(self, season: int) -> Dict[int, Dict[str, Any]]:
+        """Fetch all race results of a season from the paginated season-wide endpoint.
+
+        The first page gives the total; the remaining pages are fetched concurrently through
+        gather_bounded, and any of them failing fails the whole fetch. A race split across two
+        pages is merged back together. Returns documents shaped like the
+        per-round results response, for the rounds that have results.
+        """
+        url = f"{self.BASE_URL}/{season}/results.json"
+        first = await self._fetch(f"{url}?limit={self.RESULTS_PAGE_SIZE}&offset=0")
+        total = int(first.get("MRData", {}).get("total", 0))
+        limit = int(first.get("MRData", {}).get("limit", self.RESULTS_PAGE_SIZE))
+        offsets = range(limit, total, limit)
+        rest = await self.gather_bounded(
+            offsets,
+            lambda offset: self._fetch(f"{url}?limit={limit}&offset={offset}"),
+            season=season,
+        )
+        if len(rest) < len(offsets):
+            raise RuntimeError(f"{len(offsets) - len(rest)} season results pages failed")
+
+        races: Dict[int, Dict[str, Any]] = {}
+        for page in [first, *rest.values()]:
+            for race in page.get("MRData", {}).get("RaceTable", {}).get("Races", []):
+                round_number = int(race["round"])
+                if round_number in races:
+                    races[round_number]["Results"].extend(race.get("Results", []))
+                else:
+                    races[round_number] = {**race, "Results": list(race.get("Results", []))}
+        logger.info("season_results_fetched", season=season, pages=1 + len(rest), rounds=len(races))
+
+        return {
+            round_number: {
+                "MRData": {
+                    "total": str(len(race["Results"])),
+                    "RaceTable": {
+                        "season": str(season),
+                        "round": str(round_number),
+                        "Races": [race],
+                    },
+                }
+            }
+            for round_number, race in races.items()
+        }
+
     async def get_qualifying_results(self, season: int, round_number: int) -> Dict[str, Any]:
         """Get qualifying results for a specific round"""
         cache_key = f"jolpica:qualifying:{season}:{round_number}"
         url = f"{self.BASE_URL}/{season}/{round_number}/qualifying.json"
 
         try:
-            data = await self._fetch_with_cache(cache_key, url)
+            data = await self._fetch_with_cache(
+                cache_key,
+                url,
+                tags=race_tags(season, round_number),
+                session=(season, round_number, "Qualifying"),
+            )
             races = data.get("MRData", {}).get("RaceTable", {}).get("Races", [])
             # Handle empty races list (e.g., qualifying hasn't happened yet)
             if not races:
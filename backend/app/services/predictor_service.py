@@ -5,9 +5,11 @@ from typing import Any, Dict, List, Optional
 
 import structlog
 
+from app.core.config import settings
 from app.services.jolpica_service import jolpica_service
 from app.services.profile_service import profile_service
-from app.utils.cache import get_cache, set_cache
+from app.services.ttl_policy import by_round, tags_by_race
+from app.utils.cache import cached
 
 logger = structlog.get_logger()
 
@@ -18,20 +20,15 @@ class PredictorService:
     def __init__(self):
         pass
 
+    @cached(
+        "predictor:template:{year}:{round_number}",
+        ttl=by_round(settings.DERIVED_CACHE_TTL, race="round_number"),
+        tags=tags_by_race(race="round_number"),
+    )
     async def get_prediction_template(
         self, year: int, round_number: int
     ) -> Dict[str, Any]:
         """Get template for making predictions for a race"""
-        cache_key = f"predictor:template:{year}:{round_number}"
-
-        # Try cache first
-        cached = await get_cache(cache_key)
-        if cached:
-            logger.info("cache_hit", key=cache_key)
-            return cached
-
-        logger.info("cache_miss", key=cache_key)
-
         try:
             # Get race info
             schedule = await jolpica_service.get_schedule(year)
@@ -82,9 +79,6 @@ class PredictorService:
                         if driver["driver_id"] == driver_id:
                             driver["qualifying_position"] = int(result["position"])
 
-            # Cache result
-            await set_cache(cache_key, template, 3600)
-
             return template
 
         except Exception as e:
@@ -186,20 +180,15 @@ class PredictorService:
             )
             raise
 
+    @cached(
+        "predictor:ai:{year}:{round_number}",
+        ttl=by_round(settings.DERIVED_CACHE_TTL, race="round_number"),
+        tags=tags_by_race(race="round_number"),
+    )
     async def get_ai_prediction(
         self, year: int, round_number: int
     ) -> Dict[str, Any]:
         """Generate AI-based race prediction using historical data"""
-        cache_key = f"predictor:ai:{year}:{round_number}"
-
-        # Try cache first
-        cached = await get_cache(cache_key)
-        if cached:
-            logger.info("cache_hit", key=cache_key)
-            return cached
-
-        logger.info("cache_miss", key=cache_key)
-
         try:
             # Get current standings
             standings = await jolpica_service.get_driver_standings(year)
@@ -272,9 +261,6 @@ class PredictorService:
                 ],
             }
 
-            # Cache result
-            await set_cache(cache_key, result, 3600)
-
             return result
 
         except Exception as e:
@@ -4,9 +4,11 @@ from typing import Any, Dict, List, Optional
 
 import structlog
 
+from app.core.config import settings
 from app.services.fastf1_service import fastf1_service
-from app.services.jolpica_service import jolpica_service
-from app.utils.cache import get_cache, set_cache
+from app.services.jolpica_service import jolpica_service, missing_rounds
+from app.services.ttl_policy import by_season
+from app.utils.cache import cached
 
 logger = structlog.get_logger()
 
@@ -23,17 +25,15 @@ class ProfileService:
         """Get comprehensive driver profile with stats and history"""
         if season is None:
             season = await jolpica_service.get_current_season()
-
-        cache_key = f"profile:driver:{driver_id}:{season}"
-
-        # Try cache first
-        cached = await get_cache(cache_key)
-        if cached:
-            logger.info("cache_hit", key=cache_key)
-            return cached
-
-        logger.info("cache_miss", key=cache_key)
-
+        return await self._get_driver_profile(driver_id, season)
+
+    @cached(
+        "profile:driver:{driver_id}:{season}",
+        ttl=by_season(settings.DERIVED_CACHE_TTL),
+        tags=("season:{season}",),
+    )
+    async def _get_driver_profile(self, driver_id: str, season: int) -> Dict[str, Any]:
+        """Get comprehensive driver profile with stats and history (season already resolved)"""
         try:
             # Get current standings
             standings = await jolpica_service.get_driver_standings(season)
@@ -46,6 +46,7 @@ class ProfileService:
 
             # Get race results for the season
             schedule = await jolpica_service.get_schedule(season)
+            season_results = await jolpica_service.get_season_results(season)
             race_results = []
             podiums = 0
             dnfs = 0
@@ -54,7 +55,7 @@ class ProfileService:
             for race in schedule:
                 round_num = int(race["round"])
                 try:
-                    results = await jolpica_service.get_race_results(season, round_num)
+                    results = season_results.get(round_num)
                     if results and "Results" in results:
                         driver_result = next(
                             (r for r in results["Results"] if r["Driver"]["driverId"] == driver_id),
@@ -101,20 +102,22 @@ class ProfileService:
                     "position": int(driver_standing["position"]),
                     "points": float(driver_standing["points"]),
                     "wins": int(driver_standing["wins"]),
-                    "team": driver_standing["Constructors"][0]
-                    if driver_standing["Constructors"]
-                    else None,
+                    "team": (
+                        driver_standing["Constructors"][0]
+                        if driver_standing["Constructors"]
+                        else None
+                    ),
                     "podiums": podiums,
                     "dnfs": dnfs,
                     "races_entered": len(race_results),
                 },
                 "race_results": race_results,
                 "career": career_stats,
+                "missing_rounds": missing_rounds(
+                    [int(race["round"]) for race in schedule], season_results
+                ),
             }
 
-            # Cache result
-            await set_cache(cache_key, profile_data, 3600)
-
             return profile_data
 
         except Exception as e:
@@ -132,17 +135,15 @@ class ProfileService:
         """Get comprehensive team/constructor profile"""
         if season is None:
             season = await jolpica_service.get_current_season()
-
-        cache_key = f"profile:team:{constructor_id}:{season}"
-
-        # Try cache first
-        cached = await get_cache(cache_key)
-        if cached:
-            logger.info("cache_hit", key=cache_key)
-            return cached
-
-        logger.info("cache_miss", key=cache_key)
-
+        return await self._get_team_profile(constructor_id, season)
+
+    @cached(
+        "profile:team:{constructor_id}:{season}",
+        ttl=by_season(settings.DERIVED_CACHE_TTL),
+        tags=("season:{season}",),
+    )
+    async def _get_team_profile(self, constructor_id: str, season: int) -> Dict[str, Any]:
+        """Get comprehensive team/constructor profile (season already resolved)"""
         try:
             # Get constructor standings
             standings = await jolpica_service.get_constructor_standings(season)
@@ -169,12 +170,13 @@ class ProfileService:
 
             # Get race results for the season
             schedule = await jolpica_service.get_schedule(season)
+            season_results = await jolpica_service.get_season_results(season)
             race_results = []
 
             for race in schedule:
                 round_num = int(race["round"])
                 try:
-                    results = await jolpica_service.get_race_results(season, round_num)
+                    results = season_results.get(round_num)
                     if results and "Results" in results:
                         team_results = [
                             {
@@ -214,11 +216,11 @@ class ProfileService:
                     "drivers": team_drivers,
                 },
                 "race_results": race_results,
+                "missing_rounds": missing_rounds(
+                    [int(race["round"]) for race in schedule], season_results
+                ),
             }
 
-            # Cache result
-            await set_cache(cache_key, profile_data, 3600)
-
             return profile_data
 
         except Exception as e:
@@ -239,12 +241,17 @@ class ProfileService:
             "total_points": 0,
             "championships": 0,
             "seasons": [],
+            "missing_seasons": [],
         }
 
-        # Check last 5 seasons
-        for year in range(current_season - 4, current_season + 1):
+        # Check last 5 seasons; a season that fails to load is logged and listed as missing
+        seasons = range(current_season - 4, current_season + 1)
+        season_standings = await jolpica_service.gather_bounded(
+            seasons, jolpica_service.get_driver_standings, driver=driver_id
+        )
+        career_data["missing_seasons"] = [year for year in seasons if year not in season_standings]
+        for year, standings in season_standings.items():
             try:
-                standings = await jolpica_service.get_driver_standings(year)
                 driver_standing = next(
                     (s for s in standings if s["Driver"]["driverId"] == driver_id),
                     None,
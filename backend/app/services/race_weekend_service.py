@@ -1,16 +1,42 @@
 """Race Weekend Hub Service - Aggregates all data for a race weekend"""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 import structlog
+from fastf1.req import RateLimitExceededError
 
+from app.core.config import settings
 from app.services.fastf1_service import fastf1_service
 from app.services.jolpica_service import jolpica_service
-from app.utils.cache import get_cache, set_cache
+from app.services.ttl_policy import by_round, race_tags, session_start, tags_by_race
+from app.utils.admission import ServiceOverloaded
+from app.utils.cache import cached, get_negative, negative_ttl, set_negative
 
 logger = structlog.get_logger()
 
+# FastF1 failures that say nothing about whether the session has data (network errors,
+# timeouts, FastF1's own rate limit): no negative entry, the next build tries again
+_TRANSIENT_ERRORS = (OSError, RateLimitExceededError)
+
+
+def _hub_ttl(default: int) -> Callable[[Dict[str, Any], Dict[str, Any]], Awaitable[int]]:
+    """Schedule-aware hub TTL, capped at the default while a section is missing.
+
+    A settled round is otherwise kept for the historical TTL, so a hub built while Jolpica
+    or FastF1 failed (or FastF1 was shed) would never be rebuilt.
+    """
+    by_schedule = by_round(default, race="round_number")
+
+    async def ttl(arguments: Dict[str, Any], hub: Dict[str, Any]) -> int:
+        seconds = await by_schedule(arguments, hub)
+        sections = ("results", "qualifying", "pit_stops", "fastest_laps")
+        if not all(hub.get(section) for section in sections):
+            return min(seconds, default)
+        return seconds
+
+    return ttl
+
 
 class RaceWeekendService:
     """Service for aggregating race weekend data"""
@@ -18,6 +44,15 @@ class RaceWeekendService:
     def __init__(self):
         pass
 
+    # Fresh for up to 5 minutes while the weekend is upcoming or live or a section is
+    # missing (longer once it has settled), then served stale while one caller rebuilds it
+    @cached(
+        "race_weekend:hub:{year}:{round_number}",
+        ttl=_hub_ttl(settings.RACE_WEEKEND_CACHE_TTL),
+        stale_ttl=900,
+        early_refresh=1.0,
+        tags=tags_by_race(race="round_number"),
+    )
     async def get_race_weekend_hub(
         self, year: int, round_number: int
     ) -> Dict[str, Any]:
@@ -31,84 +66,89 @@ class RaceWeekendService:
         - Circuit info
         - Key stats
         """
-        cache_key = f"race_weekend:hub:{year}:{round_number}"
-
-        # Try cache first
-        cached = await get_cache(cache_key)
-        if cached:
-            logger.info("cache_hit", key=cache_key)
-            return cached
-
-        logger.info("cache_miss", key=cache_key)
-
         try:
-            # Get race information from schedule
-            schedule = await jolpica_service.get_schedule(year)
-            race_info = next(
-                (race for race in schedule if race.get("round") == str(round_number)),
-                None,
+            return await self._build_race_weekend_hub(year, round_number)
+        except Exception as e:
+            logger.error(
+                "failed_to_fetch_race_weekend_hub",
+                year=year,
+                round=round_number,
+                error=str(e),
             )
+            raise
 
-            if not race_info:
-                raise ValueError(f"Race not found: {year} round {round_number}")
-
-            # Build comprehensive weekend data
-            weekend_data = {
-                "year": year,
-                "round": round_number,
-                "race_info": race_info,
-                "sessions": await self._get_session_schedule(race_info),
-                "results": None,
-                "qualifying": None,
-                "sprint": None,
-                "fastest_laps": {},
-                "pit_stops": None,
-                "weather": None,
-                "status": await self._determine_weekend_status(race_info),
-            }
-
-            # Try to get results if race has happened
-            try:
-                results = await jolpica_service.get_race_results(year, round_number)
-                if results:
-                    weekend_data["results"] = results
-            except Exception as e:
-                logger.debug("no_race_results", year=year, round=round_number, error=str(e))
+    async def _build_race_weekend_hub(self, year: int, round_number: int) -> Dict[str, Any]:
+        """Build the race weekend hub payload from Jolpica and FastF1 data"""
+        logger.info("race_weekend_hub_build", year=year, round=round_number)
+
+        # Get race information from schedule
+        schedule = await jolpica_service.get_schedule(year)
+        race_info = next(
+            (race for race in schedule if race.get("round") == str(round_number)),
+            None,
+        )
+
+        if not race_info:
+            raise ValueError(f"Race not found: {year} round {round_number}")
+
+        # Build comprehensive weekend data
+        weekend_data = {
+            "year": year,
+            "round": round_number,
+            "race_info": race_info,
+            "sessions": await self._get_session_schedule(race_info),
+            "results": None,
+            "qualifying": None,
+            "sprint": None,
+            "fastest_laps": {},
+            "pit_stops": None,
+            "weather": None,
+            "status": await self._determine_weekend_status(race_info),
+        }
 
-            # Try to get qualifying results
-            try:
-                qualifying = await jolpica_service.get_qualifying_results(year, round_number)
-                if qualifying:
-                    weekend_data["qualifying"] = qualifying
-            except Exception as e:
-                logger.debug("no_qualifying_results", year=year, round=round_number, error=str(e))
+        # Try to get results if race has happened
+        try:
+            results = await jolpica_service.get_race_results(year, round_number)
+            if results:
+                weekend_data["results"] = results
+        except ServiceOverloaded:
+            # Rate limited: fail the build rather than cache a hub without results
+            raise
+        except Exception as e:
+            logger.debug("no_race_results", year=year, round=round_number, error=str(e))
+
+        # Try to get qualifying results
+        try:
+            qualifying = await jolpica_service.get_qualifying_results(year, round_number)
+            if qualifying:
+                weekend_data["qualifying"] = qualifying
+        except ServiceOverloaded:
+            raise
+        except Exception as e:
+            logger.debug("no_qualifying_results", year=year, round=round_number, error=str(e))
 
-            # Try to get FastF1 data (fastest laps, pit stops)
+        # Try to get FastF1 data (fastest laps, pit stops). A session that failed to load is
+        # not tried again until it is due to have data (negative cache entry)
+        fastf1_key = f"fastf1:session:{year}:{round_number}:R"
+        if await get_negative(fastf1_key) is None:
             try:
                 fastest_lap = await fastf1_service.get_fastest_lap(year, round_number, "R")
                 weekend_data["fastest_laps"]["race"] = fastest_lap
-            except Exception as e:
-                logger.debug("no_fastf1_race_data", year=year, round=round_number, error=str(e))
-
-            try:
                 stints = await fastf1_service.get_stint_data(year, round_number, "R")
                 weekend_data["pit_stops"] = await self._process_pit_stops(stints)
+            except (ServiceOverloaded, *_TRANSIENT_ERRORS) as e:
+                # Says nothing about the session; try again on the next build
+                logger.warning("fastf1_unavailable", year=year, round=round_number, error=str(e))
             except Exception as e:
-                logger.debug("no_stint_data", year=year, round=round_number, error=str(e))
-
-            # Cache result for 5 minutes (data can change during race weekend)
-            await set_cache(cache_key, weekend_data, 300)
-
-            return weekend_data
-
-        except Exception as e:
-            logger.error(
-                "failed_to_fetch_race_weekend_hub",
-                year=year,
-                round=round_number,
-                error=str(e),
-            )
-            raise
+                logger.debug("no_fastf1_race_data", year=year, round=round_number, error=str(e))
+                await set_negative(
+                    fastf1_key,
+                    str(e),
+                    negative_ttl(session_start(race_info)),
+                    tags=race_tags(year, round_number),
+                )
+
+        return weekend_data
 
     async def _get_session_schedule(self, race_info: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract session schedule from race info"""
@@ -4,8 +4,10 @@ from typing import Any, Dict, List, Optional
 
 import structlog
 
+from app.core.config import settings
 from app.services.fastf1_service import fastf1_service
-from app.utils.cache import get_cache, set_cache
+from app.services.ttl_policy import by_round, tags_by_race
+from app.utils.cache import cached
 
 logger = structlog.get_logger()
 
@@ -16,20 +18,15 @@ class StrategyService:
     def __init__(self):
         pass
 
+    @cached(
+        "strategy:race:{year}:{race}",
+        ttl=by_round(settings.DERIVED_CACHE_TTL),
+        tags=tags_by_race(),
+    )
     async def analyze_race_strategy(
         self, year: int, race: int | str
     ) -> Dict[str, Any]:
         """Comprehensive pit stop strategy analysis for a race"""
-        cache_key = f"strategy:race:{year}:{race}"
-
-        # Try cache first
-        cached = await get_cache(cache_key)
-        if cached:
-            logger.info("cache_hit", key=cache_key)
-            return cached
-
-        logger.info("cache_miss", key=cache_key)
-
         try:
             # Get stint data
             stints = await fastf1_service.get_stint_data(year, race, "R")
@@ -59,9 +56,6 @@ class StrategyService:
                 "summary": self._generate_summary(driver_strategies, compound_analysis),
             }
 
-            # Cache result
-            await set_cache(cache_key, analysis, 3600)
-
             return analysis
 
         except Exception as e:
@@ -73,20 +67,15 @@ class StrategyService:
             )
             raise
 
+    @cached(
+        "strategy:driver:{year}:{race}:{driver}",
+        ttl=by_round(settings.DERIVED_CACHE_TTL),
+        tags=tags_by_race(),
+    )
     async def analyze_driver_strategy(
         self, year: int, race: int | str, driver: str
     ) -> Dict[str, Any]:
         """Detailed strategy analysis for a specific driver"""
-        cache_key = f"strategy:driver:{year}:{race}:{driver}"
-
-        # Try cache first
-        cached = await get_cache(cache_key)
-        if cached:
-            logger.info("cache_hit", key=cache_key)
-            return cached
-
-        logger.info("cache_miss", key=cache_key)
-
         try:
             # Get driver's stints
             all_stints = await fastf1_service.get_stint_data(year, race, "R")
@@ -115,9 +104,6 @@ class StrategyService:
                 "stint_performance": stint_performance,
             }
 
-            # Cache result
-            await set_cache(cache_key, analysis, 3600)
-
             return analysis
 
         except Exception as e:
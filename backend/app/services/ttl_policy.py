@@ -0,0 +1,206 @@
+"""Schedule-aware cache TTLs.
+
+Data about a race weekend goes through three phases:
+
+- upcoming: nothing final exists yet, so entries expire when the session starts (and never
+  outlive the caller's default TTL);
+- live: from the session start until CACHE_SETTLE_SECONDS after the race, data keeps
+  changing and is cached for at most CACHE_LIVE_TTL;
+- settled: results are final and cached for CACHE_HISTORICAL_TTL.
+
+Seasons before the current year are settled as a whole.
+
+Data about a round is tagged for invalidation by its round number (``race:{season}:{round}``),
+whether the caller named the race by number or by name.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import structlog
+from fastf1.internals.fuzzy import fuzzy_matcher
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+# FastF1 session identifiers to the schedule keys of Jolpica race entries
+SESSION_NAMES = {
+    "R": "Race",
+    "Q": "Qualifying",
+    "S": "Sprint",
+    "SQ": "SprintQualifying",
+    "SS": "SprintShootout",
+    "FP1": "FirstPractice",
+    "FP2": "SecondPractice",
+    "FP3": "ThirdPractice",
+}
+
+
+def session_start(race: Dict[str, Any], session: str = "Race") -> Optional[datetime]:
+    """UTC start of a session ("Race", "Qualifying", "Sprint", ...) of a schedule entry"""
+    info = race if session == "Race" else race.get(session)
+    if not info or not info.get("date"):
+        return None
+    start = datetime.fromisoformat(f"{info['date']}T{info.get('time') or '00:00:00Z'}")
+    return start if start.tzinfo else start.replace(tzinfo=timezone.utc)
+
+
+def find_race(schedule: List[Dict[str, Any]], race: int | str) -> Optional[Dict[str, Any]]:
+    """Schedule entry for a round number or a race/location name, as FastF1 resolves them.
+
+    A round number, or a name equal to exactly one race's name, locality or country, is
+    matched directly; anything else goes through FastF1's own fuzzy event search, which
+    always picks a race. Returns None only for an empty schedule or an unknown round.
+    """
+    name = str(race).strip().casefold()
+    for entry in schedule:
+        if entry.get("round") == name:
+            return entry
+    if not schedule or name.isdigit():
+        return None
+    features = [_match_features(entry) for entry in schedule]
+    exact = [entry for entry, strings in zip(schedule, features) if name in strings[:3]]
+    if len(exact) == 1:
+        return exact[0]
+    index, _ = fuzzy_matcher(_strip_common_words(name, schedule[0]), features)
+    return schedule[index]
+
+
+def _strip_common_words(name: str, entry: Dict[str, Any]) -> str:
+    """A name without the words FastF1 ignores when matching events"""
+    name = name.casefold()
+    for word in ("formula 1", str(entry.get("season", "")), "grand prix", "gp"):
+        if word:
+            name = name.replace(word, "")
+    return name.strip()
+
+
+def _match_features(entry: Dict[str, Any]) -> List[str]:
+    """Race name, locality and country of a schedule entry, then the name as FastF1 matches it.
+
+    The same number of strings for every entry, as fuzzy_matcher requires.
+    """
+    location = entry.get("Circuit", {}).get("Location", {})
+    race_name = entry.get("raceName", "").casefold()
+    return [
+        race_name,
+        location.get("locality", "").casefold(),
+        location.get("country", "").casefold(),
+        _strip_common_words(race_name, entry),
+    ]
+
+
+def season_ttl(season: int, default: int, now: Optional[datetime] = None) -> int:
+    """TTL for data about a whole season"""
+    now = now or datetime.now(timezone.utc)
+    return settings.CACHE_HISTORICAL_TTL if season < now.year else default
+
+
+def race_ttl(
+    race: Dict[str, Any], default: int, session: str = "R", now: Optional[datetime] = None
+) -> int:
+    """TTL for data about one session of a schedule entry (the race unless given)"""
+    now = now or datetime.now(timezone.utc)
+    race_start = session_start(race)
+    if race_start is None:
+        return default
+    if now >= race_start + timedelta(seconds=settings.CACHE_SETTLE_SECONDS):
+        return settings.CACHE_HISTORICAL_TTL
+
+    start = session_start(race, SESSION_NAMES.get(session.upper(), session)) or race_start
+    if now < start:
+        return int(max(1, min(default, (start - now).total_seconds())))
+    return min(default, settings.CACHE_LIVE_TTL)
+
+
+async def _schedule(season: int) -> Optional[List[Dict[str, Any]]]:
+    """The season schedule, or None when it cannot be loaded"""
+    # Imported here: the Jolpica service itself uses this module for its TTLs
+    from app.services.jolpica_service import jolpica_service
+
+    try:
+        return await jolpica_service.get_schedule(season)
+    except Exception as e:
+        logger.warning("ttl_policy_schedule_unavailable", season=season, error=str(e))
+        return None
+
+
+async def round_ttl(season: int, race: int | str, default: int, session: str = "R") -> int:
+    """TTL for data about a round, looked up in the season schedule"""
+    schedule = await _schedule(season)
+    if schedule is None:
+        return default
+
+    entry = find_race(schedule, race)
+    if entry is None:
+        return season_ttl(season, default)
+    return race_ttl(entry, default, session)
+
+
+def race_tags(season: int, round_number: int | str) -> List[str]:
+    """Invalidation tags of data about a round, given its round number"""
+    return [f"race:{season}:{round_number}", f"season:{season}"]
+
+
+async def resolve_race_tags(season: int, race: int | str) -> List[str]:
+    """race_tags for a round number or a race/location name, as FastF1 accepts them.
+
+    Names are resolved to the round number through the schedule (see find_race); while the
+    schedule is unavailable they are tagged by their lowercased name.
+    """
+    if isinstance(race, int) or str(race).strip().isdigit():
+        return race_tags(season, int(race))
+    schedule = await _schedule(season)
+    entry = find_race(schedule, race) if schedule is not None else None
+    return race_tags(season, entry["round"] if entry else str(race).strip().lower())
+
+
+def by_round(
+    default: int, season: str = "year", race: str = "race", session: Optional[str] = None
+) -> Callable[[Dict[str, Any], Any], Awaitable[int]]:
+    """@cached TTL policy reading the season, race and session from the call's arguments"""
+
+    async def ttl(arguments: Dict[str, Any], value: Any) -> int:
+        session_type = arguments.get(session, "R") if session else "R"
+        return await round_ttl(arguments[season], arguments[race], default, session_type)
+
+    return ttl
+
+
+def tags_by_race(
+    season: str = "year", race: str = "race"
+) -> Callable[[Dict[str, Any]], Awaitable[List[str]]]:
+    """@cached tags reading the season and race from the call's arguments"""
+
+    async def tags(arguments: Dict[str, Any]) -> List[str]:
+        return await resolve_race_tags(arguments[season], arguments[race])
+
+    return tags
+
+
+# Keys under which aggregates list the inputs that failed to load
+PARTIAL_KEYS = ("missing_rounds", "missing_seasons")
+
+
+def is_partial(value: Any) -> bool:
+    """Whether an aggregate, or a dict nested in it, lists inputs that failed to load"""
+    if not isinstance(value, dict):
+        return False
+    return any(value.get(key) for key in PARTIAL_KEYS) or any(
+        is_partial(nested) for nested in value.values()
+    )
+
+
+def by_season(default: int, season: str = "season") -> Callable[[Dict[str, Any], Any], int]:
+    """@cached TTL policy reading the season from the call's arguments.
+
+    A partial value (see is_partial) is kept for at most the default, so an aggregate built
+    while some rounds failed to load is rebuilt soon rather than kept with the season.
+    """
+
+    def ttl(arguments: Dict[str, Any], value: Any) -> int:
+        seconds = season_ttl(arguments[season], default)
+        return min(seconds, default) if is_partial(value) else seconds
+
+    return ttl
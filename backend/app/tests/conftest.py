@@ -0,0 +1,17 @@
+"""Shared test fixtures"""
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+
+from app.utils import cache
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Point the cache at an empty in-memory Redis, with empty in-process tiers"""
+    client = FakeRedis(server=FakeServer())
+    monkeypatch.setattr(cache, "redis_client", client)
+    cache.memory_cache.clear()
+    yield client
+    cache.memory_cache.clear()
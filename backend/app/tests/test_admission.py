@@ -0,0 +1,52 @@
+"""Tests for admission control"""
+
+import asyncio
+
+import pytest
+
+from app.utils.admission import AdmissionController, ServiceOverloaded
+
+
+def test_waiters_run_by_priority():
+    """Test queued operations start in priority order once a slot frees up"""
+    admission = AdmissionController("test", max_concurrent=1, max_queue=10)
+    order = []
+
+    async def work(name: str, priority: int):
+        async with admission.slot(priority):
+            order.append(name)
+            await asyncio.sleep(0.01)
+
+    async def main():
+        first = asyncio.create_task(work("first", 5))
+        await asyncio.sleep(0)
+        await asyncio.gather(work("replay", 2), work("laps", 0), work("telemetry", 1), first)
+
+    asyncio.run(main())
+    assert order == ["first", "laps", "telemetry", "replay"]
+    stats = admission.stats()
+    assert stats["active"] == 0
+    assert stats["queued"] == 3
+    assert stats["wait_seconds_max"] > 0
+
+
+def test_full_queue_rejects_immediately():
+    """Test callers beyond the queue limit get ServiceOverloaded with a retry hint"""
+    admission = AdmissionController("test", max_concurrent=1, max_queue=1)
+
+    async def work():
+        async with admission.slot():
+            await asyncio.sleep(0.05)
+
+    async def main():
+        running = [asyncio.create_task(work()) for _ in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(ServiceOverloaded) as exc_info:
+            await work()
+        await asyncio.gather(*running)
+        return exc_info.value
+
+    error = asyncio.run(main())
+    assert error.retry_after >= 1
+    assert admission.stats()["rejected"] == 1
+    assert admission.stats()["admitted"] == 2
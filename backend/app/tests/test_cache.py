@@ -0,0 +1,258 @@
+"""Tests for the cache helpers"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+from app.core.config import settings
+from app.services.jolpica_service import jolpica_service
+from app.services.ttl_policy import session_start, tags_by_race
+from app.utils import cache
+from app.utils.cache import (
+    _refresh_early,
+    _unlink,
+    cached,
+    get_many,
+    get_or_compute,
+    invalidate_tags,
+    negative_ttl,
+    set_cache,
+    set_many,
+)
+from app.utils.codec import Codec
+
+
+def test_early_refresh_grows_near_expiry():
+    """Test early refresh never fires far from expiry and usually fires just before it"""
+    now = time.time()
+    entry = {"value": 1, "soft_expires": now + 60, "compute_seconds": 0.5}
+    assert not any(_refresh_early(entry, now, beta=1.0) for _ in range(1000))
+
+    entry["soft_expires"] = now + 0.01
+    assert sum(_refresh_early(entry, now, beta=1.0) for _ in range(1000)) > 900
+    assert not _refresh_early(entry, now, beta=0.0)
+
+
+def test_cached_key_includes_version_and_defaults():
+    """Test cached keys are built from bound arguments with the version after the namespace"""
+
+    class Service:
+        @cached("laps:{year}:{race}:{session_type}", ttl=60, version=3)
+        async def get_laps(self, year: int, race: str, session_type: str = "R"):
+            return []
+
+    service = Service()
+    assert Service.get_laps.cache_key(service, 2024, "monza") == "laps:v3:2024:monza:R"
+    assert Service.get_laps.cache_key(service, 2024, race=1, session_type="Q") == "laps:v3:2024:1:Q"
+
+
+def test_negative_ttl_lasts_until_session_start():
+    """Test negative entries last until the session starts, within the configured bounds"""
+    now = datetime.now(timezone.utc)
+    race = {
+        "date": (now + timedelta(hours=2)).date().isoformat(),
+        "time": (now + timedelta(hours=2)).strftime("%H:%M:%SZ"),
+        "Qualifying": {"date": (now - timedelta(days=1)).date().isoformat()},
+    }
+    assert 7000 < negative_ttl(session_start(race)) <= 7200
+    assert negative_ttl(session_start(race, "Qualifying")) == settings.NEGATIVE_CACHE_TTL
+    assert negative_ttl(session_start(race, "Sprint")) == settings.NEGATIVE_CACHE_TTL
+    assert negative_ttl(now + timedelta(days=30)) == settings.NEGATIVE_CACHE_MAX_TTL
+
+
+def test_set_cache_and_set_many_register_tags(fake_redis):
+    """Test stored keys are added to their tag sets, which live as long as their longest member"""
+
+    async def run():
+        await set_cache("a", 1, 60, ["season:2024"])
+        await set_many({"b": 2, "c": 3}, 600, {"b": ["season:2024", "race:2024:1"]})
+        return (
+            await fake_redis.smembers("tag:season:2024"),
+            await fake_redis.smembers("tag:race:2024:1"),
+            await fake_redis.ttl("tag:season:2024"),
+        )
+
+    season, race, ttl = asyncio.run(run())
+    assert season == {b"a", b"b"}
+    assert race == {b"b"}
+    assert 590 < ttl <= 600
+
+
+def test_invalidate_tags_deletes_only_tagged_keys(fake_redis):
+    """Test invalidating tags deletes their keys and the tag sets, and leaves other keys"""
+
+    async def run():
+        await set_many(
+            {"a": 1, "b": 2, "c": 3}, 60, {"a": ["race:2024:1"], "b": ["race:2024:1", "x"]}
+        )
+        count = await invalidate_tags(["race:2024:1", "missing"])
+        return count, await fake_redis.keys("*")
+
+    count, keys = asyncio.run(run())
+    assert count == 2
+    assert sorted(keys) == [b"c", b"tag:x"]
+
+
+def test_unlink_batches_deletes_and_announcements(fake_redis, monkeypatch):
+    """Test keys are unlinked in DELETE_BATCH_SIZE batches, each announced once"""
+    monkeypatch.setattr(cache, "DELETE_BATCH_SIZE", 2)
+
+    async def run():
+        keys = [f"k{i}" for i in range(5)]
+        await fake_redis.mset({key: 1 for key in keys})
+        pubsub = fake_redis.pubsub()
+        await pubsub.subscribe(cache.INVALIDATION_CHANNEL)
+        await pubsub.get_message(timeout=1)
+        await _unlink(fake_redis, keys, publish=True)
+        batches = []
+        while message := await pubsub.get_message(timeout=0.1):
+            batches.append(cache.json.loads(message["data"])["keys"])
+        return await fake_redis.exists(*keys), batches
+
+    remaining, batches = asyncio.run(run())
+    assert remaining == 0
+    assert batches == [["k0", "k1"], ["k2", "k3"], ["k4"]]
+
+
+def test_race_tags_use_the_round_number(fake_redis, monkeypatch):
+    """Test a race named by number or by name is tagged by its round number"""
+
+    async def get_schedule(season=None):
+        if season == 2025:
+            raise RuntimeError("unavailable")
+        return [{"round": "8", "raceName": "Monaco Grand Prix", "Circuit": {"circuitId": "monaco"}}]
+
+    monkeypatch.setattr(jolpica_service, "get_schedule", get_schedule)
+
+    class Service:
+        @cached("laps:{year}:{race}", ttl=60, tags=tags_by_race())
+        async def get_laps(self, year: int, race: int | str):
+            return [race]
+
+    async def run():
+        service = Service()
+        for race in (8, "Monaco", "monaco"):
+            await service.get_laps(2024, race)
+        await service.get_laps(2025, "Monaco")
+        count = await invalidate_tags(["race:2024:8"])
+        return count, await fake_redis.smembers("tag:race:2025:monaco")
+
+    count, unresolved = asyncio.run(run())
+    assert count == 3
+    assert unresolved == {b"laps:v1:2025:Monaco"}
+
+
+def test_get_many_returns_hits_in_key_order(fake_redis):
+    """Test get_many leaves misses out and returns hits in the order of the keys asked for"""
+
+    async def run():
+        await set_many({"b": 2, "a": 1}, 60)
+        await set_cache("c", 3, 60)
+        cache.memory_cache.clear()
+        return await get_many(["c", "missing", "a", "b", "a"])
+
+    found = asyncio.run(run())
+    assert found == {"c": 3, "a": 1, "b": 2}
+    assert list(found) == ["c", "a", "b"]
+
+
+def test_l1_bounds_count_the_uncompressed_size(fake_redis, monkeypatch):
+    """Test a value that compresses under the item limit is still too large for L1"""
+    monkeypatch.setattr(cache, "codec", Codec("json", "zlib", min_compress_bytes=100))
+    monkeypatch.setattr(cache.memory_cache, "max_item_bytes", 10_000)
+    value = {"laps": [{"driver": "VER", "lap_time_seconds": 92.345}] * 1000}
+    assert len(cache.codec.encode(value)) < 10_000
+
+    async def run():
+        await set_cache("big", value, 60)
+        assert cache.memory_cache.get("big") is None
+        found = await get_many(["big"])
+        assert cache.memory_cache.get("big") is None
+        await set_cache("small", {"driver": "VER"}, 60)
+        assert cache.memory_cache.get("small") == {"driver": "VER"}
+        return found
+
+    assert asyncio.run(run()) == {"big": value}
+
+
+def _computer(value):
+    """An async compute returning value (raising it if it is an exception), with its calls"""
+    calls = []
+
+    async def compute():
+        calls.append(value)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    return compute, calls
+
+
+def _entry(value, fresh_for):
+    """A get_or_compute envelope going stale fresh_for seconds from now"""
+    return {"value": value, "soft_expires": time.time() + fresh_for, "compute_seconds": 0.1}
+
+
+def test_stale_value_is_served_while_another_caller_refreshes(fake_redis):
+    """Test a stale value is served without computing while the key's lock is held elsewhere"""
+    compute, calls = _computer("new")
+
+    async def run():
+        await set_cache("k", _entry("old", -1), 60)
+        lock = fake_redis.lock("lock:k", timeout=10)
+        await lock.acquire()
+        served = await get_or_compute("k", compute, ttl=30)
+        await lock.release()
+        refreshed = await get_or_compute("k", compute, ttl=30)
+        return served, refreshed, await fake_redis.ttl("k")
+
+    served, refreshed, ttl = asyncio.run(run())
+    assert (served, refreshed) == ("old", "new")
+    assert calls == ["new"]
+    # Fresh for the TTL, then stale for as long again
+    assert 50 < ttl <= 60
+
+
+def test_failed_refresh_serves_the_stale_value(fake_redis):
+    """Test the stale value is served when its recompute raises"""
+    compute, calls = _computer(RuntimeError("upstream down"))
+
+    async def run():
+        await set_cache("k", _entry("old", -1), 60)
+        return await get_or_compute("k", compute, ttl=30)
+
+    assert asyncio.run(run()) == "old"
+    assert len(calls) == 1
+
+
+def test_waiter_reads_the_lock_holders_value(fake_redis):
+    """Test a caller finding no value waits for the lock holder and reads what it stored"""
+    compute, calls = _computer("mine")
+
+    async def run():
+        lock = fake_redis.lock("lock:k", timeout=10)
+        await lock.acquire()
+        waiter = asyncio.create_task(get_or_compute("k", compute, ttl=30, lock_wait=5))
+        await asyncio.sleep(0.05)
+        await set_cache("k", _entry("winner", 30), 60)
+        await lock.release()
+        return await waiter
+
+    assert asyncio.run(run()) == "winner"
+    assert calls == []
+
+
+def test_lock_wait_timeout_computes_unlocked(fake_redis):
+    """Test a caller that cannot get the lock within lock_wait computes the value itself"""
+    compute, calls = _computer("mine")
+
+    async def run():
+        lock = fake_redis.lock("lock:k", timeout=10)
+        await lock.acquire()
+        value = await get_or_compute("k", compute, ttl=30, lock_wait=0.2)
+        return value, await fake_redis.exists("k"), await lock.owned()
+
+    value, stored, still_held = asyncio.run(run())
+    assert value == "mine"
+    assert calls == ["mine"]
+    assert stored and still_held
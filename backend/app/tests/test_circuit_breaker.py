@@ -0,0 +1,63 @@
+"""Tests for the circuit breaker"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.utils import cache
+from app.utils.circuit_breaker import CircuitBreaker
+
+
+def test_opens_after_consecutive_failures_and_probes_once():
+    """Test the breaker opens at the threshold and lets a single trial through after reset"""
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=0.05)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert not breaker.allow()  # only one trial at a time
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.stats()["opened"] == 1
+
+
+def test_cancelled_trial_call_lets_the_next_call_probe(monkeypatch):
+    """Test a half-open trial that is cancelled does not keep Redis bypassed for good"""
+    breaker = CircuitBreaker("redis", failure_threshold=1, reset_timeout=0.01)
+    monkeypatch.setattr(cache, "redis_breaker", breaker)
+    monkeypatch.setattr(cache, "redis_client", object())
+    breaker.record_failure()
+    time.sleep(0.02)
+
+    async def hang(client):
+        await asyncio.sleep(10)
+
+    async def ok(client):
+        return "pong"
+
+    async def run():
+        # Unbounded calls are not used as the probe
+        assert await cache.redis_call("scan", ok, timeout=None) is cache.UNAVAILABLE
+        trial = asyncio.create_task(cache.redis_call("get", hang))
+        await asyncio.sleep(0)
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+        return await cache.redis_call("get", ok)
+
+    assert asyncio.run(run()) == "pong"
+    assert breaker.state == "closed"
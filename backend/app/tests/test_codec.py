@@ -0,0 +1,45 @@
+"""Tests for cache value encoding"""
+
+import json
+
+from app.utils.codec import AVAILABLE, Codec
+
+VALUE = {"laps": [{"driver": "VER", "lap_time_seconds": 92.345, "compound": None}] * 50}
+
+
+def test_legacy_json_entries_decode():
+    """Test entries stored as plain JSON text before the codec still decode"""
+    assert Codec.decode(json.dumps(VALUE).encode()) == VALUE
+
+
+def test_small_values_are_not_compressed():
+    """Test values under the threshold are stored uncompressed and round-trip"""
+    codec = Codec("json", "zlib", min_compress_bytes=1_000_000)
+    data = codec.encode(VALUE)
+    assert data[0] == 0x81
+    assert Codec.decode(data) == VALUE
+
+
+def test_large_values_are_compressed():
+    """Test values over the threshold are compressed and decode with any codec instance"""
+    codec = Codec("json", "zlib", min_compress_bytes=100)
+    data = codec.encode(VALUE)
+    assert data[0] == 0x91
+    assert len(data) < len(json.dumps(VALUE))
+    assert Codec("msgpack", "none").decode(data) == VALUE
+
+
+def test_bytes_are_stored_as_is():
+    """Test bytes values (pre-encoded bodies) round-trip as bytes, compressed when large"""
+    body = json.dumps(VALUE).encode()
+    data = Codec("msgpack", "zlib", min_compress_bytes=100).encode(body)
+    assert data[0] == 0x93
+    assert Codec.decode(data) == body
+
+
+def test_unavailable_choices_fall_back(monkeypatch):
+    """Test a codec whose compression is not installed uses zlib and reports it"""
+    monkeypatch.setitem(AVAILABLE, "zstd", False)
+    fallback = Codec("json", "zstd")
+    assert (fallback.compression, fallback.unavailable) == ("zlib", ["zstd"])
+    assert Codec("json", "lz4").unavailable == []
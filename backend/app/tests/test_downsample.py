@@ -0,0 +1,39 @@
+"""Tests for telemetry downsampling"""
+
+import numpy as np
+
+from app.utils.downsample import lttb_indices, resample_uniform
+
+
+def test_lttb_keeps_endpoints_and_spikes():
+    """Test LTTB returns the requested count and keeps a sharp peak"""
+    x = np.arange(1000, dtype=float)
+    y = np.zeros(1000)
+    y[537] = 50.0
+
+    indices = lttb_indices(x, y, 50)
+    assert len(indices) == 50
+    assert indices[0] == 0 and indices[-1] == 999
+    assert 537 in indices
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_lttb_returns_all_points_when_not_reducing():
+    """Test short traces are returned unchanged"""
+    x = np.arange(10, dtype=float)
+    assert lttb_indices(x, x, 20).tolist() == list(range(10))
+
+
+def test_resample_uniform_interpolates_and_steps():
+    """Test continuous channels are interpolated and step channels are held"""
+    x = np.array([0.0, 10.0, 20.0])
+    resampled = resample_uniform(
+        x,
+        {"speed": np.array([100.0, np.nan, 200.0]), "gear": np.array([3, 4, 5])},
+        5,
+        step_channels=("gear",),
+    )
+
+    assert resampled["x"].tolist() == [0.0, 5.0, 10.0, 15.0, 20.0]
+    assert resampled["speed"].tolist() == [100.0, 125.0, 150.0, 175.0, 200.0]
+    assert resampled["gear"].tolist() == [3, 3, 4, 4, 5]
@@ -0,0 +1,119 @@
+"""Tests for FastF1 session loading and jobs"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import fastf1
+
+from app.core.config import settings
+from app.services import fastf1_jobs
+from app.services.fastf1_service import FastF1Service
+
+PARTS = ("laps", "telemetry", "weather", "messages")
+
+
+class StubSession:
+    """Stands in for a FastF1 Session, recording the parts each load() asked for"""
+
+    def __init__(self, event, name, f1_api_support=False):
+        self.event = event
+        self.name = name
+        self.f1_api_support = f1_api_support
+        self.loads = []
+
+    def load(self, **parts):
+        self.loads.append({part for part in PARTS if parts[part]})
+
+
+def get_session(year, race, session_type):
+    return StubSession({"RoundNumber": int(race)}, "Race", f1_api_support=True)
+
+
+def test_profile_upgrades_load_a_new_session(monkeypatch):
+    """Test timing → telemetry → full upgrades never load into a session handed out before"""
+    monkeypatch.setattr(fastf1, "get_session", get_session)
+    service = FastF1Service()
+
+    async def run():
+        profiles = ("timing", "telemetry", "full", "timing")
+        return [await service.get_session(2020, 1, "R", profile) for profile in profiles]
+
+    try:
+        timing, telemetry, full, cached = asyncio.run(run())
+    finally:
+        service.shutdown()
+
+    assert timing.loads == [{"laps", "messages"}]
+    assert telemetry.loads == [{"laps", "messages", "telemetry"}]
+    assert full.loads == [set(PARTS)]
+    assert cached is full
+    assert service.session_upgrades == 2
+    assert len(service.session_cache) == 1
+
+
+def test_sessions_are_sized_off_the_event_loop(monkeypatch):
+    """Test loaded sessions are measured on the loading thread and cached with that size"""
+    threads = []
+
+    def estimate_session_bytes(session):
+        threads.append(threading.current_thread().name)
+        return 123
+
+    monkeypatch.setattr(fastf1, "get_session", get_session)
+    monkeypatch.setattr(fastf1_jobs, "estimate_session_bytes", estimate_session_bytes)
+    service = FastF1Service()
+
+    async def run():
+        await service.get_session(2020, 1, "R", "timing")
+        await service.get_session(2020, 1, "R", "telemetry")
+
+    try:
+        asyncio.run(run())
+    finally:
+        service.shutdown()
+
+    assert len(threads) == 2
+    assert all(name.startswith("fastf1") for name in threads)
+    assert service.session_cache.current_bytes == 123
+
+
+def init_stub_worker(cache_dir):
+    """Pool initializer: the real one, with FastF1 sessions replaced by stubs"""
+    fastf1_jobs.init_worker(cache_dir, max_bytes=1 << 20, max_entries=4)
+    fastf1.get_session = get_session
+
+
+def session_loads(session):
+    """A job returning the process it ran in, its session's identity and that session's loads"""
+    return os.getpid(), id(session), [sorted(parts) for parts in session.loads]
+
+
+def test_jobs_run_in_pool_processes_reusing_their_sessions(monkeypatch, tmp_path):
+    """Test process jobs load the session in the worker, reuse it there and return plain data"""
+    monkeypatch.setattr(settings, "FASTF1_EXECUTOR", "process")
+    service = FastF1Service()
+    service._processes = ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_stub_worker,
+        initargs=(str(tmp_path),),
+    )
+
+    async def run():
+        return [
+            await service._run_job(session_loads, 2020, 1, "R", profile)
+            for profile in ("timing", "timing", "full")
+        ]
+
+    try:
+        first, again, upgraded = asyncio.run(run())
+    finally:
+        service.shutdown()
+
+    assert first[0] != os.getpid()
+    assert again == first
+    assert first[2] == [["laps", "messages"]]
+    assert upgraded[2] == [["laps", "messages", "telemetry", "weather"]]
@@ -0,0 +1,272 @@
+"""Tests for FastF1 DataFrame conversions"""
+
+import numpy as np
+import pandas as pd
+
+from app.services.fastf1_transforms import (
+    build_replay_frames,
+    build_stint_table,
+    columns_to_rows,
+    downsample_telemetry,
+    laps_to_records,
+    telemetry_to_columns,
+)
+
+
+def _laps() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Driver": ["VER", "VER"],
+            "LapNumber": [1.0, 2.0],
+            "LapTime": [pd.Timedelta(seconds=92.5), pd.NaT],
+            "Sector1Time": [pd.Timedelta(seconds=28.1), pd.NaT],
+            "Sector2Time": [pd.Timedelta(seconds=33.2), pd.Timedelta(seconds=33.0)],
+            "Sector3Time": [pd.Timedelta(seconds=31.2), pd.Timedelta(seconds=31.9)],
+            "Compound": ["SOFT", "SOFT"],
+            "TyreLife": [1.0, np.nan],
+            "Stint": [1.0, 1.0],
+            "IsPersonalBest": [True, False],
+        }
+    )
+
+
+def test_laps_to_records():
+    """Test lap rows are converted with NaN/NaT mapped to None"""
+    first, second = laps_to_records(_laps())
+
+    assert first == {
+        "driver": "VER",
+        "lap_number": 1,
+        "lap_time": "0 days 00:01:32.500000",
+        "lap_time_seconds": 92.5,
+        "sector1_time": 28.1,
+        "sector2_time": 33.2,
+        "sector3_time": 31.2,
+        "compound": "SOFT",
+        "tyre_life": 1,
+        "stint": 1,
+        "is_personal_best": True,
+    }
+    assert second["lap_time"] is None
+    assert second["lap_time_seconds"] is None
+    assert second["sector1_time"] is None
+    assert second["tyre_life"] is None
+    assert type(first["lap_number"]) is int
+    assert type(first["lap_time_seconds"]) is float
+
+
+def test_laps_to_records_matches_timedelta_methods():
+    """Test formatting matches Timedelta.__str__ and total_seconds"""
+    values = [pd.Timedelta(seconds=s) for s in (0, 61, 92.083861357, 3600.001)]
+    laps = pd.concat([_laps().iloc[[0]]] * len(values), ignore_index=True)
+    laps["LapTime"] = values
+
+    records = laps_to_records(laps)
+    assert [r["lap_time"] for r in records] == [str(v) for v in values]
+    assert [r["lap_time_seconds"] for r in records] == [v.total_seconds() for v in values]
+
+
+def _legacy_laps_to_records(laps: pd.DataFrame) -> list:
+    """The row-by-row conversion laps_to_records replaced"""
+    records = []
+    for _, lap in laps.iterrows():
+        records.append(
+            {
+                "driver": lap.get("Driver"),
+                "lap_number": int(lap.get("LapNumber", 0)),
+                "lap_time": str(lap.get("LapTime")) if pd.notna(lap.get("LapTime")) else None,
+                "lap_time_seconds": (
+                    float(lap.get("LapTime").total_seconds())
+                    if pd.notna(lap.get("LapTime"))
+                    else None
+                ),
+                "sector1_time": (
+                    float(lap.get("Sector1Time").total_seconds())
+                    if pd.notna(lap.get("Sector1Time"))
+                    else None
+                ),
+                "sector2_time": (
+                    float(lap.get("Sector2Time").total_seconds())
+                    if pd.notna(lap.get("Sector2Time"))
+                    else None
+                ),
+                "sector3_time": (
+                    float(lap.get("Sector3Time").total_seconds())
+                    if pd.notna(lap.get("Sector3Time"))
+                    else None
+                ),
+                "compound": lap.get("Compound"),
+                "tyre_life": int(lap.get("TyreLife", 0)) if pd.notna(lap.get("TyreLife")) else None,
+                "stint": int(lap.get("Stint", 0)),
+                "is_personal_best": bool(lap.get("IsPersonalBest", False)),
+            }
+        )
+    return records
+
+
+def test_laps_to_records_matches_the_row_wise_conversion():
+    """Test missing compounds and personal-best flags convert like the per-row code did"""
+    laps = pd.concat([_laps()] * 2, ignore_index=True)
+    laps["Compound"] = ["SOFT", np.nan, None, "HARD"]
+    laps["IsPersonalBest"] = pd.Series([True, np.nan, None, False], dtype=object)
+
+    def legacy():
+        records = _legacy_laps_to_records(laps)
+        # A NaN compound was served as JSON null
+        for record in records:
+            if not isinstance(record["compound"], str):
+                record["compound"] = None
+        return records
+
+    records = laps_to_records(laps)
+    assert records == legacy()
+    assert [r["is_personal_best"] for r in records] == [True, True, False, False]
+    assert [r["compound"] for r in records] == ["SOFT", None, None, "HARD"]
+
+    # A float column, as pandas stores booleans with NaN
+    laps["IsPersonalBest"] = [1.0, np.nan, 0.0, np.nan]
+    assert laps_to_records(laps) == legacy()
+
+
+def test_telemetry_columns_round_trip_to_rows():
+    """Test telemetry is split per channel and expands back to per-sample rows"""
+    telemetry = pd.DataFrame(
+        {
+            "Distance": [0.0, 10.5],
+            "Speed": [280.0, 282.0],
+            "Throttle": [100.0, 99.0],
+            "Brake": [False, True],
+            "nGear": [7, 8],
+            "RPM": [11000.0, np.nan],
+            "DRS": [12.0, np.nan],
+        }
+    )
+
+    columns = telemetry_to_columns(telemetry)
+    assert columns["speed"] == [280.0, 282.0]
+    assert columns["rpm"] == [11000.0, None]
+    assert columns["drs"] == [12, None]
+
+    rows = columns_to_rows(columns)
+    assert rows[1] == {
+        "distance": 10.5,
+        "speed": 282.0,
+        "throttle": 99.0,
+        "brake": True,
+        "gear": 8,
+        "rpm": None,
+        "drs": None,
+    }
+
+
+def test_downsample_telemetry_methods():
+    """Test each sampling method honours the requested resolution"""
+    n = 2000
+    telemetry = pd.DataFrame(
+        {
+            "Distance": np.linspace(0, 5000, n),
+            "Speed": 200 + 100 * np.sin(np.linspace(0, 20, n)),
+            "Throttle": np.full(n, 100.0),
+            "Brake": np.zeros(n, dtype=bool),
+            "nGear": np.full(n, 7),
+            "RPM": np.full(n, 11000.0),
+            "DRS": np.zeros(n),
+        }
+    )
+
+    assert len(downsample_telemetry(telemetry)) == n // 10
+    assert len(downsample_telemetry(telemetry, "stride", 300)) <= 300
+    assert len(downsample_telemetry(telemetry, "lttb", 300)) == 300
+
+    grid = downsample_telemetry(telemetry, "distance", 300)
+    assert len(grid) == 300
+    assert np.allclose(np.diff(grid["Distance"]), 5000 / 299)
+    assert telemetry_to_columns(grid)["gear"][0] == 7
+
+
+def test_build_replay_frames_uses_mid_lap_position():
+    """Test positions are taken at or after mid-lap and clamped to the last sample"""
+    laps = pd.DataFrame(
+        {
+            "DriverNumber": ["1", "1", "44"],
+            "Driver": ["VER", "VER", "HAM"],
+            "LapNumber": [1.0, 2.0, 1.0],
+            "LapStartTime": pd.to_timedelta([0, 100, 0], unit="s"),
+            "LapTime": pd.to_timedelta([100, np.nan, 100], unit="s"),
+            "Position": [1.0, 1.0, 2.0],
+            "Compound": ["SOFT", "SOFT", None],
+        }
+    )
+    pos_data = {
+        "1": pd.DataFrame(
+            {
+                "SessionTime": pd.to_timedelta([0, 50, 60, np.nan], unit="s"),
+                "X": [0.0, 500.0, 600.0, 999.0],
+                "Y": [0.0, 250.0, 300.0, 999.0],
+            }
+        ),
+    }
+
+    frames = build_replay_frames(
+        laps, pos_data, {"1": "VER"}, x_min=0.0, y_min=0.0, scale=1000.0, total_laps=2
+    )
+
+    assert frames == [
+        {
+            "lap": 1,
+            "drivers": {
+                "VER": {
+                    "x": 500.0,
+                    "y": 250.0,
+                    "position": 1,
+                    "compound": "SOFT",
+                    "lap_time_s": 100.0,
+                }
+            },
+        },
+        {
+            "lap": 2,
+            "drivers": {
+                "VER": {
+                    "x": 600.0,
+                    "y": 300.0,
+                    "position": 1,
+                    "compound": "SOFT",
+                    "lap_time_s": None,
+                }
+            },
+        },
+    ]
+
+
+def test_build_stint_table():
+    """Test stints are aggregated per driver in lap-table order"""
+    laps = pd.DataFrame(
+        {
+            "Driver": ["HAM", "HAM", "HAM", "VER", "VER"],
+            "Stint": [1.0, 1.0, 2.0, 1.0, np.nan],
+            "LapNumber": [1.0, 2.0, 3.0, 1.0, 2.0],
+            "LapTime": pd.to_timedelta([90, 92, np.nan, 91, 89], unit="s"),
+            "Compound": ["MEDIUM", "MEDIUM", "HARD", "SOFT", "SOFT"],
+            "TyreLife": [3.0, 4.0, 1.0, 1.0, 2.0],
+        }
+    )
+
+    stints = build_stint_table(laps)
+
+    assert [(s["driver"], s["stint"]) for s in stints] == [("HAM", 1), ("HAM", 2), ("VER", 1)]
+    assert stints[0] == {
+        "driver": "HAM",
+        "stint": 1,
+        "compound": "MEDIUM",
+        "start_lap": 1,
+        "end_lap": 2,
+        "num_laps": 2,
+        "avg_lap_time": 91.0,
+        "median_lap_time": 91.0,
+        "best_lap_time": 90.0,
+        "tyre_life_start": 3,
+        "tyre_life_end": 4,
+    }
+    assert stints[1]["avg_lap_time"] is None
+    assert stints[2]["num_laps"] == 1
@@ -0,0 +1,72 @@
+"""Tests for the retrying HTTP transport"""
+
+import asyncio
+
+import httpx
+
+from app.utils.http_client import RetryTransport
+
+
+def _client(statuses, acquire=None):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(statuses[min(len(calls), len(statuses)) - 1])
+
+    transport = RetryTransport(
+        httpx.Limits(max_connections=4),
+        retries=2,
+        backoff=0,
+        transport=httpx.MockTransport(handler),
+        acquire=acquire,
+    )
+    return httpx.AsyncClient(transport=transport), transport, calls
+
+
+def test_retry_transport_retries_idempotent_requests():
+    """Test GETs are retried on 503 until they succeed, POSTs are not"""
+
+    async def run():
+        client, transport, calls = _client([503, 503, 200])
+        response = await client.get("https://example.test/")
+        assert response.status_code == 200
+        assert calls == ["GET", "GET", "GET"]
+        assert transport.stats()["retried"] == 2
+
+        client, _, calls = _client([503, 200])
+        response = await client.post("https://example.test/")
+        assert response.status_code == 503
+        assert calls == ["POST"]
+
+    asyncio.run(run())
+
+
+def test_retry_transport_gives_up_after_retries():
+    """Test the last response is returned once the retries are spent"""
+
+    async def run():
+        client, transport, calls = _client([502])
+        response = await client.get("https://example.test/")
+        assert response.status_code == 502
+        assert len(calls) == 3
+        assert transport.stats()["requests"] == 3
+
+    asyncio.run(run())
+
+
+def test_retries_acquire_first():
+    """Test every retry awaits acquire (the rate limit) before it is sent"""
+    acquired = []
+
+    async def acquire():
+        acquired.append(True)
+
+    async def run():
+        client, _, calls = _client([503, 504, 200], acquire)
+        response = await client.get("https://example.test/")
+        assert response.status_code == 200
+        assert len(calls) == 3
+
+    asyncio.run(run())
+    assert len(acquired) == 2
@@ -0,0 +1,183 @@
+"""Tests for the Jolpica service"""
+
+import asyncio
+
+import httpx
+
+from app.core.config import settings
+from app.services.jolpica_service import JolpicaService, _validators, missing_rounds
+from app.utils.cache import delete_cache, set_cache
+
+
+def _results(round_number):
+    """A per-round results document, with no race for round 0"""
+    races = [{"round": str(round_number), "Results": []}] if round_number else []
+    return {"MRData": {"RaceTable": {"Races": races}}}
+
+
+def test_gather_bounded_limits_concurrency_and_isolates_failures():
+    """Test fan-out keeps at most limit calls in flight and drops only the failing items"""
+    in_flight = 0
+    peak = 0
+
+    async def fetch(item: int) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if item == 3:
+            raise RuntimeError("boom")
+        return item * 10
+
+    results = asyncio.run(JolpicaService().gather_bounded(range(8), fetch, limit=2))
+
+    assert peak == 2
+    assert results == {0: 0, 1: 10, 2: 20, 4: 40, 5: 50, 6: 60, 7: 70}
+    assert list(results) == [0, 1, 2, 4, 5, 6, 7]
+    assert missing_rounds(range(8), results) == [3]
+
+
+def test_conditional_request_sends_validators_and_returns_304():
+    """Test refreshes send the kept validators and get a 304 back instead of an error"""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={}, headers={"ETag": '"v1"'})
+
+    async def run():
+        service = JolpicaService()
+        service.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        response = await service._request("https://example.test/2024.json")
+        assert _validators(response) == {"etag": '"v1"'}
+        response = await service._request("https://example.test/2024.json", _validators(response))
+        assert response.status_code == 304
+        assert seen == [None, '"v1"']
+
+    asyncio.run(run())
+
+
+def test_revalidation_copies_are_opt_in(fake_redis, monkeypatch):
+    """Test documents are kept for revalidation only with a window, as a full second copy"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"MRData": {"total": "0"}}, headers={"ETag": '"v1"'})
+
+    async def fetch(cache_key):
+        service = JolpicaService()
+        service.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        data = await service._fetch_with_cache(cache_key, "https://example.test/2020.json")
+        return data, service.revalidation, sorted(await fake_redis.keys("*" + cache_key))
+
+    async def run():
+        off = await fetch("jolpica:off")
+        monkeypatch.setattr(settings, "JOLPICA_REVALIDATE_WINDOW", 3600)
+        await fetch("jolpica:on")
+        copies = [await fake_redis.get(key) for key in ("jolpica:on", "revalidate:jolpica:on")]
+        await delete_cache("jolpica:on")
+        return off, copies, await fetch("jolpica:on")
+
+    (data, revalidation, keys), copies, (again, revalidated, kept) = asyncio.run(run())
+    assert keys == [b"jolpica:off"]
+    assert revalidation == {"conditional": 0, "not_modified": 0}
+    assert copies[0] == copies[1]
+    assert again == data
+    assert revalidated == {"conditional": 1, "not_modified": 1}
+    assert kept == [b"jolpica:on", b"revalidate:jolpica:on", b"validators:jolpica:on"]
+
+
+def test_race_results_many_fetches_only_misses(fake_redis, monkeypatch):
+    """Test cached rounds are not fetched and fetched rounds get their own TTL and tags"""
+    fetched = []
+
+    async def fetch(url):
+        round_number = int(url.split("/")[-2])
+        fetched.append(round_number)
+        if round_number == 4:
+            raise RuntimeError("boom")
+        return _results(0 if round_number == 2 else round_number)
+
+    async def get_schedule(season=None):
+        return []
+
+    async def round_ttl(season, race, default, session="R"):
+        return 100 * race
+
+    service = JolpicaService()
+    service.SEASON_FETCH_MIN_ROUNDS = 10
+    monkeypatch.setattr(service, "_fetch", fetch)
+    monkeypatch.setattr(service, "get_schedule", get_schedule)
+    monkeypatch.setattr("app.services.jolpica_service.round_ttl", round_ttl)
+
+    async def run():
+        await set_cache("jolpica:results:2020:1", _results(1), 60)
+        results = await service.get_race_results_many(2020, [3, 1, 2, 4, 5])
+        ttls = [await fake_redis.ttl(f"jolpica:results:2020:{r}") for r in (1, 3, 5)]
+        return (
+            results,
+            ttls,
+            {tag: await fake_redis.smembers(f"tag:race:2020:{tag}") for tag in (2, 3, 5)},
+        )
+
+    results, ttls, tags = asyncio.run(run())
+    assert list(results) == [3, 1, 2, 5]
+    assert [results[r].get("round") for r in (3, 1, 5)] == ["3", "1", "5"]
+    assert results[2] == {}
+    assert sorted(fetched) == [2, 3, 4, 5]
+    assert ttls[0] <= 60 and 290 < ttls[1] <= 300 and 490 < ttls[2] <= 500
+    assert tags == {
+        2: {b"negative:jolpica:results:2020:2"},
+        3: {b"jolpica:results:2020:3"},
+        5: {b"jolpica:results:2020:5"},
+    }
+
+
+def test_season_results_merges_a_race_split_across_pages(fake_redis):
+    """Test every page up to total is fetched and a race spanning two pages is merged"""
+    rows = [(1, "VER"), (1, "HAM"), (1, "LEC"), (2, "NOR"), (2, "PIA")]
+    offsets = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        limit = int(request.url.params["limit"])
+        offset = int(request.url.params["offset"])
+        offsets.append(offset)
+        races = []
+        for round_number, driver in rows[offset : offset + limit]:
+            if not races or races[-1]["round"] != str(round_number):
+                races.append({"round": str(round_number), "Results": []})
+            races[-1]["Results"].append({"Driver": {"code": driver}})
+        return httpx.Response(
+            200,
+            json={
+                "MRData": {
+                    "limit": str(limit),
+                    "offset": str(offset),
+                    "total": str(len(rows)),
+                    "RaceTable": {"Races": races},
+                }
+            },
+        )
+
+    async def run():
+        service = JolpicaService()
+        service.RESULTS_PAGE_SIZE = 2
+        service.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return await service._fetch_season_results(2024)
+
+    documents = asyncio.run(run())
+    assert sorted(offsets) == [0, 2, 4]
+    assert list(documents) == [1, 2]
+    drivers = {
+        round_number: [
+            result["Driver"]["code"]
+            for result in document["MRData"]["RaceTable"]["Races"][0]["Results"]
+        ]
+        for round_number, document in documents.items()
+    }
+    assert drivers == {1: ["VER", "HAM", "LEC"], 2: ["NOR", "PIA"]}
+    assert [document["MRData"]["total"] for document in documents.values()] == ["3", "2"]
@@ -1,8 +1,9 @@
 """Basic tests for main application"""
-import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.services.jolpica_service import jolpica_service
+from app.utils.admission import ServiceOverloaded
 
 client = TestClient(app)
 
@@ -31,3 +32,14 @@ def test_openapi_schema():
     data = response.json()
     assert "openapi" in data
 
+
+def test_load_shedding_in_an_endpoint_is_a_503(monkeypatch):
+    """Test ServiceOverloaded raised under an endpoint's error handling still gets a 503"""
+
+    async def get_schedule(season=None):
+        raise ServiceOverloaded("jolpica", retry_after=3)
+
+    monkeypatch.setattr(jolpica_service, "get_schedule", get_schedule)
+    response = client.get("/api/v1/jolpica/schedule/2024")
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "3"
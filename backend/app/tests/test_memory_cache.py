@@ -0,0 +1,42 @@
+"""Tests for the in-process L1 cache"""
+
+import time
+
+from app.utils.memory_cache import MemoryCache
+
+
+def test_entries_expire():
+    """Test values are dropped after their TTL, capped at the cache TTL"""
+    cache = MemoryCache(max_entries=10, max_bytes=1000, max_item_bytes=100, ttl=0.05)
+    cache.set("short", 1, size=1, ttl=0.01)
+    cache.set("long", 2, size=1, ttl=3600)
+    time.sleep(0.02)
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+    time.sleep(0.04)
+    assert cache.get("long") is None
+    assert cache.stats()["expirations"] == 2
+
+
+def test_size_limits_and_lru_eviction():
+    """Test the byte budget evicts least-recently-used entries and skips oversized values"""
+    cache = MemoryCache(max_entries=10, max_bytes=100, max_item_bytes=60, ttl=60)
+    cache.set("a", "a", size=40)
+    cache.set("b", "b", size=40)
+    cache.get("a")
+    cache.set("c", "c", size=40)
+    assert cache.get("b") is None
+    assert cache.get("a") == "a"
+    cache.set("huge", "huge", size=61)
+    assert cache.get("huge") is None
+    assert cache.current_bytes == 80
+
+
+def test_pattern_invalidation():
+    """Test glob patterns drop matching keys only"""
+    cache = MemoryCache(max_entries=10, max_bytes=1000, max_item_bytes=100, ttl=60)
+    for key in ("jolpica:schedule:2024", "jolpica:schedule:2025", "fastf1:laps:2024:1:R"):
+        cache.set(key, key, size=1)
+    cache.delete_pattern("jolpica:schedule:*")
+    assert len(cache) == 1
+    assert cache.get("fastf1:laps:2024:1:R") is not None
@@ -0,0 +1,113 @@
+"""Tests for the race weekend hub"""
+
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.services.fastf1_service import fastf1_service
+from app.services.jolpica_service import jolpica_service
+from app.services.race_weekend_service import race_weekend_service
+from app.utils.admission import ServiceOverloaded
+
+RACE = {"round": "1", "raceName": "Austrian Grand Prix", "date": "2020-07-05", "time": "13:10:00Z"}
+HUB_KEY = "race_weekend:v1:hub:2020:1"
+
+
+@pytest.fixture
+def jolpica(monkeypatch):
+    async def get_schedule(season=None):
+        return [RACE]
+
+    async def get_results(season, round_number):
+        return {"round": "1", "Results": []}
+
+    monkeypatch.setattr(jolpica_service, "get_schedule", get_schedule)
+    monkeypatch.setattr(jolpica_service, "get_race_results", get_results)
+    monkeypatch.setattr(jolpica_service, "get_qualifying_results", get_results)
+
+
+@pytest.mark.parametrize(
+    "error, negative",
+    [
+        (ServiceOverloaded("fastf1", 5), False),
+        (ConnectionError("reset"), False),
+        (RuntimeError("no data"), True),
+    ],
+)
+def test_degraded_hub_of_settled_round_is_rebuilt_soon(
+    fake_redis, jolpica, monkeypatch, error, negative
+):
+    """Test a hub without its FastF1 sections is kept briefly, noting only missing data"""
+
+    async def get_fastest_lap(year, race, session_type="R"):
+        raise error
+
+    monkeypatch.setattr(fastf1_service, "get_fastest_lap", get_fastest_lap)
+
+    async def run():
+        hub = await race_weekend_service.get_race_weekend_hub(2020, 1)
+        noted = await fake_redis.exists("negative:fastf1:session:2020:1:R")
+        return hub, await fake_redis.ttl(HUB_KEY), noted
+
+    hub, ttl, noted = asyncio.run(run())
+    assert hub["pit_stops"] is None
+    assert 0 < ttl <= settings.RACE_WEEKEND_CACHE_TTL + 900
+    assert bool(noted) is negative
+
+
+def _complete_fastf1(monkeypatch):
+    async def get_fastest_lap(year, race, session_type="R"):
+        return {"driver": "VER", "lap_time_seconds": 67.4}
+
+    async def get_stint_data(year, race, session_type="R"):
+        return []
+
+    monkeypatch.setattr(fastf1_service, "get_fastest_lap", get_fastest_lap)
+    monkeypatch.setattr(fastf1_service, "get_stint_data", get_stint_data)
+
+
+def test_hub_without_qualifying_is_rebuilt_soon(fake_redis, jolpica, monkeypatch):
+    """Test a hub whose qualifying results failed to load is not kept for the settled TTL"""
+    _complete_fastf1(monkeypatch)
+
+    async def get_qualifying_results(season, round_number):
+        raise RuntimeError("upstream 500")
+
+    monkeypatch.setattr(jolpica_service, "get_qualifying_results", get_qualifying_results)
+
+    async def run():
+        hub = await race_weekend_service.get_race_weekend_hub(2020, 1)
+        return hub, await fake_redis.ttl(HUB_KEY)
+
+    hub, ttl = asyncio.run(run())
+    assert hub["qualifying"] is None
+    assert 0 < ttl <= settings.RACE_WEEKEND_CACHE_TTL + 900
+
+
+def test_rate_limited_results_fail_the_build(fake_redis, jolpica, monkeypatch):
+    """Test a hub is not built, nor cached, when Jolpica sheds the results request"""
+    _complete_fastf1(monkeypatch)
+
+    async def get_race_results(season, round_number):
+        raise ServiceOverloaded("jolpica", 3)
+
+    monkeypatch.setattr(jolpica_service, "get_race_results", get_race_results)
+
+    async def run():
+        with pytest.raises(ServiceOverloaded):
+            await race_weekend_service.get_race_weekend_hub(2020, 1)
+        return await fake_redis.exists(HUB_KEY)
+
+    assert not asyncio.run(run())
+
+
+def test_complete_hub_of_settled_round_is_kept(fake_redis, jolpica, monkeypatch):
+    """Test a complete hub of a settled round gets the historical TTL"""
+    _complete_fastf1(monkeypatch)
+
+    async def run():
+        await race_weekend_service.get_race_weekend_hub(2020, 1)
+        return await fake_redis.ttl(HUB_KEY)
+
+    assert asyncio.run(run()) > settings.CACHE_HISTORICAL_TTL
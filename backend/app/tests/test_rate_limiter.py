@@ -0,0 +1,72 @@
+"""Tests for the client-side rate limiter"""
+
+import asyncio
+
+import pytest
+
+from app.utils import rate_limiter
+from app.utils.admission import ServiceOverloaded
+from app.utils.rate_limiter import (
+    RateLimiter,
+    background,
+    pause_rate_limit,
+    retry_after_seconds,
+    take_rate_token,
+)
+
+
+def test_retry_after_seconds():
+    """Test Retry-After is read as delay seconds or an HTTP date"""
+    assert retry_after_seconds("3") == 3.0
+    assert retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert retry_after_seconds("soon") is None
+    assert retry_after_seconds(None) is None
+
+
+def test_background_calls_leave_the_reserve(monkeypatch):
+    """Test background calls ask for the reserve and interactive ones give up past max_wait"""
+    reserves = []
+    waits = iter([0.0, 0.0, 30.0])
+
+    async def take_rate_token(name, buckets, reserve):
+        reserves.append(reserve)
+        return next(waits)
+
+    monkeypatch.setattr(rate_limiter, "take_rate_token", take_rate_token)
+    limiter = RateLimiter("test", [(4.0, 4)], background_reserve=0.25, max_wait=10.0)
+
+    async def run():
+        await limiter.acquire()
+        with background():
+            await limiter.acquire()
+        with pytest.raises(ServiceOverloaded):
+            await limiter.acquire()
+
+    asyncio.run(run())
+    assert reserves == [0.0, 0.25, 0.0]
+    assert limiter.stats()["acquired_background"] == 1
+    assert limiter.stats()["rejected"] == 1
+
+
+def test_tokens_are_shared_through_redis(fake_redis, monkeypatch):
+    """Test the bucket runs out across calls, pauses apply, and the script is loaded once"""
+    loads = []
+    script_load = fake_redis.script_load
+
+    async def count_loads(script):
+        loads.append(script)
+        return await script_load(script)
+
+    monkeypatch.setattr(fake_redis, "script_load", count_loads)
+
+    async def run():
+        waits = [await take_rate_token("test", [(1.0, 2)]) for _ in range(3)]
+        await pause_rate_limit("test", 30)
+        waits.append(await take_rate_token("test", [(1000.0, 1000)]))
+        return waits
+
+    waits = asyncio.run(run())
+    assert waits[:2] == [0.0, 0.0]
+    assert 0 < waits[2] <= 1.0
+    assert 29 < waits[3] <= 30
+    assert len(loads) == 1
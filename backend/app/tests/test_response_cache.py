@@ -0,0 +1,109 @@
+"""Tests for cached HTTP responses"""
+
+import asyncio
+import functools
+import json
+
+from fastapi import Request
+
+from app.services.ttl_policy import resolve_race_tags, tags_by_race
+from app.utils import cache
+from app.utils.cache import cached, invalidate_tags
+from app.utils.response_cache import _etag_matches, cached_response
+
+
+def _request(path, query="", if_none_match=None):
+    """A GET request for path?query, optionally carrying If-None-Match"""
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": query.encode(),
+        "headers": headers,
+    }
+    return Request(scope)
+
+
+def _builder(content):
+    """A build() returning content, with the list of its calls"""
+    calls = []
+
+    async def build():
+        calls.append(content)
+        return content
+
+    return build, calls
+
+
+def test_if_none_match_comparison():
+    """Test If-None-Match lists, weak validators and the wildcard match the ETag"""
+    etag = '"abc"'
+    assert _etag_matches('"abc"', etag)
+    assert _etag_matches('"xyz", W/"abc"', etag)
+    assert _etag_matches("*", etag)
+    assert not _etag_matches('"xyz"', etag)
+    assert not _etag_matches(None, etag)
+
+
+def test_miss_stores_the_body_and_hits_serve_it(fake_redis):
+    """Test a miss builds and stores the body, and hits (in any query order) serve it or 304"""
+    build, calls = _builder({"laps": [1, 2, 3]})
+
+    async def run():
+        miss = await cached_response(_request("/laps", "b=2&a=1"), build, ttl=60)
+        cache.memory_cache.clear()
+        hit = await cached_response(_request("/laps", "a=1&b=2"), build, ttl=60)
+        etag = miss.headers["etag"]
+        not_modified = await cached_response(
+            _request("/laps", "a=1&b=2", if_none_match=etag), build, ttl=60
+        )
+        stored = await fake_redis.keys("response:*")
+        return miss, hit, not_modified, stored
+
+    miss, hit, not_modified, stored = asyncio.run(run())
+    assert calls == [{"laps": [1, 2, 3]}]
+    assert stored == [b"response:v1:/laps?a=1&b=2"]
+    assert json.loads(miss.body) == {"laps": [1, 2, 3]}
+    assert hit.body == miss.body
+    assert hit.headers["etag"] == miss.headers["etag"]
+    assert not_modified.status_code == 304
+    assert not_modified.body == b""
+    assert not_modified.headers["etag"] == miss.headers["etag"]
+
+
+def test_race_invalidation_clears_the_body_and_the_value_behind_it(fake_redis):
+    """Test a response and the derived value it was built from go with the same race tag.
+
+    The body is a second copy of the derived value, kept so hits skip decoding and
+    re-encoding it; tagging both alike keeps them from disagreeing after an invalidation.
+    """
+
+    class Service:
+        @cached("laps:{year}:{race}", ttl=60, tags=tags_by_race())
+        async def get_laps(self, year: int, race: int | str):
+            builds.append(race)
+            return [len(builds)]
+
+    builds = []
+    service = Service()
+
+    async def respond():
+        response = await cached_response(
+            _request("/race/2024/8/laps"),
+            functools.partial(service.get_laps, 2024, 8),
+            ttl=60,
+            tags=functools.partial(resolve_race_tags, 2024, 8),
+        )
+        return json.loads(response.body)
+
+    async def run():
+        first = await respond()
+        cached_again = await respond()
+        count = await invalidate_tags(["race:2024:8"])
+        return first, cached_again, count, await respond()
+
+    first, cached_again, count, rebuilt = asyncio.run(run())
+    assert first == cached_again == [1]
+    assert count == 2
+    assert rebuilt == [2]
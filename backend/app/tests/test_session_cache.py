@@ -0,0 +1,64 @@
+"""Tests for the in-process session cache"""
+
+from app.utils.session_cache import SessionCache
+
+
+def _cache(max_bytes: int = 100, max_entries: int = 10) -> SessionCache:
+    return SessionCache(max_bytes=max_bytes, max_entries=max_entries, sizeof=len)
+
+
+def test_hit_and_miss_counters():
+    """Test lookups are counted"""
+    cache = _cache()
+    assert cache.get("a") is None
+    cache.put("a", "x" * 10)
+    assert cache.get("a") == "x" * 10
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["bytes"] == 10
+
+
+def test_evicts_least_recently_used_by_bytes():
+    """Test byte budget evicts the least recently used entry"""
+    cache = _cache(max_bytes=30)
+    cache.put("a", "x" * 10)
+    cache.put("b", "x" * 10)
+    cache.put("c", "x" * 10)
+    cache.get("a")
+    cache.put("d", "x" * 10)
+
+    assert "b" not in cache
+    assert "a" in cache
+    assert cache.stats()["evictions"] == 1
+    assert cache.current_bytes == 30
+
+
+def test_evicts_by_entry_count():
+    """Test entry limit is enforced"""
+    cache = _cache(max_entries=2)
+    cache.put("a", "x")
+    cache.put("b", "x")
+    cache.put("c", "x")
+    assert len(cache) == 2
+    assert "a" not in cache
+
+
+def test_oversized_value_not_retained():
+    """Test values larger than the byte budget are dropped"""
+    cache = _cache(max_bytes=5)
+    cache.put("a", "x" * 10)
+    assert "a" not in cache
+    assert cache.current_bytes == 0
+
+
+def test_aliases_follow_entry_lifetime():
+    """Test aliases resolve while the entry is cached and vanish with it"""
+    cache = _cache(max_entries=1)
+    cache.put("canonical", "x")
+    cache.add_alias("alias", "canonical")
+    assert cache.resolve("alias") == "canonical"
+
+    cache.put("other", "y")
+    assert cache.resolve("alias") is None
@@ -0,0 +1,46 @@
+"""Tests for in-flight request coalescing"""
+
+import asyncio
+
+from app.utils.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_run():
+    """Test concurrent callers for the same key await a single call"""
+    flight = SingleFlight()
+    calls = 0
+
+    async def load() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "session"
+
+    async def main():
+        return await asyncio.gather(*(flight.do("key", load) for _ in range(5)))
+
+    results = asyncio.run(main())
+    assert results == ["session"] * 5
+    assert calls == 1
+    assert flight.stats() == {"inflight": 0, "started": 1, "coalesced": 4}
+
+
+def test_errors_propagate_and_next_call_retries():
+    """Test a failed call is shared by waiters and not remembered afterwards"""
+    flight = SingleFlight()
+
+    async def fail() -> str:
+        await asyncio.sleep(0)
+        raise RuntimeError("load failed")
+
+    async def ok() -> str:
+        return "ok"
+
+    async def main():
+        results = await asyncio.gather(
+            flight.do("key", fail), flight.do("key", fail), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        return await flight.do("key", ok)
+
+    assert asyncio.run(main()) == "ok"
@@ -0,0 +1,75 @@
+"""Tests for the schedule-aware TTL policy"""
+
+from datetime import datetime, timedelta, timezone
+
+from app.core.config import settings
+from app.services.ttl_policy import by_season, find_race, is_partial, race_ttl, season_ttl
+
+NOW = datetime(2024, 3, 9, 12, 0, tzinfo=timezone.utc)
+
+RACE = {
+    "round": "2",
+    "raceName": "Saudi Arabian Grand Prix",
+    "Circuit": {
+        "circuitId": "jeddah",
+        "Location": {"locality": "Jeddah", "country": "Saudi Arabia"},
+    },
+    "date": "2024-03-09",
+    "time": "17:00:00Z",
+    "Qualifying": {"date": "2024-03-08", "time": "17:00:00Z"},
+}
+
+
+def test_race_ttl_follows_weekend_phase():
+    """Test upcoming sessions expire at their start, live data is short-lived, settled data long"""
+    assert race_ttl(RACE, 86400, "R", now=NOW) == 5 * 3600
+    assert race_ttl(RACE, 3600, "R", now=NOW) == 3600
+    assert race_ttl(RACE, 86400, "Q", now=NOW) == settings.CACHE_LIVE_TTL
+    later = NOW + timedelta(days=3)
+    assert race_ttl(RACE, 86400, "R", now=later) == settings.CACHE_HISTORICAL_TTL
+
+
+def test_season_ttl_and_race_lookup():
+    """Test past seasons are final and races are found by round or name"""
+    assert season_ttl(2023, 900, now=NOW) == settings.CACHE_HISTORICAL_TTL
+    assert season_ttl(2024, 900, now=NOW) == 900
+    assert find_race([RACE], 2) is RACE
+    assert find_race([RACE], "Jeddah") is RACE
+    assert find_race([RACE], 3) is None
+    assert find_race([], "Jeddah") is None
+
+
+def _race(round_number, race_name, locality, country):
+    return {
+        "round": str(round_number),
+        "season": "2024",
+        "raceName": race_name,
+        "Circuit": {"Location": {"locality": locality, "country": country}},
+    }
+
+
+def test_ambiguous_names_resolve_like_fastf1():
+    """Test a name several races contain picks the race FastF1 would load, not the first one"""
+    schedule = [
+        _race(7, "Emilia Romagna Grand Prix", "Imola", "Italy"),
+        _race(16, "Italian Grand Prix", "Monza", "Italy"),
+        _race(3, "Australian Grand Prix", "Melbourne", "Australia"),
+        _race(11, "Austrian Grand Prix", "Spielberg", "Austria"),
+    ]
+    rounds = {name: find_race(schedule, name)["round"] for name in ("Italy", "Imola", "Austria")}
+    assert rounds == {"Italy": "16", "Imola": "7", "Austria": "11"}
+    assert find_race(schedule, "Australian Grand Prix")["round"] == "3"
+
+
+def test_partial_season_aggregates_are_cached_briefly():
+    """Test aggregates listing failed rounds or seasons, even nested, keep only the default TTL"""
+    ttl = by_season(900)
+    complete = {"race_results": [], "missing_rounds": [], "career": {"missing_seasons": []}}
+    partial_round = {"race_results": [], "missing_rounds": [3]}
+    partial_career = {"missing_rounds": [], "career": {"missing_seasons": [2021]}}
+
+    assert not is_partial(complete)
+    assert is_partial(partial_round) and is_partial(partial_career)
+    assert ttl({"season": 2020}, complete) == settings.CACHE_HISTORICAL_TTL
+    assert ttl({"season": 2020}, partial_round) == 900
+    assert ttl({"season": 2020}, partial_career) == 900
@@ -0,0 +1,128 @@
+"""Admission control for expensive operations"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+class ServiceOverloaded(Exception):
+    """Raised when an operation is rejected because its queue is full"""
+
+    def __init__(self, name: str, retry_after: int):
+        super().__init__(f"{name} is overloaded, retry in {retry_after}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Bounded, prioritized admission for expensive operations.
+
+    At most max_concurrent operations run at once. Further callers wait in a priority queue
+    (lower number first, FIFO within a priority) of at most max_queue entries; beyond that
+    they are rejected right away with ServiceOverloaded, carrying a Retry-After estimate
+    based on how long recent operations held their slot.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self._active = 0
+        self._waiters: List[Tuple[int, int, "asyncio.Future[None]"]] = []
+        self._order = itertools.count()
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+        self.waited = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self._hold_seconds_avg = 0.0
+
+    @asynccontextmanager
+    async def slot(self, priority: int = 0) -> AsyncIterator[None]:
+        """Hold one of the concurrent slots for the duration of the block"""
+        await self._acquire(priority)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            held = time.monotonic() - started
+            # Exponential moving average, used for the Retry-After estimate
+            self._hold_seconds_avg += 0.2 * (held - self._hold_seconds_avg)
+            self._release()
+
+    async def _acquire(self, priority: int) -> None:
+        if self._active < self.max_concurrent and not self._waiters:
+            self._active += 1
+            self.admitted += 1
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            retry_after = self.retry_after()
+            logger.warning(
+                "admission_rejected",
+                name=self.name,
+                waiting=len(self._waiters),
+                retry_after=retry_after,
+            )
+            raise ServiceOverloaded(self.name, retry_after)
+
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), future))
+        self.queued += 1
+        queued_at = time.monotonic()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just as the waiter was cancelled; pass it on
+                self._release()
+            else:
+                self._waiters = [w for w in self._waiters if w[2] is not future]
+                heapq.heapify(self._waiters)
+            raise
+
+        waited = time.monotonic() - queued_at
+        self.waited += 1
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        self.admitted += 1
+
+    def _release(self) -> None:
+        # Hand the slot straight to the next waiter so newcomers cannot jump the queue
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._active -= 1
+
+    def retry_after(self) -> int:
+        """Estimated seconds until a queued operation would start"""
+        rounds = (len(self._waiters) + 1) / self.max_concurrent
+        return max(1, min(60, math.ceil(rounds * self._hold_seconds_avg)))
+
+    def stats(self) -> Dict[str, object]:
+        """Return slot usage, queue and wait-time counters"""
+        return {
+            "active": self._active,
+            "waiting": len(self._waiters),
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "wait_seconds_avg": (
+                round(self.wait_seconds_total / self.waited, 3) if self.waited else None
+            ),
+            "wait_seconds_max": round(self.wait_seconds_max, 3),
+        }
@@ -1,55 +1,829 @@
 """Redis cache utilities"""
+import asyncio
+import functools
+import inspect
 import json
-from typing import Any, Optional
+import math
+import random
+import time
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import redis.asyncio as redis
+import structlog
+from redis.exceptions import LockError, RedisError
 
 from app.core.config import settings
+from app.utils.circuit_breaker import CircuitBreaker
+from app.utils.codec import Codec
+from app.utils.memory_cache import MemoryCache
+from app.utils.singleflight import SingleFlight
+
+logger = structlog.get_logger()
 
 # Redis client
 redis_client: Optional[redis.Redis] = None
 
+# Encoding of values stored in Redis
+codec = Codec(
+    serializer=settings.CACHE_SERIALIZER,
+    compression=settings.CACHE_COMPRESSION,
+    min_compress_bytes=settings.CACHE_COMPRESSION_MIN_BYTES,
+)
+
+# Per-worker L1 of decoded values in front of Redis (L2)
+l1_cache: Optional[MemoryCache] = (
+    MemoryCache(
+        max_entries=settings.CACHE_L1_MAX_ENTRIES,
+        max_bytes=settings.CACHE_L1_MAX_BYTES,
+        max_item_bytes=settings.CACHE_L1_MAX_ITEM_BYTES,
+        ttl=settings.CACHE_L1_TTL,
+    )
+    if settings.CACHE_L1_ENABLED
+    else None
+)
+
+# Values this worker can still serve while Redis is unavailable: L1 itself, or a memory cache
+# of the same shape that is only written when Redis writes fail
+memory_cache: MemoryCache = (
+    l1_cache
+    if l1_cache is not None
+    else MemoryCache(
+        max_entries=settings.CACHE_L1_MAX_ENTRIES,
+        max_bytes=settings.CACHE_L1_MAX_BYTES,
+        max_item_bytes=settings.CACHE_L1_MAX_ITEM_BYTES,
+        ttl=settings.CACHE_L1_TTL,
+    )
+)
+
+# Skips Redis for a while after repeated errors, so an outage costs no per-request timeouts
+redis_breaker = CircuitBreaker(
+    "redis",
+    failure_threshold=settings.CACHE_BREAKER_FAILURES,
+    reset_timeout=settings.CACHE_BREAKER_RESET_SECONDS,
+)
+# Returned by _call when Redis was skipped or failed
+UNAVAILABLE = object()
+
+# Workers publish written and deleted keys here so the others drop their L1 copies
+INVALIDATION_CHANNEL = "cache:invalidate"
+_instance_id = uuid.uuid4().hex
+_invalidation_task: Optional["asyncio.Task[None]"] = None
+
+# Tagged keys are listed in a Redis set per tag ("tag:race:2024:5") so a tag can be
+# invalidated without scanning the keyspace; deletes are pipelined UNLINKs of this many keys
+TAG_PREFIX = "tag:"
+DELETE_BATCH_SIZE = 500
+
+# Redis lookup counters; L1 keeps its own
+_l2_stats = {"hits": 0, "misses": 0, "errors": 0, "bypassed": 0}
+
+# Negative entries live under their own prefix so they never pass for a real value
+NEGATIVE_PREFIX = "negative:"
+_negative_stats = {"hits": 0, "stored": 0}
+
+# Revalidation: an entry's last copy is kept past its TTL under REVALIDATE_PREFIX, with the
+# upstream validators (ETag, Last-Modified) it came with under VALIDATORS_PREFIX, so a
+# conditional request answered 304 can put it back
+REVALIDATE_PREFIX = "revalidate:"
+VALIDATORS_PREFIX = "validators:"
+
+# Per-function counters of @cached methods, keyed by qualified name
+_function_stats: Dict[str, Dict[str, float]] = {}
+
+# get_or_compute: same-worker misses share one computation; outcome counters
+_computations = SingleFlight()
+_compute_stats = {
+    "fresh": 0,
+    "stale_served": 0,
+    "computed": 0,
+    "early_refreshes": 0,
+    "refresh_failures": 0,
+}
+
 
 async def get_redis() -> redis.Redis:
     """Get Redis client"""
     global redis_client
     if redis_client is None:
-        redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+        # Blocking pool: past max_connections callers wait (bounded by the operation
+        # timeout) instead of failing outright
+        pool = redis.BlockingConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.CACHE_OPERATION_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+        )
+        redis_client = redis.Redis.from_pool(pool)
     return redis_client
 
 
 async def close_redis() -> None:
     """Close Redis connection"""
-    global redis_client
+    global redis_client, _invalidation_task
+    if _invalidation_task is not None:
+        _invalidation_task.cancel()
+        _invalidation_task = None
     if redis_client:
-        await redis_client.close()
+        await redis_client.aclose()
         redis_client = None
 
 
+async def redis_call(
+    op: str,
+    command: Callable[[redis.Redis], Awaitable[Any]],
+    timeout: Optional[float] = settings.CACHE_OPERATION_TIMEOUT,
+) -> Any:
+    """Run a Redis command unless the breaker is open; UNAVAILABLE if it fails or is skipped.
+
+    Connection errors and timeouts are logged and counted by the breaker instead of
+    propagating, so callers can carry on without Redis. Unbounded calls (timeout=None) never
+    serve as the breaker's half-open probe. Other modules keeping state in Redis (e.g. the
+    rate limiter) go through it too.
+    """
+    is_trial = redis_breaker.state == "half_open"
+    if not redis_breaker.allow(trial=timeout is not None):
+        _l2_stats["bypassed"] += 1
+        return UNAVAILABLE
+    try:
+        async with asyncio.timeout(timeout):
+            result = await command(await get_redis())
+    except (RedisError, OSError) as e:
+        # OSError includes the TimeoutError raised by asyncio.timeout
+        redis_breaker.record_failure()
+        _l2_stats["errors"] += 1
+        logger.warning("cache_redis_error", op=op, error=str(e) or type(e).__name__)
+        return UNAVAILABLE
+    except BaseException:
+        # Cancelled, or failed for a reason that says nothing about Redis: if this was the
+        # half-open trial, let the next call probe instead of staying open for good
+        if is_trial:
+            redis_breaker.release_trial()
+        raise
+    redis_breaker.record_success()
+    return result
+
+
 async def get_cache(key: str) -> Optional[Any]:
-    """Get value from cache"""
-    client = await get_redis()
-    value = await client.get(key)
-    if value:
-        return json.loads(value)
-    return None
+    """Get value from cache, trying this worker's L1 before Redis"""
+    if l1_cache is not None:
+        value = l1_cache.get(key)
+        if value is not None:
+            return value
+
+    async def fetch(client: redis.Redis) -> Any:
+        if l1_cache is None:
+            return await client.get(key), None
+        # Fetch the remaining TTL in the same round trip so L1 never outlives Redis
+        async with client.pipeline(transaction=False) as pipe:
+            return await pipe.get(key).pttl(key).execute()
+
+    reply = await redis_call("get", fetch)
+    if reply is UNAVAILABLE:
+        return memory_cache.get(key) if l1_cache is None else None
+    return _decode_hit(key, *reply)
+
+
+async def get_many(keys: List[str]) -> Dict[str, Any]:
+    """Get several values with one Redis round trip; missing keys are left out"""
+    found: Dict[str, Any] = {}
+    remaining = []
+    for key in dict.fromkeys(keys):
+        value = l1_cache.get(key) if l1_cache is not None else None
+        if value is not None:
+            found[key] = value
+        else:
+            remaining.append(key)
+    if not remaining:
+        return found
+
+    async def fetch(client: redis.Redis) -> List[Any]:
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.mget(remaining)
+            if l1_cache is not None:
+                for key in remaining:
+                    pipe.pttl(key)
+            return await pipe.execute()
+
+    replies = await redis_call("get_many", fetch)
+    if replies is UNAVAILABLE:
+        if l1_cache is None:
+            for key in remaining:
+                value = memory_cache.get(key)
+                if value is not None:
+                    found[key] = value
+        return found
+
+    ttls = replies[1:] if l1_cache is not None else [None] * len(remaining)
+    for key, raw, ttl_ms in zip(remaining, replies[0], ttls):
+        value = _decode_hit(key, raw, ttl_ms)
+        if value is not None:
+            found[key] = value
+    return found
+
+
+def _decode_hit(key: str, raw: Optional[bytes], ttl_ms: Optional[int]) -> Optional[Any]:
+    """Decode a Redis reply, count it and keep it in L1 for at most its remaining TTL"""
+    if not raw:
+        _l2_stats["misses"] += 1
+        return None
+    try:
+        value, size = codec.decode_sized(raw)
+    except Exception as e:
+        # e.g. written with a compressor this worker lacks; rebuild it like a miss
+        logger.warning("cache_decode_failed", key=key, error=str(e))
+        _l2_stats["misses"] += 1
+        return None
+    _l2_stats["hits"] += 1
+    if l1_cache is not None and ttl_ms != -2:
+        l1_cache.set(key, value, size, ttl_ms / 1000 if ttl_ms and ttl_ms > 0 else None)
+    return value
+
+
+async def set_cache(key: str, value: Any, ttl: int, tags: Optional[List[str]] = None) -> None:
+    """Set value in cache with TTL, registering it under the given invalidation tags"""
+    payload = codec.encode(value)
+
+    async def store(client: redis.Redis) -> None:
+        if l1_cache is None and not tags:
+            await client.setex(key, ttl, payload)
+            return
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.setex(key, ttl, payload)
+            for tag in tags or []:
+                _add_to_tag(pipe, tag, [key], ttl)
+            if l1_cache is not None:
+                pipe.publish(INVALIDATION_CHANNEL, _invalidation_message(keys=[key]))
+            await pipe.execute()
+
+    stored = await redis_call("set", store)
+    if l1_cache is not None or stored is UNAVAILABLE:
+        # Keep the decoded copy, as a reader would see it, not the caller's object, sized
+        # uncompressed so the memory bounds hold for compressed values
+        memory_cache.set(key, *codec.decode_sized(payload), ttl)
+
 
+async def set_many(
+    values: Dict[str, Any], ttl: int, tags: Optional[Dict[str, List[str]]] = None
+) -> None:
+    """Set several values with the same TTL in one pipelined round trip.
 
-async def set_cache(key: str, value: Any, ttl: int) -> None:
-    """Set value in cache with TTL"""
-    client = await get_redis()
-    await client.setex(key, ttl, json.dumps(value))
+    ``tags`` maps keys to the invalidation tags they are registered under.
+    """
+    if not values:
+        return
+    payloads = {key: codec.encode(value) for key, value in values.items()}
+
+    async def store(client: redis.Redis) -> None:
+        async with client.pipeline(transaction=False) as pipe:
+            for key, payload in payloads.items():
+                pipe.setex(key, ttl, payload)
+                for tag in (tags or {}).get(key, []):
+                    _add_to_tag(pipe, tag, [key], ttl)
+            if l1_cache is not None:
+                pipe.publish(INVALIDATION_CHANNEL, _invalidation_message(keys=list(payloads)))
+            await pipe.execute()
+
+    stored = await redis_call("set_many", store)
+    if l1_cache is not None or stored is UNAVAILABLE:
+        for key, payload in payloads.items():
+            memory_cache.set(key, *codec.decode_sized(payload), ttl)
 
 
 async def delete_cache(key: str) -> None:
     """Delete value from cache"""
-    client = await get_redis()
-    await client.delete(key)
+    memory_cache.delete(key)
+
+    async def delete(client: redis.Redis) -> None:
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.delete(key)
+            if l1_cache is not None:
+                pipe.publish(INVALIDATION_CHANNEL, _invalidation_message(keys=[key]))
+            await pipe.execute()
+
+    await redis_call("delete", delete)
 
 
 async def clear_cache_pattern(pattern: str) -> None:
-    """Clear all cache keys matching pattern"""
-    client = await get_redis()
-    async for key in client.scan_iter(match=pattern):
-        await client.delete(key)
+    """Clear all cache keys matching pattern.
+
+    This scans the whole keyspace; prefer invalidate_tags for anything routinely cleared.
+    """
+    memory_cache.delete_pattern(pattern)
+
+    async def clear(client: redis.Redis) -> None:
+        keys = [key async for key in client.scan_iter(match=pattern, count=1000)]
+        await _unlink(client, keys)
+        if l1_cache is not None:
+            await client.publish(INVALIDATION_CHANNEL, _invalidation_message(pattern=pattern))
+
+    # A keyspace scan can legitimately take longer than a single cache call
+    await redis_call("clear_pattern", clear, timeout=None)
+
+
+async def get_negative(key: str) -> Optional[Dict[str, Any]]:
+    """Return the negative entry recorded for key (its data is known not to exist yet)"""
+    entry = await get_cache(NEGATIVE_PREFIX + key)
+    if entry is not None:
+        _negative_stats["hits"] += 1
+        logger.info("negative_cache_hit", key=key)
+    return entry
+
+
+async def get_negative_many(keys: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Return the negative entries recorded for any of the keys, in one round trip"""
+    found = await get_many([NEGATIVE_PREFIX + key for key in keys])
+    entries = {key[len(NEGATIVE_PREFIX) :]: entry for key, entry in found.items()}
+    _negative_stats["hits"] += len(entries)
+    return entries
+
+
+async def set_negative(key: str, reason: str, ttl: int, tags: Optional[List[str]] = None) -> None:
+    """Remember for ttl seconds that the data behind key does not exist yet"""
+    entry = {"reason": reason, "recorded_at": time.time()}
+    await set_cache(NEGATIVE_PREFIX + key, entry, ttl, tags)
+    _negative_stats["stored"] += 1
+    logger.info("negative_cache_set", key=key, ttl=ttl, reason=reason)
+
+
+def negative_ttl(available_at: Optional[datetime]) -> int:
+    """How long to keep a negative entry for data expected from available_at on.
+
+    Until then if that is in the future, within NEGATIVE_CACHE_TTL..NEGATIVE_CACHE_MAX_TTL;
+    NEGATIVE_CACHE_TTL once it has passed (the data is due and usually just late).
+    """
+    if available_at is None:
+        return settings.NEGATIVE_CACHE_TTL
+    remaining = (available_at - datetime.now(timezone.utc)).total_seconds()
+    return int(min(max(remaining, settings.NEGATIVE_CACHE_TTL), settings.NEGATIVE_CACHE_MAX_TTL))
+
+
+async def keep_for_revalidation(
+    key: str, validators: Dict[str, str], ttl: int, tags: Optional[List[str]] = None
+) -> None:
+    """Keep a copy of key's current value and its upstream validators for ttl seconds.
+
+    The copy is made inside Redis (COPY), so the value is neither re-sent nor re-encoded.
+    """
+    copy_key = REVALIDATE_PREFIX + key
+    validators_key = VALIDATORS_PREFIX + key
+    payload = codec.encode(validators)
+
+    async def keep(client: redis.Redis) -> None:
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.copy(key, copy_key, replace=True)
+            pipe.expire(copy_key, ttl)
+            pipe.setex(validators_key, ttl, payload)
+            for tag in tags or []:
+                _add_to_tag(pipe, tag, [copy_key, validators_key], ttl)
+            await pipe.execute()
+
+    await redis_call("keep_for_revalidation", keep)
+
+
+async def get_validators(key: str) -> Optional[Dict[str, str]]:
+    """Upstream validators kept for key by keep_for_revalidation, if any"""
+
+    async def fetch(client: redis.Redis) -> Optional[bytes]:
+        return await client.get(VALIDATORS_PREFIX + key)
+
+    raw = await redis_call("get_validators", fetch)
+    if raw is UNAVAILABLE or not raw:
+        return None
+    return codec.decode(raw)
+
+
+async def restore_revalidated(
+    key: str, ttl: int, keep_ttl: int, tags: Optional[List[str]] = None
+) -> Optional[Any]:
+    """Put key's kept copy back for ttl seconds after upstream confirmed it is unchanged.
+
+    The copy and validators are kept for keep_ttl more seconds. Nothing is re-encoded: the
+    stored bytes are copied inside Redis and only decoded for the caller. Returns None when
+    the copy is gone (evicted or invalidated).
+    """
+    copy_key = REVALIDATE_PREFIX + key
+
+    async def restore(client: redis.Redis) -> List[Any]:
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.copy(copy_key, key, replace=True)
+            pipe.expire(key, ttl)
+            pipe.expire(copy_key, keep_ttl)
+            pipe.expire(VALIDATORS_PREFIX + key, keep_ttl)
+            for tag in tags or []:
+                _add_to_tag(pipe, tag, [key], ttl)
+            pipe.get(key)
+            pipe.pttl(key)
+            return await pipe.execute()
+
+    replies = await redis_call("restore_revalidated", restore)
+    if replies is UNAVAILABLE or not replies[0]:
+        return None
+    return _decode_hit(key, replies[-2], replies[-1])
+
+
+def _add_to_tag(pipe: Any, tag: str, keys: List[str], ttl: int) -> None:
+    """Queue registering keys under a tag; the tag set lives as long as its longest member"""
+    tag_key = TAG_PREFIX + tag
+    pipe.sadd(tag_key, *keys)
+    pipe.expire(tag_key, ttl, nx=True)
+    pipe.expire(tag_key, ttl, gt=True)
+
+
+async def invalidate_tags(tags: List[str]) -> int:
+    """Delete every key registered under any of the tags and return how many there were.
+
+    Costs O(tagged keys) rather than a keyspace scan. Each tag set is read and dropped in
+    one transaction, so keys tagged while this runs start a fresh set and stay tracked.
+    Returns 0 when Redis is unavailable.
+    """
+    if not tags:
+        return 0
+    tag_keys = [TAG_PREFIX + tag for tag in tags]
+
+    async def invalidate(client: redis.Redis) -> List[str]:
+        async with client.pipeline(transaction=True) as pipe:
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            pipe.unlink(*tag_keys)
+            *members, _ = await pipe.execute()
+        keys = sorted({key.decode() for tagged in members for key in tagged})
+        await _unlink(client, keys, publish=l1_cache is not None)
+        return keys
+
+    keys = await redis_call("invalidate_tags", invalidate, timeout=None)
+    if keys is UNAVAILABLE:
+        return 0
+    for key in keys:
+        memory_cache.delete(key)
+    logger.info("cache_tags_invalidated", tags=tags, keys=len(keys))
+    return len(keys)
+
+
+async def _unlink(client: redis.Redis, keys: List[Any], publish: bool = False) -> None:
+    """UNLINK keys in pipelined batches, optionally announcing each batch to other workers"""
+    async with client.pipeline(transaction=False) as pipe:
+        for start in range(0, len(keys), DELETE_BATCH_SIZE):
+            batch = keys[start : start + DELETE_BATCH_SIZE]
+            pipe.unlink(*batch)
+            if publish:
+                pipe.publish(INVALIDATION_CHANNEL, _invalidation_message(keys=batch))
+        if len(pipe):
+            await pipe.execute()
+
+
+def _invalidation_message(keys: Optional[List[str]] = None, pattern: Optional[str] = None) -> str:
+    return json.dumps({"origin": _instance_id, "keys": keys or [], "pattern": pattern})
+
+
+def _apply_invalidation(data: bytes) -> None:
+    """Drop L1 entries named in an invalidation message from another worker"""
+    message = json.loads(data)
+    if message.get("origin") == _instance_id:
+        return
+    for key in message.get("keys", []):
+        l1_cache.delete(key)
+    if message.get("pattern"):
+        l1_cache.delete_pattern(message["pattern"])
+
+
+async def _listen_for_invalidations() -> None:
+    """Apply invalidations published by other workers, reconnecting on errors"""
+    while True:
+        client = pubsub = None
+        try:
+            # Own connection: the pooled clients' socket timeout would end an idle subscription
+            client = redis.from_url(
+                settings.REDIS_URL,
+                socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+                health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+            )
+            pubsub = client.pubsub()
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    _apply_invalidation(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("cache_invalidation_listener_error", error=str(e))
+            # Messages may have been missed while disconnected
+            l1_cache.clear()
+            await asyncio.sleep(1)
+        finally:
+            if pubsub is not None:
+                await pubsub.aclose()
+            if client is not None:
+                await client.aclose()
+
+
+def start_cache_invalidation() -> None:
+    """Start this worker's L1 invalidation listener (no-op when L1 is disabled)"""
+    global _invalidation_task
+    if l1_cache is not None and _invalidation_task is None:
+        _invalidation_task = asyncio.create_task(_listen_for_invalidations())
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Return hit/miss counters for the L1 and Redis tiers"""
+    l2_lookups = _l2_stats["hits"] + _l2_stats["misses"]
+    return {
+        "l1": l1_cache.stats() if l1_cache is not None else None,
+        "l2": {
+            **_l2_stats,
+            "hit_ratio": round(_l2_stats["hits"] / l2_lookups, 3) if l2_lookups else None,
+            "breaker": redis_breaker.stats(),
+        },
+        "memory_fallback": memory_cache.stats() if l1_cache is None else None,
+        "negative": dict(_negative_stats),
+        "get_or_compute": {**_compute_stats, "inflight": _computations.stats()["inflight"]},
+        "functions": {name: _summarize(stats) for name, stats in _function_stats.items()},
+    }
+
+
+def _summarize(stats: Dict[str, float]) -> Dict[str, Any]:
+    """Hit ratio and mean latencies of one @cached function"""
+    served = stats["hits"] + stats["misses"]
+    return {
+        "hits": int(stats["hits"]),
+        "misses": int(stats["misses"]),
+        "errors": int(stats["errors"]),
+        "hit_ratio": round(stats["hits"] / served, 3) if served else None,
+        "hit_ms_avg": (
+            round(stats["hit_seconds"] / stats["hits"] * 1000, 2) if stats["hits"] else None
+        ),
+        "miss_ms_avg": (
+            round(stats["miss_seconds"] / stats["misses"] * 1000, 2) if stats["misses"] else None
+        ),
+        "max_ms": round(stats["max_seconds"] * 1000, 2),
+    }
+
+
+@asynccontextmanager
+async def cache_lock(name: str, timeout: float, blocking_timeout: float) -> AsyncIterator[bool]:
+    """Hold a Redis lock shared by all workers.
+
+    Yields whether the lock was acquired. When another worker holds it for longer than
+    ``blocking_timeout`` seconds, or Redis is unavailable, the block still runs, unlocked,
+    so callers never fail just because the lock is busy. ``timeout`` bounds how long a
+    crashed holder can keep it.
+    """
+    lock = None
+
+    async def acquire(client: redis.Redis) -> bool:
+        nonlocal lock
+        lock = client.lock(f"lock:{name}", timeout=timeout, blocking_timeout=blocking_timeout)
+        return bool(await lock.acquire())
+
+    # Waiting for the holder is not a Redis failure, so only the socket timeout applies
+    acquired = await redis_call("lock", acquire, timeout=None)
+    acquired = acquired is not UNAVAILABLE and acquired
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            try:
+                await lock.release()
+            except LockError:
+                # Lock expired while held; another worker may own it now
+                pass
+            except (RedisError, OSError) as e:
+                # It expires on its own after timeout
+                logger.warning("cache_lock_release_failed", name=name, error=str(e))
+
+
+# A TTL in seconds, or a (sync or async) policy computing it from the value about to be stored
+TTL = Union[int, Callable[[Any], Union[int, Awaitable[int]]]]
+# Invalidation tags, or an async callable resolving them when a value is stored
+Tags = Union[List[str], Callable[[], Awaitable[List[str]]]]
+
+
+async def get_or_compute(
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    ttl: TTL,
+    stale_ttl: Optional[int] = None,
+    early_refresh: float = 0.0,
+    lock_timeout: Optional[int] = None,
+    lock_wait: Optional[int] = None,
+    tags: Optional[Tags] = None,
+) -> Any:
+    """Return the cached value for key, recomputing it in at most one caller at a time.
+
+    A value is fresh for ``ttl`` seconds and kept stale for ``stale_ttl`` more (default:
+    ``ttl``). Once stale, the caller that takes the key's Redis lock recomputes it while
+    the others keep getting the stale value; if the recompute fails the stale value is
+    served. Without any value, callers wait for the lock holder (up to ``lock_wait``
+    seconds, default CACHE_LOCK_WAIT) and read its result.
+
+    ``early_refresh`` > 0 (1.0 is a good start) lets one caller refresh a still-fresh value
+    shortly before it goes stale, more eagerly the closer the expiry and the slower the
+    computation, so the hottest keys are rarely seen stale at all.
+
+    ``tags`` are the invalidation tags the stored value is registered under, or an async
+    callable returning them, only called when a value is stored.
+
+    Keys written here hold an envelope and must only be read through get_or_compute.
+    """
+    store = functools.partial(_compute_and_store, key, compute, ttl, stale_ttl, tags)
+    lock_timeout = settings.CACHE_LOCK_TIMEOUT if lock_timeout is None else lock_timeout
+    entry = _envelope(await get_cache(key))
+    if entry is None:
+        lock_wait = settings.CACHE_LOCK_WAIT if lock_wait is None else lock_wait
+        return await _computations.do(
+            key, functools.partial(_compute_when_missing, key, store, lock_timeout, lock_wait)
+        )
+
+    now = time.time()
+    if now < entry["soft_expires"] and not _refresh_early(entry, now, early_refresh):
+        _compute_stats["fresh"] += 1
+        return entry["value"]
+
+    async with cache_lock(key, timeout=lock_timeout, blocking_timeout=0) as acquired:
+        if not acquired:
+            _compute_stats["stale_served"] += 1
+            return entry["value"]
+        if now < entry["soft_expires"]:
+            _compute_stats["early_refreshes"] += 1
+        try:
+            return await store()
+        except Exception as e:
+            _compute_stats["refresh_failures"] += 1
+            logger.warning("cache_refresh_failed_serving_stale", key=key, error=str(e))
+            return entry["value"]
+
+
+async def _compute_when_missing(
+    key: str, store: Callable[[], Awaitable[Any]], lock_timeout: int, lock_wait: int
+) -> Any:
+    async with cache_lock(key, timeout=lock_timeout, blocking_timeout=lock_wait):
+        # The previous lock holder has probably stored it by now
+        entry = _envelope(await get_cache(key))
+        if entry is not None:
+            _compute_stats["fresh"] += 1
+            return entry["value"]
+        return await store()
+
+
+async def _compute_and_store(
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    ttl: TTL,
+    stale_ttl: Optional[int],
+    tags: Optional[Tags],
+) -> Any:
+    started = time.time()
+    value = await compute()
+    finished = time.time()
+    _compute_stats["computed"] += 1
+
+    fresh_seconds = ttl(value) if callable(ttl) else ttl
+    if inspect.isawaitable(fresh_seconds):
+        fresh_seconds = await fresh_seconds
+    stale_seconds = fresh_seconds if stale_ttl is None else stale_ttl
+    envelope = {
+        "value": value,
+        "soft_expires": finished + fresh_seconds,
+        "compute_seconds": round(finished - started, 3),
+    }
+    if fresh_seconds + stale_seconds > 0:
+        if callable(tags):
+            tags = await tags()
+        await set_cache(key, envelope, fresh_seconds + stale_seconds, tags)
+    return value
+
+
+def _envelope(entry: Any) -> Optional[Dict[str, Any]]:
+    """The get_or_compute envelope in a cached value, or None for anything else"""
+    if isinstance(entry, dict) and "soft_expires" in entry:
+        return entry
+    return None
+
+
+def _refresh_early(entry: Dict[str, Any], now: float, beta: float) -> bool:
+    """Probabilistic early expiry: refresh when now - delta * beta * ln(U) passes expiry"""
+    if beta <= 0:
+        return False
+    jitter = entry["compute_seconds"] * beta * -math.log(1.0 - random.random())
+    return now + jitter >= entry["soft_expires"]
+
+
+# Callable TTL policies of @cached receive the call's arguments and the computed value
+TTLPolicy = Union[int, Callable[[Dict[str, Any], Any], Union[int, Awaitable[int]]]]
+
+
+def cached(
+    key: str,
+    ttl: TTLPolicy,
+    version: int = 1,
+    stale_ttl: Optional[int] = None,
+    early_refresh: float = 0.0,
+    lock_timeout: Optional[int] = None,
+    lock_wait: Optional[int] = None,
+    tags: Union[Tuple[str, ...], Callable[[Dict[str, Any]], Awaitable[List[str]]]] = (),
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Cache an async function's result through get_or_compute.
+
+    ``key`` is a format template over the function's arguments (defaults applied, ``self``
+    excluded), e.g. ``"strategy:race:{year}:{race}"``. ``version`` is inserted after the
+    first segment (``strategy:v1:race:...``); bump it when the cached value's shape changes.
+    ``ttl`` is seconds or a policy ``ttl(arguments, value) -> seconds``, which may be async
+    (see app.services.ttl_policy). ``tags`` are templates like the key
+    (``"season:{season}"``) naming the invalidation tags of each stored value, or an async
+    ``tags(arguments)`` resolving them when a value is stored (e.g.
+    ttl_policy.tags_by_race, which tags a race by its round number whatever the caller
+    passed). The remaining options are passed to get_or_compute.
+
+    Hits, misses, errors and latency are counted per function and reported by cache_stats().
+    """
+
+    def decorate(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        signature = inspect.signature(fn)
+        namespace, _, rest = key.partition(":")
+        template = f"{namespace}:v{version}:{rest}"
+        stats = _function_stats.setdefault(
+            fn.__qualname__,
+            {
+                "hits": 0,
+                "misses": 0,
+                "errors": 0,
+                "hit_seconds": 0.0,
+                "miss_seconds": 0.0,
+                "max_seconds": 0.0,
+            },
+        )
+
+        def cache_key(*args: Any, **kwargs: Any) -> str:
+            return template.format(**_arguments(signature, args, kwargs))
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            arguments = _arguments(signature, args, kwargs)
+            full_key = template.format(**arguments)
+            computed = False
+
+            async def compute() -> Any:
+                nonlocal computed
+                computed = True
+                logger.info("cache_miss", key=full_key)
+                return await fn(*args, **kwargs)
+
+            policy = ttl if isinstance(ttl, int) else functools.partial(ttl, arguments)
+            value_tags: Tags = (
+                functools.partial(tags, arguments)
+                if callable(tags)
+                else [tag.format(**arguments) for tag in tags]
+            )
+            started = time.perf_counter()
+            try:
+                value = await get_or_compute(
+                    full_key,
+                    compute,
+                    policy,
+                    stale_ttl=stale_ttl,
+                    early_refresh=early_refresh,
+                    lock_timeout=lock_timeout,
+                    lock_wait=lock_wait,
+                    tags=value_tags,
+                )
+            except Exception:
+                stats["errors"] += 1
+                raise
+
+            elapsed = time.perf_counter() - started
+            if computed:
+                stats["misses"] += 1
+                stats["miss_seconds"] += elapsed
+            else:
+                stats["hits"] += 1
+                stats["hit_seconds"] += elapsed
+            stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+            return value
+
+        wrapper.cache_key = cache_key  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorate
+
 
+def _arguments(signature: inspect.Signature, args: Any, kwargs: Any) -> Dict[str, Any]:
+    """Bind call arguments to parameter names, with defaults and without self"""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    arguments.pop("self", None)
+    return arguments
@@ -0,0 +1,82 @@
+"""Circuit breaker for calls to an unreliable dependency"""
+
+import time
+from typing import Any, Dict, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+class CircuitBreaker:
+    """Stops calling a dependency that keeps failing, then probes it again.
+
+    After failure_threshold consecutive failures the breaker opens and allow() returns False
+    for reset_timeout seconds. Then one trial call at a time is let through (half-open): a
+    success closes the breaker, a failure opens it for another reset_timeout. A trial that
+    ends without a verdict (e.g. it was cancelled) must be handed back with release_trial().
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self, trial: bool = True) -> bool:
+        """Whether a call may go to the dependency now.
+
+        With trial=False the call is only let through while closed, for calls too slow or
+        unbounded to serve as the half-open probe.
+        """
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and trial and not self._trial_running:
+            self._trial_running = True
+            return True
+        self.rejected += 1
+        return False
+
+    def release_trial(self) -> None:
+        """Let another trial through after one that ended without success or failure"""
+        self._trial_running = False
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            logger.info("circuit_closed", name=self.name)
+        self._failures = 0
+        self._opened_at = None
+        self._trial_running = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._trial_running = False
+        if self._opened_at is None and self._failures < self.failure_threshold:
+            return
+        if self._opened_at is None:
+            self.opened += 1
+            logger.warning("circuit_opened", name=self.name, failures=self._failures)
+        # A failed trial keeps it open for another full period
+        self._opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the current state and counters"""
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
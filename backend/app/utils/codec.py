@@ -0,0 +1,164 @@
+"""Binary encoding of cache values.
+
+An encoded value starts with one header byte: the high bit marks the new format, bits 4-6
+name the compression and bits 0-3 the serializer. ``bytes`` values (e.g. pre-encoded HTTP
+bodies) are stored as they are, under their own serializer id, and decode back to bytes.
+Entries written before the header existed are plain JSON text, whose first byte is always
+ASCII, so they still decode.
+
+orjson, zstandard and lz4 are dependencies of the backend; msgpack comes with FastF1. All
+are imported optionally: without them JSON falls back to the standard library and
+compression to zlib.
+"""
+
+import json
+import zlib
+from typing import Any, Callable, Dict, List, Tuple
+
+import structlog
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover
+    lz4_frame = None
+
+logger = structlog.get_logger()
+
+_FORMAT_BIT = 0x80
+
+SERIALIZERS = {"json": 0x01, "msgpack": 0x02}
+_RAW = 0x03
+COMPRESSIONS = {"none": 0x00, "zlib": 0x10, "zstd": 0x20, "lz4": 0x30}
+
+
+def json_dumps(value: Any) -> bytes:
+    """Compact JSON, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _msgpack_dumps(value: Any) -> bytes:
+    return msgpack.packb(value, use_bin_type=True)
+
+
+def _msgpack_loads(data: bytes) -> Any:
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=3).compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+def _zlib_compress(data: bytes) -> bytes:
+    return zlib.compress(data, 6)
+
+
+def _lz4_compress(data: bytes) -> bytes:
+    return lz4_frame.compress(data)
+
+
+def _lz4_decompress(data: bytes) -> bytes:
+    return lz4_frame.decompress(data)
+
+
+_SERIALIZE: Dict[int, Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    SERIALIZERS["json"]: (json_dumps, _json_loads),
+    SERIALIZERS["msgpack"]: (_msgpack_dumps, _msgpack_loads),
+    _RAW: (bytes, bytes),
+}
+
+_COMPRESS: Dict[int, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    COMPRESSIONS["zlib"]: (_zlib_compress, zlib.decompress),
+    COMPRESSIONS["zstd"]: (_zstd_compress, _zstd_decompress),
+    COMPRESSIONS["lz4"]: (_lz4_compress, _lz4_decompress),
+}
+
+AVAILABLE = {
+    "msgpack": msgpack is not None,
+    "zstd": zstandard is not None,
+    "lz4": lz4_frame is not None,
+}
+
+
+class Codec:
+    """Serializer plus optional compression for values above min_compress_bytes.
+
+    Unavailable choices fall back to JSON / zlib and are listed in ``unavailable``. decode()
+    reads every header this module can write, whatever the codec's own settings, plus legacy
+    JSON text.
+    """
+
+    def __init__(
+        self, serializer: str = "json", compression: str = "zstd", min_compress_bytes: int = 16384
+    ):
+        self.unavailable: List[str] = []
+        if not AVAILABLE.get(serializer, True):
+            logger.warning("cache_codec_unavailable", serializer=serializer, fallback="json")
+            self.unavailable.append(serializer)
+            serializer = "json"
+        if not AVAILABLE.get(compression, True):
+            logger.warning("cache_codec_unavailable", compression=compression, fallback="zlib")
+            self.unavailable.append(compression)
+            compression = "zlib"
+        self.serializer = serializer
+        self.compression = compression
+        self.min_compress_bytes = min_compress_bytes
+        self._serializer_id = SERIALIZERS[serializer]
+        self._compression_id = COMPRESSIONS[compression]
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize a value, compressing it when it is large enough"""
+        serializer_id = _RAW if isinstance(value, bytes) else self._serializer_id
+        data = _SERIALIZE[serializer_id][0](value)
+        compression_id = 0
+        if self._compression_id and len(data) >= self.min_compress_bytes:
+            data = _COMPRESS[self._compression_id][0](data)
+            compression_id = self._compression_id
+        return bytes((_FORMAT_BIT | compression_id | serializer_id,)) + data
+
+    @staticmethod
+    def decode(data: bytes) -> Any:
+        """Decode a value written by encode() or a legacy JSON text entry"""
+        return Codec.decode_sized(data)[0]
+
+    @staticmethod
+    def decode_sized(data: bytes) -> Tuple[Any, int]:
+        """Decode a value and return it with its uncompressed (serialized) length.
+
+        The length, not the size on the wire, is what memory bounds should count: compressed
+        entries are often a tenth of the data they decode to.
+        """
+        header = data[0]
+        if not header & _FORMAT_BIT:
+            return json.loads(data), len(data)
+        body = data[1:]
+        compression_id = header & 0x70
+        if compression_id:
+            body = _COMPRESS[compression_id][1](body)
+        return _SERIALIZE[header & 0x0F][1](body), len(body)
@@ -0,0 +1,72 @@
+"""Array downsampling helpers for telemetry traces"""
+
+from typing import Dict, Iterable
+
+import numpy as np
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Select n_out sample indices with Largest-Triangle-Three-Buckets.
+
+    The first and last samples are always kept. Interior samples are split into n_out - 2
+    buckets and from each bucket the sample forming the largest triangle with the
+    previously selected sample and the average of the next bucket is kept, which preserves
+    peaks and braking points that a fixed stride drops. Each bucket's areas are computed
+    as one array operation; only the walk across buckets is sequential, because every
+    choice depends on the previous one.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    anchor = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        ax, ay = x[anchor], y[anchor]
+        areas = np.abs((ax - avg_x) * (y[start:end] - ay) - (ax - x[start:end]) * (avg_y - ay))
+        anchor = start + int(np.argmax(areas))
+        selected[bucket + 1] = anchor
+
+    return selected
+
+
+def resample_uniform(
+    x: np.ndarray,
+    channels: Dict[str, np.ndarray],
+    n_out: int,
+    step_channels: Iterable[str] = (),
+) -> Dict[str, np.ndarray]:
+    """Resample channels onto n_out evenly spaced x positions.
+
+    Continuous channels are linearly interpolated, ignoring their NaN samples. Channels
+    named in step_channels (gear, brake, DRS...) take the last sample at or before each
+    grid position instead, so they keep their discrete values. x must be non-decreasing.
+    The returned dict also holds the grid itself under "x".
+    """
+    if len(x) == 0:
+        return {"x": x, **channels}
+
+    grid = np.linspace(x[0], x[-1], n_out)
+    previous = np.clip(np.searchsorted(x, grid, side="right") - 1, 0, len(x) - 1)
+    step_channels = set(step_channels)
+
+    resampled: Dict[str, np.ndarray] = {"x": grid}
+    for name, values in channels.items():
+        if name in step_channels:
+            resampled[name] = values[previous]
+            continue
+        values = values.astype(float)
+        finite = np.isfinite(values)
+        if not finite.any():
+            resampled[name] = np.full(n_out, np.nan)
+        else:
+            resampled[name] = np.interp(grid, x[finite], values[finite])
+    return resampled
@@ -0,0 +1,126 @@
+"""Pooled HTTP transport for external APIs, with retries and connection metrics"""
+
+import asyncio
+import importlib.util
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+import structlog
+
+# What httpx needs for HTTP/2
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+logger = structlog.get_logger()
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+# Worth another try on an idempotent request; 429 is left to the caller's rate limiting
+RETRY_STATUSES = frozenset({502, 503, 504})
+RETRY_ERRORS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """Connection-pooling transport that retries idempotent requests and keeps metrics.
+
+    Timeouts, network errors and 502/503/504 responses to GET/HEAD/OPTIONS are retried up to
+    ``retries`` times with exponential backoff, each retry first awaiting ``acquire`` (e.g. a
+    rate limiter's) so retries are paced like any other request. New connections are counted through
+    httpcore's trace hook, so stats() shows how many requests reused a kept-alive connection
+    next to the pool's current state and the time to response headers. HTTP/2 needs the h2
+    package and falls back to HTTP/1.1 without it.
+    """
+
+    def __init__(
+        self,
+        limits: httpx.Limits,
+        http2: bool = False,
+        retries: int = 2,
+        backoff: float = 0.25,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        acquire: Optional[Callable[[], Awaitable[None]]] = None,
+    ):
+        if http2 and not HTTP2_AVAILABLE:
+            logger.warning("http2_unavailable", fallback="http/1.1")
+            http2 = False
+        self.limits = limits
+        self.http2 = http2
+        self.retries = retries
+        self.backoff = backoff
+        self.acquire = acquire
+        self._transport = transport or httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+        self.requests = 0
+        self.retried = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.connections_opened = 0
+        self.response_seconds_total = 0.0
+        self.response_seconds_max = 0.0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.extensions = {**request.extensions, "trace": self._trace}
+        retryable = request.method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            self.requests += 1
+            self.in_flight += 1
+            started = time.monotonic()
+            try:
+                response = await self._transport.handle_async_request(request)
+            except RETRY_ERRORS as e:
+                if not retryable or attempt >= self.retries:
+                    self.errors += 1
+                    raise
+                reason = type(e).__name__
+            except Exception:
+                self.errors += 1
+                raise
+            else:
+                if not retryable or attempt >= self.retries:
+                    return response
+                if response.status_code not in RETRY_STATUSES:
+                    return response
+                reason = str(response.status_code)
+                await response.aclose()
+            finally:
+                self.in_flight -= 1
+                elapsed = time.monotonic() - started
+                self.response_seconds_total += elapsed
+                self.response_seconds_max = max(self.response_seconds_max, elapsed)
+
+            attempt += 1
+            self.retried += 1
+            delay = self.backoff * 2 ** (attempt - 1)
+            logger.info("http_retry", url=str(request.url), reason=reason, attempt=attempt)
+            await asyncio.sleep(delay)
+            if self.acquire is not None:
+                await self.acquire()
+
+    async def _trace(self, event: str, info: Dict[str, Any]) -> None:
+        if event == "connection.connect_tcp.complete":
+            self.connections_opened += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool usage, reuse, retry and timing counters"""
+        # httpcore's pool behind httpx's transport; absent for injected transports
+        pool = getattr(self._transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return {
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "connections": len(connections),
+            "connections_idle": idle,
+            "connections_opened": self.connections_opened,
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "retried": self.retried,
+            "errors": self.errors,
+            "response_seconds_avg": (
+                round(self.response_seconds_total / self.requests, 3) if self.requests else None
+            ),
+            "response_seconds_max": round(self.response_seconds_max, 3),
+        }
@@ -0,0 +1,100 @@
+"""In-process LRU cache with per-entry expiry"""
+
+import fnmatch
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class MemoryCache:
+    """Size- and TTL-bounded LRU of decoded values, local to one worker.
+
+    Each entry carries an expiry time and a size (the caller's estimate, e.g. the uncompressed
+    length of the encoded payload). Expired entries are dropped on access; least-recently-used
+    entries are evicted once max_entries or max_bytes is exceeded, and values larger than
+    max_item_bytes are not kept at all.
+
+    Values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, max_item_bytes: int, ttl: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_item_bytes = max_item_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a live value and mark it as most recently used"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry[1] <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key: str, value: Any, size: int, ttl: Optional[float] = None) -> None:
+        """Store a value for at most ttl seconds (capped at the cache's own TTL)"""
+        self._remove(key)
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if size > self.max_item_bytes or ttl <= 0:
+            return
+        self._entries[key] = (value, time.monotonic() + ttl, size)
+        self.current_bytes += size
+        while self._entries and (
+            self.current_bytes > self.max_bytes or len(self._entries) > self.max_entries
+        ):
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        """Drop a key if present"""
+        if key in self._entries:
+            self._remove(key)
+            self.invalidations += 1
+
+    def delete_pattern(self, pattern: str) -> None:
+        """Drop all keys matching a glob-style pattern"""
+        for key in [k for k in self._entries if fnmatch.fnmatchcase(k, pattern)]:
+            self.delete(key)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and hit/miss counters"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry[2]
@@ -0,0 +1,229 @@
+"""Client-side rate limiting of calls to an upstream API"""
+
+import asyncio
+import hashlib
+import math
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import redis.asyncio as redis
+import structlog
+from redis.exceptions import NoScriptError
+
+from app.utils.admission import ServiceOverloaded
+from app.utils.cache import UNAVAILABLE, redis_call
+
+logger = structlog.get_logger()
+
+# Set for work nobody is waiting on (e.g. cache warmers); see background()
+_background: ContextVar[bool] = ContextVar("rate_limit_background", default=False)
+
+
+@contextmanager
+def background() -> Iterator[None]:
+    """Mark upstream calls made inside the block as background work.
+
+    Background calls only take tokens while the limit has room to spare, so interactive
+    requests keep the reserved share and go first.
+    """
+    token = _background.set(True)
+    try:
+        yield
+    finally:
+        _background.reset(token)
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Seconds asked for by a Retry-After header (delay seconds or an HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (moment - datetime.now(timezone.utc)).total_seconds())
+
+
+# Takes one token from every bucket of a rate limit, or none of them. KEYS[1] is the pause
+# key, KEYS[2..] the buckets; ARGV[1] is the share of each bucket to leave untouched, then a
+# (rate per second, capacity) pair per bucket. Returns "0" or the seconds to wait, as a
+# string since Lua numbers become integers in replies. Time comes from the Redis server so
+# workers' clocks do not matter.
+_TAKE_TOKEN_LUA = """
+local paused = redis.call('PTTL', KEYS[1])
+if paused > 0 then
+  return tostring(paused / 1000)
+end
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local reserve = tonumber(ARGV[1])
+local wait = 0
+local levels = {}
+for i = 2, #KEYS do
+  local rate = tonumber(ARGV[2 * i - 2])
+  local capacity = tonumber(ARGV[2 * i - 1])
+  local bucket = redis.call('HMGET', KEYS[i], 'tokens', 'ts')
+  local tokens = tonumber(bucket[1]) or capacity
+  local elapsed = math.max(0, now - (tonumber(bucket[2]) or now))
+  tokens = math.min(capacity, tokens + elapsed * rate)
+  local needed = 1 + reserve * capacity
+  if tokens < needed then
+    wait = math.max(wait, (needed - tokens) / rate)
+  end
+  levels[i] = tokens
+end
+for i = 2, #KEYS do
+  local rate = tonumber(ARGV[2 * i - 2])
+  local capacity = tonumber(ARGV[2 * i - 1])
+  local tokens = levels[i]
+  if wait == 0 then
+    tokens = tokens - 1
+  end
+  redis.call('HSET', KEYS[i], 'tokens', tostring(tokens), 'ts', tostring(now))
+  redis.call('EXPIRE', KEYS[i], math.ceil(capacity / rate) + 60)
+end
+return tostring(wait)
+"""
+# The script is run by its digest; its source is only sent when the server does not know it
+_TAKE_TOKEN_SHA = hashlib.sha1(_TAKE_TOKEN_LUA.encode()).hexdigest()
+
+
+async def take_rate_token(
+    name: str, buckets: List[Tuple[float, int]], reserve: float = 0.0
+) -> Optional[float]:
+    """Take a token from a token-bucket rate limit shared by all workers.
+
+    ``buckets`` are (tokens per second, capacity) pairs, all of which must have a token.
+    ``reserve`` is the share of each bucket this caller must leave for others (e.g. 0.25
+    for background work). Returns 0.0 once a token is taken, otherwise the seconds until
+    one can be (or until a pause ends), and None when Redis is unavailable.
+    """
+    keys = [f"ratelimit:{name}:paused"]
+    keys += [f"ratelimit:{name}:{rate}:{capacity}" for rate, capacity in buckets]
+    args = [reserve] + [value for bucket in buckets for value in bucket]
+
+    async def take(client: redis.Redis) -> bytes:
+        try:
+            return await client.evalsha(_TAKE_TOKEN_SHA, len(keys), *keys, *args)
+        except NoScriptError:
+            # First call against this server (or it was restarted): load the script once
+            await client.script_load(_TAKE_TOKEN_LUA)
+            return await client.evalsha(_TAKE_TOKEN_SHA, len(keys), *keys, *args)
+
+    reply = await redis_call("take_rate_token", take)
+    return None if reply is UNAVAILABLE else float(reply)
+
+
+async def pause_rate_limit(name: str, seconds: float) -> None:
+    """Stop a rate limit handing out tokens to any worker for the next seconds"""
+    key = f"ratelimit:{name}:paused"
+    milliseconds = max(1, int(seconds * 1000))
+
+    async def pause(client: redis.Redis) -> None:
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.set(key, 1, px=milliseconds, nx=True)
+            # Only ever extends a running pause
+            pipe.pexpire(key, milliseconds, gt=True)
+            await pipe.execute()
+
+    await redis_call("pause_rate_limit", pause)
+
+
+class RateLimiter:
+    """Token-bucket rate limit shared by all workers through Redis.
+
+    acquire() takes a token from every (rate per second, capacity) bucket, sleeping with
+    jitter until one is available. Background callers (see background()) leave
+    background_reserve of each bucket to interactive ones and may wait indefinitely;
+    interactive callers wait at most max_wait seconds and are then rejected with
+    ServiceOverloaded. pause() stops every worker, e.g. for an upstream Retry-After. When
+    Redis is unavailable each worker only honours its own pauses.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        buckets: List[Tuple[float, int]],
+        background_reserve: float,
+        max_wait: float,
+        jitter: float = 0.2,
+    ):
+        self.name = name
+        self.buckets = buckets
+        self.background_reserve = background_reserve
+        self.max_wait = max_wait
+        self.jitter = jitter
+        self._paused_until = 0.0
+        self.acquired = 0
+        self.acquired_background = 0
+        self.waited = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.rejected = 0
+        self.paused = 0
+        self.unlimited = 0
+
+    async def acquire(self) -> None:
+        """Wait for a token; ServiceOverloaded if an interactive caller would wait too long"""
+        is_background = _background.get()
+        reserve = self.background_reserve if is_background else 0.0
+        started = time.monotonic()
+        slept = False
+        while True:
+            wait = await take_rate_token(self.name, self.buckets, reserve)
+            if wait is None:
+                # Redis unavailable: only this worker's own pause applies
+                self.unlimited += 1
+                wait = max(0.0, self._paused_until - time.monotonic())
+                if not wait:
+                    break
+            elif not wait:
+                break
+            waited = time.monotonic() - started
+            if not is_background and waited + wait > self.max_wait:
+                self.rejected += 1
+                logger.warning("rate_limit_rejected", name=self.name, wait=round(wait, 3))
+                raise ServiceOverloaded(self.name, retry_after=max(1, math.ceil(wait)))
+            # Jitter so callers released together do not all retry at the same moment
+            await asyncio.sleep(wait * random.uniform(1.0, 1.0 + self.jitter))
+            slept = True
+
+        self.acquired += 1
+        self.acquired_background += is_background
+        if slept:
+            waited = time.monotonic() - started
+            self.waited += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    async def pause(self, seconds: float) -> None:
+        """Hand out no tokens, in any worker, for the next seconds"""
+        self.paused += 1
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        logger.warning("rate_limit_paused", name=self.name, seconds=round(seconds, 3))
+        await pause_rate_limit(self.name, seconds)
+
+    def stats(self) -> Dict[str, object]:
+        """Return token, wait and pause counters"""
+        return {
+            "buckets": [{"rate": rate, "capacity": capacity} for rate, capacity in self.buckets],
+            "acquired": self.acquired,
+            "acquired_background": self.acquired_background,
+            "waited": self.waited,
+            "wait_seconds_avg": (
+                round(self.wait_seconds_total / self.waited, 3) if self.waited else None
+            ),
+            "wait_seconds_max": round(self.wait_seconds_max, 3),
+            "rejected": self.rejected,
+            "paused": self.paused,
+            "unlimited": self.unlimited,
+        }
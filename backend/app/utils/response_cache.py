@@ -0,0 +1,76 @@
+"""Cached HTTP responses stored as their final JSON body"""
+
+import hashlib
+from typing import Any, Awaitable, Callable, Optional, Union
+
+import structlog
+from fastapi import Request, Response
+
+from app.utils.cache import Tags, get_cache, set_cache
+from app.utils.codec import json_dumps
+from app.utils.singleflight import SingleFlight
+
+logger = structlog.get_logger()
+
+# Bump when the way bodies are built changes, so old bodies are not served
+RESPONSE_CACHE_VERSION = 1
+
+_builds = SingleFlight()
+
+
+async def cached_response(
+    request: Request,
+    build: Callable[[], Awaitable[Any]],
+    ttl: Union[int, Callable[[], Awaitable[int]]],
+    tags: Optional[Tags] = None,
+) -> Response:
+    """Serve an endpoint's JSON body from the cache without decoding or re-encoding it.
+
+    The body is keyed by the request path and query string and stored as bytes together
+    with its ETag. A hit is returned as is, or as 304 when it matches If-None-Match. On a
+    miss ``build()`` returns the response content, which is encoded once and stored for
+    ``ttl`` seconds (or ``await ttl()``) under ``tags`` (or ``await tags()``), both
+    evaluated only on a miss.
+
+    The body duplicates the cached value ``build()`` usually reads; pass the same tags that
+    value has so an invalidation cannot leave a stale body behind.
+    """
+    query = "&".join(sorted(request.url.query.split("&"))) if request.url.query else ""
+    key = f"response:v{RESPONSE_CACHE_VERSION}:{request.url.path}?{query}"
+
+    entry = await get_cache(key)
+    if not isinstance(entry, bytes):
+        entry = await _builds.do(key, lambda: _build_entry(key, build, ttl, tags))
+
+    etag, _, body = entry.partition(b"\n")
+    etag_header = etag.decode()
+    if _etag_matches(request.headers.get("if-none-match"), etag_header):
+        return Response(status_code=304, headers={"ETag": etag_header})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag_header})
+
+
+async def _build_entry(
+    key: str,
+    build: Callable[[], Awaitable[Any]],
+    ttl: Union[int, Callable[[], Awaitable[int]]],
+    tags: Optional[Tags],
+) -> bytes:
+    """Build, encode and store a response body, returning the stored entry"""
+    body = json_dumps(await build())
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    entry = etag.encode() + b"\n" + body
+    seconds = ttl if isinstance(ttl, int) else await ttl()
+    if callable(tags):
+        tags = await tags()
+    await set_cache(key, entry, seconds, tags)
+    logger.info("response_cached", key=key, bytes=len(body), ttl=seconds)
+    return entry
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header (weak comparison) covers etag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
@@ -0,0 +1,137 @@
+"""In-process LRU cache for loaded FastF1 sessions"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+class SessionCache:
+    """Memory-bounded, per-process LRU of loaded session objects.
+
+    Each entry is stored together with its estimated size in bytes. Once either the byte
+    budget or the entry limit is exceeded, least-recently-used entries are evicted. A value
+    larger than the whole byte budget is never retained.
+
+    Aliases map request-level keys (e.g. ``(2024, "monza", "R")``) onto the canonical key so
+    a repeated request can be answered without resolving the event again. Aliases are
+    dropped together with the entry they point to.
+    """
+
+    def __init__(self, max_bytes: int, max_entries: int, sizeof: Callable[[Any], int]):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._sizeof = sizeof
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._aliases: Dict[Hashable, Hashable] = {}
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def resolve(self, alias: Hashable) -> Optional[Hashable]:
+        """Return the canonical key registered for an alias, if it is still cached"""
+        with self._lock:
+            return self._aliases.get(alias)
+
+    def add_alias(self, alias: Hashable, key: Hashable) -> None:
+        """Register an alias for a cached canonical key"""
+        with self._lock:
+            if key in self._entries:
+                self._aliases[alias] = key
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value and mark it as most recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value without touching recency or counters"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[0] if entry else None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Insert or replace a value, evicting older entries to stay within budget.
+
+        Replacing a key re-measures its size, e.g. after more data was loaded into it.
+        """
+        size = self._sizeof(value)
+        with self._lock:
+            self._remove(key)
+            if size > self.max_bytes:
+                logger.warning(
+                    "session_cache_entry_too_large", key=str(key), size=size, limit=self.max_bytes
+                )
+                return
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+            evicted = self._evict()
+        for evicted_key, evicted_size in evicted:
+            logger.info("session_cache_evict", key=str(evicted_key), size=evicted_size)
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Remove a value from the cache"""
+        with self._lock:
+            entry = self._entries.get(key)
+            self._remove(key)
+            return entry[0] if entry else None
+
+    def clear(self) -> None:
+        """Remove all values from the cache"""
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+                "evictions": self.evictions,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop an entry and its aliases. Caller must hold the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.current_bytes -= entry[1]
+        for alias in [a for a, k in self._aliases.items() if k == key]:
+            del self._aliases[alias]
+
+    def _evict(self) -> List[Tuple[Hashable, int]]:
+        """Evict LRU entries until within budget. Caller must hold the lock."""
+        evicted: List[Tuple[Hashable, int]] = []
+        while self._entries and (
+            self.current_bytes > self.max_bytes or len(self._entries) > self.max_entries
+        ):
+            key, (_, size) = next(iter(self._entries.items()))
+            self._remove(key)
+            self.evictions += 1
+            evicted.append((key, size))
+        return evicted
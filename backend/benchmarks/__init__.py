@@ -0,0 +1 @@
+"""Micro-benchmarks for hot backend code paths"""
@@ -0,0 +1,97 @@
+"""Benchmark cache value encodings for the heaviest FastF1 cache entries
+
+Compares the legacy ``json.dumps`` text entries with the header-tagged codecs from
+app.utils.codec: encode time, decode time and stored size (what Redis keeps in memory).
+Serializers and compressors that are not installed are skipped.
+
+Run from backend/:  python -m benchmarks.bench_cache_codec
+"""
+
+import json
+import timeit
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+from app.services.fastf1_transforms import build_replay_frames, laps_to_records
+from app.utils.codec import AVAILABLE, Codec
+from benchmarks.synthetic import DRIVERS, make_laps, make_pos_data
+
+CODECS = [
+    ("json", "none"),
+    ("json", "zlib"),
+    ("json", "zstd"),
+    ("json", "lz4"),
+    ("msgpack", "none"),
+    ("msgpack", "zstd"),
+    ("msgpack", "lz4"),
+]
+
+
+def _payloads() -> Dict[str, Any]:
+    laps = make_laps(num_drivers=20, num_laps=70)
+    pos_data = make_pos_data(laps)
+    num_to_code = {str(i + 1): code for i, code in enumerate(DRIVERS)}
+    frames = build_replay_frames(
+        laps, pos_data, num_to_code, x_min=-4000.0, y_min=-2500.0, scale=8000.0, total_laps=70
+    )
+
+    # One lap of full-rate car data in the columnar telemetry layout
+    rng = np.random.default_rng(0)
+    samples = 5000
+    telemetry = {
+        "distance": np.linspace(0, 5800, samples).round(3).tolist(),
+        "speed": rng.uniform(80, 330, samples).round(1).tolist(),
+        "throttle": rng.uniform(0, 100, samples).round(0).tolist(),
+        "brake": (rng.random(samples) < 0.2).tolist(),
+        "gear": rng.integers(1, 9, samples).tolist(),
+        "rpm": rng.uniform(8000, 12500, samples).round(0).tolist(),
+        "drs": rng.choice([0, 8, 12], samples).tolist(),
+    }
+    return {
+        "fastf1:laps": laps_to_records(laps),
+        "fastf1:lap_positions": {"total_laps": 70, "frames": frames},
+        "fastf1:telemetry (full rate)": {"format": "columnar", "telemetry": telemetry},
+    }
+
+
+def _time(fn: Callable[[], Any], runs: int = 20) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=runs))
+
+
+def _measure(
+    value: Any, encode: Callable[[Any], bytes], decode: Callable[[bytes], Any]
+) -> Tuple[int, float, float]:
+    data = encode(value)
+    assert decode(data) == value, "round trip changed the value"
+    return len(data), _time(lambda: encode(value)), _time(lambda: decode(data))
+
+
+def main() -> None:
+    for name, value in _payloads().items():
+        rows: List[Tuple[str, int, float, float]] = [
+            (
+                "legacy json text",
+                *_measure(value, lambda v: json.dumps(v).encode(), lambda d: json.loads(d)),
+            )
+        ]
+        for serializer, compression in CODECS:
+            if not (AVAILABLE.get(serializer, True) and AVAILABLE.get(compression, True)):
+                continue
+            codec = Codec(serializer, compression, min_compress_bytes=0)
+            label = f"{serializer}+{compression}"
+            rows.append((label, *_measure(value, codec.encode, codec.decode)))
+
+        legacy_size = rows[0][1]
+        print(f"{name}")
+        print(f"  {'codec':<18}{'bytes':>11}{'size':>8}{'encode ms':>12}{'decode ms':>12}")
+        for label, size, encode_s, decode_s in rows:
+            print(
+                f"  {label:<18}{size:>11}{size / legacy_size:>7.0%}"
+                f"{encode_s * 1000:>12.2f}{decode_s * 1000:>12.2f}"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Benchmark the replay frame builder used by FastF1Service.get_lap_positions
+
+Run from backend/:  python -m benchmarks.bench_lap_positions
+"""
+
+import timeit
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.services.fastf1_transforms import build_replay_frames
+from benchmarks.synthetic import DRIVERS, make_laps, make_pos_data
+
+X_MIN, Y_MIN, SCALE = -4000.0, -2500.0, 8000.0
+
+
+def _legacy_lookup(lap_row: Any, driver_pos_df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+    lap_start = lap_row.get("LapStartTime")
+    lap_time_val = lap_row.get("LapTime")
+    if pd.isna(lap_start):
+        return None
+    try:
+        mid_time = lap_start + lap_time_val / 2 if pd.notna(lap_time_val) else lap_start
+        valid_pos = driver_pos_df[driver_pos_df["SessionTime"].notna()]
+        if len(valid_pos) == 0:
+            return None
+        idx = int(valid_pos["SessionTime"].searchsorted(mid_time))
+        idx = min(idx, len(valid_pos) - 1)
+        row = valid_pos.iloc[idx]
+        x = float(row.get("X", float("nan")))
+        y = float(row.get("Y", float("nan")))
+        if not np.isfinite(x) or not np.isfinite(y):
+            return None
+        position_val = lap_row.get("Position")
+        compound_val = lap_row.get("Compound")
+        return {
+            "x": round((x - X_MIN) / SCALE * 1000, 1),
+            "y": round((y - Y_MIN) / SCALE * 1000, 1),
+            "position": int(position_val) if pd.notna(position_val) else None,
+            "compound": str(compound_val) if pd.notna(compound_val) else None,
+            "lap_time_s": float(lap_time_val.total_seconds()) if pd.notna(lap_time_val) else None,
+        }
+    except Exception:
+        return None
+
+
+def legacy_build_frames(
+    laps_df: pd.DataFrame, pos_data_by_num: Dict[str, Any], num_to_code: Dict[str, str]
+) -> List[Dict[str, Any]]:
+    """Previous per-lap, per-driver implementation, kept as the reference"""
+    frames = []
+    total_laps = int(laps_df["LapNumber"].max())
+    for lap_num in range(1, total_laps + 1):
+        lap_slice = laps_df[laps_df["LapNumber"] == lap_num]
+        drivers: Dict[str, Any] = {}
+        for _, lap_row in lap_slice.iterrows():
+            raw_num = lap_row.get("DriverNumber")
+            if pd.isna(raw_num):
+                continue
+            driver_num = str(int(raw_num))
+            code = num_to_code.get(driver_num, str(lap_row.get("Driver", driver_num)))
+            driver_pos_df = pos_data_by_num.get(driver_num)
+            if driver_pos_df is None or len(driver_pos_df) == 0:
+                continue
+            entry = _legacy_lookup(lap_row, driver_pos_df)
+            if entry is not None:
+                drivers[code] = entry
+        if drivers:
+            frames.append({"lap": lap_num, "drivers": drivers})
+    return frames
+
+
+def _max_coordinate_delta(a: List[Dict[str, Any]], b: List[Dict[str, Any]]) -> float:
+    """Assert both frame lists match and return the largest x/y difference"""
+    assert [f["lap"] for f in a] == [f["lap"] for f in b], "frame laps differ"
+    delta = 0.0
+    for fa, fb in zip(a, b):
+        assert list(fa["drivers"]) == list(fb["drivers"]), f"drivers differ on lap {fa['lap']}"
+        for code, ea in fa["drivers"].items():
+            eb = fb["drivers"][code]
+            assert {k: ea[k] for k in ("position", "compound", "lap_time_s")} == {
+                k: eb[k] for k in ("position", "compound", "lap_time_s")
+            }
+            delta = max(delta, abs(ea["x"] - eb["x"]), abs(ea["y"] - eb["y"]))
+    return delta
+
+
+def main() -> None:
+    laps = make_laps(num_drivers=20, num_laps=70)
+    pos_data = make_pos_data(laps)
+    num_to_code = {str(i + 1): code for i, code in enumerate(DRIVERS)}
+
+    def vectorized() -> List[Dict[str, Any]]:
+        return build_replay_frames(
+            laps, pos_data, num_to_code, x_min=X_MIN, y_min=Y_MIN, scale=SCALE, total_laps=70
+        )
+
+    # np.round and round() may break exact .x5 ties differently: allow one 0.1 step
+    delta = _max_coordinate_delta(vectorized(), legacy_build_frames(laps, pos_data, num_to_code))
+    assert delta <= 0.1 + 1e-9, f"coordinates differ by {delta}"
+
+    rows = sum(len(p) for p in pos_data.values())
+    legacy = min(
+        timeit.repeat(lambda: legacy_build_frames(laps, pos_data, num_to_code), number=1, repeat=3)
+    )
+    fast = min(timeit.repeat(vectorized, number=1, repeat=10))
+    print(f"replay: {len(laps)} laps, {rows} position rows")
+    print(f"  per-lap lookups: {legacy * 1000:9.2f} ms")
+    print(f"  vectorized:      {fast * 1000:9.2f} ms")
+    print(f"  speedup:         {legacy / fast:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark the lap-table conversion used by FastF1Service.get_lap_times
+
+Run from backend/:  python -m benchmarks.bench_lap_times
+"""
+
+import timeit
+
+import pandas as pd
+
+from app.services.fastf1_transforms import laps_to_records
+from benchmarks.synthetic import make_laps
+
+
+def legacy_laps_to_records(laps: pd.DataFrame) -> list:
+    """Previous row-by-row implementation, kept as the reference"""
+    laps_data = []
+    for _, lap in laps.iterrows():
+        laps_data.append(
+            {
+                "driver": lap.get("Driver"),
+                "lap_number": int(lap.get("LapNumber", 0)),
+                "lap_time": str(lap.get("LapTime")) if pd.notna(lap.get("LapTime")) else None,
+                "lap_time_seconds": (
+                    float(lap.get("LapTime").total_seconds())
+                    if pd.notna(lap.get("LapTime"))
+                    else None
+                ),
+                "sector1_time": (
+                    float(lap.get("Sector1Time").total_seconds())
+                    if pd.notna(lap.get("Sector1Time"))
+                    else None
+                ),
+                "sector2_time": (
+                    float(lap.get("Sector2Time").total_seconds())
+                    if pd.notna(lap.get("Sector2Time"))
+                    else None
+                ),
+                "sector3_time": (
+                    float(lap.get("Sector3Time").total_seconds())
+                    if pd.notna(lap.get("Sector3Time"))
+                    else None
+                ),
+                "compound": lap.get("Compound"),
+                "tyre_life": int(lap.get("TyreLife", 0)) if pd.notna(lap.get("TyreLife")) else None,
+                "stint": int(lap.get("Stint", 0)),
+                "is_personal_best": bool(lap.get("IsPersonalBest", False)),
+            }
+        )
+    return laps_data
+
+
+def main() -> None:
+    laps = make_laps(num_drivers=20, num_laps=70)
+    assert laps_to_records(laps) == legacy_laps_to_records(laps), "outputs differ"
+
+    runs = 10
+    legacy = min(timeit.repeat(lambda: legacy_laps_to_records(laps), number=1, repeat=runs))
+    vectorized = min(timeit.repeat(lambda: laps_to_records(laps), number=1, repeat=runs))
+    print(f"laps: {len(laps)} rows (20 drivers x 70 laps), best of {runs}")
+    print(f"  iterrows:   {legacy * 1000:8.2f} ms")
+    print(f"  vectorized: {vectorized * 1000:8.2f} ms")
+    print(f"  speedup:    {legacy / vectorized:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
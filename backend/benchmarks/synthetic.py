@@ -0,0 +1,88 @@
+"""Synthetic FastF1-shaped data for benchmarks"""
+
+import numpy as np
+import pandas as pd
+
+DRIVERS = [
+    "VER",
+    "PER",
+    "HAM",
+    "RUS",
+    "LEC",
+    "SAI",
+    "NOR",
+    "PIA",
+    "ALO",
+    "STR",
+    "GAS",
+    "OCO",
+    "ALB",
+    "SAR",
+    "TSU",
+    "RIC",
+    "BOT",
+    "ZHO",
+    "MAG",
+    "HUL",
+]
+
+
+def make_laps(num_drivers: int = 20, num_laps: int = 70, seed: int = 0) -> pd.DataFrame:
+    """Build a laps table with the columns and dtypes FastF1 produces for a race"""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for d, driver in enumerate(DRIVERS[:num_drivers]):
+        pit_laps = sorted(rng.choice(np.arange(15, num_laps - 10), size=2, replace=False))
+        stint, tyre_life = 1, 1
+        for lap in range(1, num_laps + 1):
+            if lap in pit_laps:
+                stint += 1
+                tyre_life = 1
+            sectors = rng.normal([28.0, 33.0, 31.0], 0.4)
+            rows.append(
+                {
+                    "Driver": driver,
+                    "DriverNumber": str(d + 1),
+                    "LapNumber": float(lap),
+                    "LapTime": pd.Timedelta(seconds=float(sectors.sum())),
+                    "Sector1Time": pd.Timedelta(seconds=float(sectors[0])),
+                    "Sector2Time": pd.Timedelta(seconds=float(sectors[1])),
+                    "Sector3Time": pd.Timedelta(seconds=float(sectors[2])),
+                    "Compound": ["SOFT", "MEDIUM", "HARD"][(stint - 1) % 3],
+                    "TyreLife": float(tyre_life),
+                    "Stint": float(stint),
+                    "IsPersonalBest": bool(rng.random() < 0.05),
+                    "Position": float(d + 1),
+                    "LapStartTime": pd.Timedelta(seconds=300 + 92.0 * (lap - 1)),
+                }
+            )
+            tyre_life += 1
+
+    laps = pd.DataFrame(rows)
+    # Real sessions have gaps: out-laps without a time, missing sectors, unknown tyres
+    missing = rng.random(len(laps)) < 0.03
+    laps.loc[missing, ["LapTime", "Sector1Time"]] = pd.NaT
+    laps.loc[rng.random(len(laps)) < 0.01, "TyreLife"] = np.nan
+    return laps
+
+
+def make_pos_data(laps: pd.DataFrame, hz: float = 4.0, seed: int = 0) -> dict:
+    """Build per-driver position telemetry (SessionTime, X, Y) covering the laps table"""
+    rng = np.random.default_rng(seed)
+    end = (laps["LapStartTime"].max() + pd.Timedelta(seconds=120)).total_seconds()
+    times = np.arange(0.0, end, 1.0 / hz)
+    pos_data = {}
+    for num in laps["DriverNumber"].unique():
+        angle = times / 92.0 * 2 * np.pi + rng.random()
+        frame = pd.DataFrame(
+            {
+                "SessionTime": pd.to_timedelta(times, unit="s"),
+                "X": 4000 * np.cos(angle),
+                "Y": 2500 * np.sin(angle),
+            }
+        )
+        # Dropped samples show up as NaT timestamps and NaN coordinates
+        frame.loc[rng.random(len(frame)) < 0.002, "SessionTime"] = pd.NaT
+        frame.loc[rng.random(len(frame)) < 0.002, ["X", "Y"]] = np.nan
+        pos_data[str(num)] = frame
+    return pos_data
@@ -162,6 +162,10 @@ export interface StintData {
   end_lap: number;
   num_laps: number;
   avg_lap_time: number | null;
+  median_lap_time?: number | null;
+  best_lap_time?: number | null;
+  tyre_life_start?: number | null;
+  tyre_life_end?: number | null;
 }
 
 // API Response types